@@ -0,0 +1,89 @@
+"""
+Performance Budgets
+Per-page limits checked by verify_*_loaded(budget=...) / is_home_page_loaded(budget=...)
+
+METRICS (measured after the load event):
+- dom_content_loaded: ms from navigation start
+- load: ms from navigation start
+- lcp: Largest Contentful Paint, ms (Chromium only, skipped elsewhere)
+- transfer_bytes: Document + subresources over the wire
+- requests: Document + subresources
+
+WHEN OVER BUDGET:
+- "fail": AssertionError (default, test suites)
+- "warn": PerformanceBudgetWarning (production smoke checks)
+  BUDGET_MODE=warn env var or pytest --budget-mode=warn
+  (any other BUDGET_MODE stops pytest with a usage error)
+"""
+import os
+
+BUDGET_MODES = ("fail", "warn")
+
+# Keyed by page object class name; async pages use their sync parent's entry
+PAGE_BUDGETS = {
+    "default": {
+        "dom_content_loaded": 3000,
+        "load": 6000,
+        "lcp": 4000,
+        "transfer_bytes": 3_000_000,
+        "requests": 100,
+    },
+    "HomePage": {
+        "dom_content_loaded": 2500,
+        "load": 5000,
+        "lcp": 3500,
+        "transfer_bytes": 2_500_000,
+        "requests": 80,
+    },
+    "ProductsPage": {
+        "dom_content_loaded": 3000,
+        "load": 6000,
+        "lcp": 4000,
+        "transfer_bytes": 3_000_000,
+        "requests": 100,
+    },
+    "CartPage": {
+        "dom_content_loaded": 2000,
+        "load": 4000,
+        "lcp": 3000,
+        "transfer_bytes": 1_500_000,
+        "requests": 60,
+    },
+    "LoginPage": {
+        "dom_content_loaded": 2000,
+        "load": 4000,
+        "lcp": 3000,
+        "transfer_bytes": 1_500_000,
+        "requests": 60,
+    },
+}
+
+_mode = os.environ.get("BUDGET_MODE", "fail")
+
+def get_budget_mode():
+    """'fail' or 'warn'"""
+    return _mode
+
+def set_budget_mode(mode):
+    """Called from conftest.py for --budget-mode"""
+    global _mode
+    if mode not in BUDGET_MODES:
+        raise ValueError(f"Unknown budget mode {mode!r}, expected one of {BUDGET_MODES}")
+    _mode = mode
+
+def get_page_budget(page_class, overrides=None):
+    """
+    Limits for a page object class
+
+    PARAMETERS:
+    - page_class: e.g. HomePage or AsyncHomePage (same entry: "HomePage")
+    - overrides: {metric: limit} replacing the configured ones
+      (None as a limit turns that metric off)
+    """
+    budget = PAGE_BUDGETS["default"]
+    for cls in page_class.__mro__:
+        name = cls.__name__.removeprefix("Async")
+        if name in PAGE_BUDGETS:
+            budget = PAGE_BUDGETS[name]
+            break
+    return {**budget, **(overrides or {})}
@@ -0,0 +1,240 @@
+"""
+Locale Registry
+SUPPORTED_LOCALES compiled once, at import, into immutable records
+with ready-made number, currency and date formatters/parsers
+
+WHY THIS EXISTS:
+- get_locale_config() returns a plain dict; every check rebuilt its
+  regex from decimal_separator/thousands_separator/date_format
+- Validating a whole catalog across locales repeated that work per string
+
+USAGE:
+from config.locale_registry import get_locale
+
+de = get_locale("de-DE")
+de.format_currency(1234.5)                  # "1.234,50 €"
+de.parse_currency("1.234,50 €")             # Decimal("1234.50")
+de.format_date(date(2024, 1, 31))           # "31.01.2024"
+
+# Thousands of scraped strings, one call
+report = de.validate_prices(scraped_prices)
+assert report.ok, report.invalid[:5]
+
+# What the site itself prints ("Rs. 500"), for any visitor
+SITE_FORMAT.validate_prices(products_page.snapshot_catalog()["price"])
+"""
+import re
+from datetime import date
+from decimal import Decimal
+from types import MappingProxyType
+
+from config.locales import SITE_DISPLAY_FORMAT, SUPPORTED_LOCALES
+
+# ISO 4217 minor units; everything else has 2 decimals
+CURRENCY_DECIMALS = {"JPY": 0}
+
+# Browsers print a space separator as NBSP or narrow NBSP (fr-FR: "1 234,56")
+SPACES = " \u00a0\u202f"
+
+# Day and month: 1 or 2 digits - toLocaleDateString() prints "1/31/2024"
+# (en-US) and "31.1.2024" (de-DE); format_date always pads
+DATE_FIELDS = {"DD": ("day", r"\d{1,2}", "%d"), "MM": ("month", r"\d{1,2}", "%m"), "YYYY": ("year", r"\d{4}", "%Y")}
+
+
+class ValidationReport:
+    """Result of a bulk validation: parsed values and what didn't parse"""
+
+    __slots__ = ("values", "invalid")
+
+    def __init__(self, values, invalid):
+        self.values = values      # Parsed value per input (None when invalid)
+        self.invalid = invalid    # [(index, text)] of rejected strings
+
+    @property
+    def ok(self):
+        return not self.invalid
+
+    def __repr__(self):
+        return f"ValidationReport({len(self.values)} checked, {len(self.invalid)} invalid)"
+
+
+def _separator_pattern(separator):
+    """Regex for a separator; any kind of space matches a space"""
+    if separator in SPACES:
+        return f"[{SPACES}]"
+    return re.escape(separator)
+
+
+def _number_pattern(decimal_separator, thousands_separator, decimals):
+    """
+    Grouped or ungrouped number, e.g. en-US: 1,234.56 or 1234.56
+
+    decimals=None: any number of decimals (or none); else exactly that many
+    """
+    group = _separator_pattern(thousands_separator)
+    integer = rf"(?:\d{{1,3}}(?:{group}\d{{3}})+|\d+)"
+    if decimals == 0:
+        fraction = ""
+    elif decimals is None:
+        fraction = rf"(?:{re.escape(decimal_separator)}\d+)?"
+    else:
+        fraction = rf"{re.escape(decimal_separator)}\d{{{decimals}}}"
+    return rf"-?{integer}{fraction}"
+
+
+def _compile_date(date_format):
+    """
+    "DD.MM.YYYY" -> (regex with day/month/year groups, strftime format)
+    """
+    pattern, strftime = "", ""
+    for token in re.findall(r"YYYY|MM|DD|.", date_format):
+        if token in DATE_FIELDS:
+            name, regex, directive = DATE_FIELDS[token]
+            pattern += f"(?P<{name}>{regex})"
+            strftime += directive
+        else:
+            pattern += re.escape(token)
+            strftime += token.replace("%", "%%")
+    return re.compile(pattern), strftime
+
+
+class LocaleRecord:
+    """
+    One supported locale, immutable, with precompiled formatters/parsers
+
+    FIELDS: Same as SUPPORTED_LOCALES (code, name, timezone, currency,
+    currency_symbol, currency_position, date_format, decimal_separator,
+    thousands_separator, rtl)
+    """
+
+    __slots__ = (
+        "code", "name", "timezone", "currency", "currency_symbol", "currency_position",
+        "currency_decimals", "date_format", "decimal_separator", "thousands_separator", "rtl",
+        "_number_re", "_price_re", "_date_re", "_strftime", "_to_locale", "_from_locale",
+    )
+
+    def __init__(self, config):
+        fields = {
+            "code": config["locale"],
+            "name": config["name"],
+            "timezone": config["timezone"],
+            "currency": config["currency"],
+            "currency_symbol": config["currency_symbol"],
+            "currency_position": config.get("currency_position", "prefix"),
+            "currency_decimals": config.get("currency_decimals", CURRENCY_DECIMALS.get(config["currency"], 2)),
+            "date_format": config["date_format"],
+            "decimal_separator": config["decimal_separator"],
+            "thousands_separator": config["thousands_separator"],
+            "rtl": config.get("rtl", False),
+        }
+        decimal, thousands = fields["decimal_separator"], fields["thousands_separator"]
+        amount = _number_pattern(decimal, thousands, fields["currency_decimals"])
+        symbol = re.escape(fields["currency_symbol"])
+        gap = f"[{SPACES}]?"
+        price = f"{symbol}{gap}{amount}" if fields["currency_position"] == "prefix" else f"{amount}{gap}{symbol}"
+        date_re, strftime = _compile_date(fields["date_format"])
+        fields.update(
+            _number_re=re.compile(_number_pattern(decimal, thousands, None)),
+            _price_re=re.compile(price),
+            _date_re=date_re,
+            _strftime=strftime,
+            # Python formats as 1,234.56; swap in the locale's separators in one pass
+            _to_locale=str.maketrans({",": thousands, ".": decimal}),
+            # ...and back: drop grouping (any space kind), "." as decimal point
+            _from_locale=str.maketrans({
+                **{char: None for char in (SPACES if thousands in SPACES else thousands)},
+                decimal: ".",
+            }),
+        )
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"LocaleRecord is immutable; can't set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"LocaleRecord is immutable; can't delete {name!r}")
+
+    def __repr__(self):
+        return f"LocaleRecord({self.code!r})"
+
+    # ============ NUMBERS ============
+
+    def format_number(self, value, decimals=2):
+        """1234.5 -> "1.234,50" (de-DE)"""
+        return f"{value:,.{decimals}f}".translate(self._to_locale)
+
+    def parse_number(self, text):
+        """ "1.234,50" -> Decimal("1234.50") (de-DE); ValueError if not this locale's format"""
+        text = text.strip()
+        if not self._number_re.fullmatch(text):
+            raise ValueError(f"{text!r} is not a {self.code} number")
+        return Decimal(text.translate(self._from_locale))
+
+    # ============ CURRENCY ============
+
+    def format_currency(self, amount):
+        """1234.5 -> "1.234,50 €" (de-DE), "¥1,235" (ja-JP)"""
+        number = self.format_number(amount, self.currency_decimals)
+        if self.currency_position == "prefix":
+            return f"{self.currency_symbol}{number}"
+        return f"{number} {self.currency_symbol}"
+
+    def parse_currency(self, text):
+        """ "1.234,50 €" -> Decimal("1234.50") (de-DE); ValueError if not this locale's format"""
+        text = text.strip()
+        if not self._price_re.fullmatch(text):
+            raise ValueError(f"{text!r} is not a {self.code} price")
+        number = text.replace(self.currency_symbol, "").strip(SPACES)
+        return Decimal(number.translate(self._from_locale))
+
+    # ============ DATES ============
+
+    def format_date(self, value):
+        """date(2024, 1, 31) -> "31.01.2024" (de-DE)"""
+        return value.strftime(self._strftime)
+
+    def parse_date(self, text):
+        """ "31.01.2024" -> date(2024, 1, 31) (de-DE); ValueError if wrong format or no such day"""
+        match = self._date_re.fullmatch(text.strip())
+        if not match:
+            raise ValueError(f"{text!r} is not a {self.code} date ({self.date_format})")
+        return date(int(match["year"]), int(match["month"]), int(match["day"]))
+
+    # ============ BULK VALIDATION ============
+
+    def validate_prices(self, texts):
+        """Parse every scraped price; see ValidationReport"""
+        return self._validate(texts, self.parse_currency)
+
+    def validate_numbers(self, texts):
+        """Parse every scraped number; see ValidationReport"""
+        return self._validate(texts, self.parse_number)
+
+    def validate_dates(self, texts):
+        """Parse every scraped date; see ValidationReport"""
+        return self._validate(texts, self.parse_date)
+
+    @staticmethod
+    def _validate(texts, parse):
+        values, invalid = [], []
+        for index, text in enumerate(texts):
+            try:
+                values.append(parse(text))
+            except (ValueError, ArithmeticError):
+                values.append(None)
+                invalid.append((index, text))
+        return ValidationReport(values, invalid)
+
+
+# Built once, at import
+LOCALE_REGISTRY = MappingProxyType({
+    code: LocaleRecord(config) for code, config in SUPPORTED_LOCALES.items()
+})
+
+# Prices/dates as automationexercise.com shows them (config/locales.py)
+SITE_FORMAT = LocaleRecord(SITE_DISPLAY_FORMAT)
+
+def get_locale(locale_code):
+    """Compiled record for a locale (falls back to en-US, like get_locale_config)"""
+    return LOCALE_REGISTRY.get(locale_code, LOCALE_REGISTRY["en-US"])
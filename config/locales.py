@@ -1,6 +1,10 @@
 """
 Internationalization Configuration
 Defines supported locales and their settings
+
+currency_position: "prefix" ($1,234.56) or "suffix" (1.234,56 €)
+currency_decimals (optional): overrides the currency's ISO minor units
+Compiled formatters/parsers per locale: config/locale_registry.py
 """
 
 SUPPORTED_LOCALES = {
@@ -10,6 +14,7 @@ SUPPORTED_LOCALES = {
         "timezone": "America/New_York",
         "currency": "USD",
         "currency_symbol": "$",
+        "currency_position": "prefix",
         "date_format": "MM/DD/YYYY",
         "decimal_separator": ".",
         "thousands_separator": ","
@@ -20,6 +25,7 @@ SUPPORTED_LOCALES = {
         "timezone": "Europe/London",
         "currency": "GBP",
         "currency_symbol": "£",
+        "currency_position": "prefix",
         "date_format": "DD/MM/YYYY",
         "decimal_separator": ".",
         "thousands_separator": ","
@@ -30,6 +36,7 @@ SUPPORTED_LOCALES = {
         "timezone": "Europe/Paris",
         "currency": "EUR",
         "currency_symbol": "€",
+        "currency_position": "suffix",
         "date_format": "DD/MM/YYYY",
         "decimal_separator": ",",
         "thousands_separator": " "
@@ -40,6 +47,7 @@ SUPPORTED_LOCALES = {
         "timezone": "Europe/Berlin",
         "currency": "EUR",
         "currency_symbol": "€",
+        "currency_position": "suffix",
         "date_format": "DD.MM.YYYY",
         "decimal_separator": ",",
         "thousands_separator": "."
@@ -50,6 +58,7 @@ SUPPORTED_LOCALES = {
         "timezone": "Asia/Tokyo",
         "currency": "JPY",
         "currency_symbol": "¥",
+        "currency_position": "prefix",
         "date_format": "YYYY/MM/DD",
         "decimal_separator": ".",
         "thousands_separator": ","
@@ -60,6 +69,7 @@ SUPPORTED_LOCALES = {
         "timezone": "Europe/Madrid",
         "currency": "EUR",
         "currency_symbol": "€",
+        "currency_position": "suffix",
         "date_format": "DD/MM/YYYY",
         "decimal_separator": ",",
         "thousands_separator": "."
@@ -70,6 +80,7 @@ SUPPORTED_LOCALES = {
         "timezone": "Asia/Shanghai",
         "currency": "CNY",
         "currency_symbol": "¥",
+        "currency_position": "prefix",
         "date_format": "YYYY-MM-DD",
         "decimal_separator": ".",
         "thousands_separator": ","
@@ -80,6 +91,7 @@ SUPPORTED_LOCALES = {
         "timezone": "Asia/Riyadh",
         "currency": "SAR",
         "currency_symbol": "﷼",
+        "currency_position": "suffix",
         "date_format": "DD/MM/YYYY",
         "decimal_separator": ".",
         "thousands_separator": ",",
@@ -87,10 +99,34 @@ SUPPORTED_LOCALES = {
     }
 }
 
+# How automationexercise.com prints prices and dates for EVERY visitor,
+# whatever the browser locale: whole Indian rupees ("Rs. 500").
+# Not a locale we test in; what scraped page content must parse as
+SITE_DISPLAY_FORMAT = {
+    "name": "automationexercise.com",
+    "locale": "en-IN",
+    "timezone": "Asia/Kolkata",
+    "currency": "INR",
+    "currency_symbol": "Rs.",
+    "currency_position": "prefix",
+    "currency_decimals": 0,
+    "date_format": "DD/MM/YYYY",
+    "decimal_separator": ".",
+    "thousands_separator": ","
+}
+
 def get_locale_config(locale_code):
     """Get configuration for specific locale"""
     return SUPPORTED_LOCALES.get(locale_code, SUPPORTED_LOCALES["en-US"])
 
 def get_all_locales():
     """Get list of all supported locale codes"""
-    return list(SUPPORTED_LOCALES.keys())
\ No newline at end of file
+    return list(SUPPORTED_LOCALES.keys())
+
+def get_context_args(locale_code):
+    """Browser context args (locale + timezone) for a locale"""
+    config = get_locale_config(locale_code)
+    return {
+        "locale": config["locale"],
+        "timezone_id": config["timezone"]
+    }
@@ -0,0 +1,91 @@
+"""
+Execution Profiles
+One name for how a run behaves: headedness, slowmo, artifacts, timeouts, workers
+
+CHOOSE ONE:
+pytest --profile=ci
+TEST_PROFILE=perf pytest
+
+Explicit flags still win: pytest --profile=ci --headed
+"""
+
+DEFAULT_PROFILE = "debug"
+
+PROFILES = {
+    "debug": {
+        # Same as the old pytest.ini addopts; add --tracing=retain-on-failure if needed
+        "description": "Watch it run: headed, slowed down, screenshot/video on failure",
+        "headed": True,
+        "slowmo": 500,
+        "screenshot": "only-on-failure",
+        "video": "retain-on-failure",
+        "tracing": "off",
+        "timeout_ms": 30000,
+        "expect_timeout_ms": 5000,
+        "workers": None,
+        "artifact_pipeline": False,
+    },
+    "ci": {
+        "description": "Headless, parallel, artifacts only for failures",
+        "headed": False,
+        "slowmo": 0,
+        "screenshot": "only-on-failure",
+        "video": "retain-on-failure",
+        "tracing": "retain-on-failure",
+        "timeout_ms": 15000,
+        "expect_timeout_ms": 5000,
+        "workers": "auto",
+        "artifact_pipeline": True,
+    },
+    "perf": {
+        # Serial, so measured timings don't compete with other workers
+        "description": "Benchmarks: headless, no artifacts, tight timeouts, one worker",
+        "headed": False,
+        "slowmo": 0,
+        "screenshot": "off",
+        "video": "off",
+        "tracing": "off",
+        "timeout_ms": 10000,
+        "expect_timeout_ms": 3000,
+        "workers": None,
+        "artifact_pipeline": False,
+    },
+    "load": {
+        "description": "Many workers against a busy server: no artifacts, patient timeouts",
+        "headed": False,
+        "slowmo": 0,
+        "screenshot": "off",
+        "video": "off",
+        "tracing": "off",
+        "timeout_ms": 60000,
+        "expect_timeout_ms": 15000,
+        "workers": "auto",
+        "artifact_pipeline": False,
+    },
+}
+
+def get_profile(name):
+    """Settings of a named profile"""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown profile {name!r}, expected one of {sorted(PROFILES)}")
+    return PROFILES[name]
+
+_active = DEFAULT_PROFILE
+
+def get_active_profile():
+    """Name of the profile this run uses"""
+    return _active
+
+def set_active_profile(name):
+    """Called by plugins/profiles.py once --profile/TEST_PROFILE is known"""
+    global _active
+    get_profile(name)
+    _active = name
+
+def apply_timeouts(page):
+    """Give a page the active profile's action/navigation timeout"""
+    page.set_default_timeout(get_profile(_active)["timeout_ms"])
+
+def get_expect_timeout():
+    """Active profile's assertion timeout (ms), e.g. for BasePage.check_all(timeout=...)"""
+    return get_profile(_active)["expect_timeout_ms"]
@@ -0,0 +1,24 @@
+"""
+Runtime Settings
+Single place for values shared by page objects and fixtures
+"""
+import os
+
+LIVE_BASE_URL = "https://www.automationexercise.com"
+
+# BASE_URL env var wins so page objects work outside pytest too
+_base_url = os.environ.get("BASE_URL", LIVE_BASE_URL).rstrip("/")
+
+def get_base_url():
+    """Get the site URL every page object and assertion builds on"""
+    return _base_url
+
+def set_base_url(url):
+    """
+    Point all page objects at another site
+
+    USED BY: base_url fixture (conftest.py) once the
+    local stand-in server is up
+    """
+    global _base_url
+    _base_url = url.rstrip("/")
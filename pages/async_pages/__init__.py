@@ -0,0 +1,7 @@
+"""
+Async Page Objects
+Same locators as pages/, with actions built on playwright.async_api
+
+USAGE:
+from pages.async_pages.home_page import AsyncHomePage
+"""
@@ -0,0 +1,85 @@
+"""
+Async Base Page: Parent class for all async pages
+Shares PageCore (page, base_url, blocking, budgets) with BasePage; every browser call is awaited
+"""
+from contextlib import asynccontextmanager
+from pages.base_page import PageCore
+from pages.dom_watch import SETTLED_JS, WATCH_JS, next_token
+from pages.drivers import AsyncBrowserDriver
+from pages.instrumentation import action
+from utils.resource_blocking import apply_profile_async
+
+class AsyncBasePage(PageCore):
+    """
+    WHY THIS EXISTS:
+    - Many contexts driven from one event loop (see utils/locale_fanout.py)
+    - Locators come from the same *Locators mixins as the sync page
+      objects, so selectors still live in ONE place
+    
+    NOT INHERITED: BasePage's sync calls, which would hand back
+    un-awaited coroutines on an async Page. The same methods
+    (check_all, check_budget, get_current_url...) are defined
+    here again, awaitable, through an AsyncBrowserDriver
+    
+    NOTE: HAR record/replay (pytest --network) is sync-only;
+    resource blocking profiles apply here too
+    """
+    
+    def __init__(self, page):
+        super().__init__(page)
+        self.driver = AsyncBrowserDriver(page)
+    
+    def expect(self, target):
+        """
+        Assertions on self.page or one of its locators
+        
+        USAGE: await self.expect(self.page).to_have_url(f"{self.base_url}/login")
+        """
+        return self.driver.expect(target)
+    
+    @action
+    async def navigate(self, path=""):
+        """Navigate to any path on the website"""
+        url = f"{self.base_url}{path}"
+        await apply_profile_async(self.page, self.BLOCKED_RESOURCE_TYPES, self.BLOCKED_HOSTS)
+        await self.page.goto(url)
+        print(f"📍 Navigated to: {url}")
+    
+    async def get_page_title(self):
+        """Returns current page title"""
+        return await self.page.title()
+    
+    async def get_current_url(self):
+        """Returns current URL"""
+        return self.page.url
+    
+    async def check_all(self, *checks, timeout=0):
+        """Evaluate many Check expectations in ONE browser call (see BasePage.check_all)"""
+        specs = [check.to_js() for check in checks]
+        self._raise_for_failed_checks(checks, await self.driver.run_checks(specs, timeout))
+    
+    # ============ PERFORMANCE BUDGET ============
+    
+    async def check_budget(self, budget=True):
+        """Compare the loaded page's browser metrics with its budget"""
+        limits = self._budget_limits(budget)
+        metrics = await self.driver.budget_metrics()
+        self._report_budget(metrics, limits)
+        return metrics
+    
+    # ============ WAITS ============
+    
+    @asynccontextmanager
+    async def expect_dom_change(self, selector="body", quiet_ms=50, timeout=None):
+        """Wait until the action inside changed the DOM under selector"""
+        token = next_token()
+        await self.page.evaluate(WATCH_JS, [selector, token])
+        yield
+        await self.page.wait_for_function(SETTLED_JS, arg=[token, quiet_ms, True], timeout=timeout)
+    
+    async def wait_for_settled(self, selector="body", quiet_ms=100, timeout=None):
+        """Wait until the DOM under selector stops changing for quiet_ms"""
+        token = next_token()
+        await self.page.evaluate(WATCH_JS, [selector, token])
+        await self.page.wait_for_function(SETTLED_JS, arg=[token, quiet_ms, False], timeout=timeout)
+        print(f"⏳ DOM settled: {selector}")
\ No newline at end of file
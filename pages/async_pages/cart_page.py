@@ -0,0 +1,63 @@
+"""
+Async Cart Page Object
+Locators: CartLocators from pages/cart_page.py
+"""
+from pages.async_pages.base_page import AsyncBasePage
+from pages.cart_page import CartLocators
+from pages.instrumentation import action
+
+class AsyncCartPage(CartLocators, AsyncBasePage):
+    
+    # ============ ACTIONS ============
+    
+    @action
+    async def navigate_to_cart(self):
+        """Go to cart page"""
+        await self.navigate("/view_cart")
+    
+    @action
+    async def seed(self, items, open_cart=True):
+        """Put products in the cart through page.request (see CartPage.seed)"""
+        for product_id in items:
+            response = await self.page.request.get(f"{self.base_url}/add_to_cart/{product_id}")
+            if not response.ok:
+                raise RuntimeError(
+                    f"Seeding cart failed: /add_to_cart/{product_id} returned {response.status}"
+                )
+        print(f"🌱 Seeded cart with: {list(items)}")
+        if open_cart:
+            await self.navigate_to_cart()
+    
+    @action
+    async def remove_product(self, product_id):
+        """Remove product from cart"""
+        print(f"🗑️ Removing product: {product_id}")
+        async with self.expect_dom_change("#cart_info tbody"):
+            await self.delete_button(product_id).click()
+    
+    @action
+    async def proceed_to_checkout(self):
+        """Click checkout button"""
+        print("💳 Proceeding to checkout")
+        await self.proceed_to_checkout_button.click()
+    
+    # ============ VERIFICATIONS ============
+    
+    async def verify_cart_page_loaded(self, budget=None):
+        """Verify cart page loaded (budget: see BasePage.check_budget)"""
+        await self.expect(self.page).to_have_url(f"{self.base_url}/view_cart")
+        if budget:
+            await self.check_budget(budget)
+        print("✅ Cart page verified")
+    
+    async def get_cart_item_count(self):
+        """Count items in cart"""
+        count = await self.cart_items.count()
+        print(f"🛒 Cart items: {count}")
+        return count
+    
+    async def is_cart_empty(self):
+        """Check if cart is empty"""
+        is_empty = await self.empty_cart_message.is_visible()
+        print(f"🛒 Cart empty: {is_empty}")
+        return is_empty
@@ -0,0 +1,39 @@
+"""
+Async Home Page Object
+Locators: HomeLocators from pages/home_page.py
+"""
+from pages.async_pages.base_page import AsyncBasePage
+from pages.home_page import HomeLocators
+from pages.instrumentation import action
+
+class AsyncHomePage(HomeLocators, AsyncBasePage):
+    
+    # ============ ACTIONS ============
+    
+    @action
+    async def navigate_to_home(self):
+        """Go to homepage"""
+        await self.navigate("/")
+    
+    @action
+    async def click_products(self):
+        """Navigate to Products page"""
+        await self.products_link.click()
+        print("🖱️ Clicked Products link")
+    
+    @action
+    async def click_login(self):
+        """Navigate to Login page"""
+        await self.login_link.click()
+        print("🖱️ Clicked Login link")
+    
+    async def is_home_page_loaded(self, budget=None):
+        """
+        Verify home page loaded correctly
+        RETURNS: True if slider visible (budget: see BasePage.check_budget)
+        """
+        is_visible = await self.home_slider.is_visible()
+        if budget:
+            await self.check_budget(budget)
+        print(f"🏠 Home page loaded: {is_visible}")
+        return is_visible
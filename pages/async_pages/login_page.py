@@ -0,0 +1,49 @@
+"""
+Async Login Page Object
+Locators: LoginLocators from pages/login_page.py
+"""
+from pages.async_pages.base_page import AsyncBasePage
+from pages.instrumentation import action
+from pages.login_page import LoginLocators
+
+class AsyncLoginPage(LoginLocators, AsyncBasePage):
+    
+    # ============ ACTIONS ============
+    
+    @action
+    async def navigate_to_login(self):
+        """Go to login page"""
+        await self.navigate("/login")
+    
+    @action
+    async def perform_login(self, email, password):
+        """Fill and submit the login form"""
+        print(f"🔐 Logging in with: {email}")
+        await self.login_email.fill(email)
+        await self.login_password.fill(password)
+        await self.login_button.click()
+        print("✅ Login form submitted")
+    
+    @action
+    async def perform_signup(self, name, email):
+        """Fill and submit the signup form"""
+        print(f"📝 Signing up with: {name} ({email})")
+        await self.signup_name.fill(name)
+        await self.signup_email.fill(email)
+        await self.signup_button.click()
+        print("✅ Signup form submitted")
+    
+    # ============ VERIFICATIONS ============
+    
+    async def verify_login_page_loaded(self, budget=None):
+        """Verify we're on login page (budget: see BasePage.check_budget)"""
+        await self.expect(self.page).to_have_url(f"{self.base_url}/login")
+        await self.expect(self.login_button).to_be_visible()
+        if budget:
+            await self.check_budget(budget)
+        print("✅ Login page verified")
+    
+    async def verify_logged_in(self):
+        """Verify login succeeded (header shows the user)"""
+        await self.expect(self.logged_in_as).to_be_visible()
+        print("✅ Logged in verified")
@@ -0,0 +1,59 @@
+"""
+Async Products Page Object
+Locators: ProductsLocators from pages/products_page.py
+"""
+from pages.async_pages.base_page import AsyncBasePage
+from pages.instrumentation import action
+from pages.products_page import CATALOG_JS, ProductCatalog, ProductsLocators
+
+class AsyncProductsPage(ProductsLocators, AsyncBasePage):
+    
+    # ============ ACTIONS ============
+    
+    @action
+    async def navigate_to_products(self):
+        """Go to products page"""
+        await self.navigate("/products")
+    
+    @action
+    async def search_product(self, product_name):
+        """Search for a product"""
+        print(f"🔍 Searching for: {product_name}")
+        await self.search_box.fill(product_name)
+        await self.search_button.click()
+    
+    @action
+    async def add_first_product_to_cart(self):
+        """Add first product to cart"""
+        print("🛒 Adding first product to cart")
+        await self.add_to_cart_button(1).click()
+        await self.continue_shopping_button.click()
+    
+    @action
+    async def add_product_and_view_cart(self, product_number=1):
+        """Add product and navigate to cart"""
+        print(f"🛒 Adding product {product_number} and viewing cart")
+        await self.add_to_cart_button(product_number).click()
+        await self.view_cart_button.click()
+    
+    # ============ VERIFICATIONS ============
+    
+    async def verify_products_page_loaded(self, budget=None):
+        """Verify products page loaded (budget: see BasePage.check_budget)"""
+        await self.expect(self.page).to_have_url(f"{self.base_url}/products")
+        await self.expect(self.all_products.first).to_be_visible()
+        if budget:
+            await self.check_budget(budget)
+        print("✅ Products page verified")
+    
+    async def snapshot_catalog(self):
+        """Read every product card in one browser call"""
+        catalog = ProductCatalog(await self.page.evaluate(CATALOG_JS, ".productinfo"))
+        print(f"📦 Catalog snapshot: {len(catalog)} products")
+        return catalog
+    
+    async def get_product_count(self):
+        """Count visible products"""
+        count = await self.all_products.count()
+        print(f"📦 Products found: {count}")
+        return count
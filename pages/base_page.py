@@ -2,15 +2,31 @@
 Base Page: Parent class for all pages
 Contains common functionality used across all pages
 """
+import warnings
+from contextlib import contextmanager
+from config.budgets import get_budget_mode, get_page_budget
+from config.settings import get_base_url
+from pages.dom_watch import SETTLED_JS, WATCH_JS, next_token
+from pages.drivers import driver_for
+from pages.instrumentation import action
+from pages.timing import PerformanceBudgetWarning, budget_violations
+from utils.network import get_active_router
+from utils.resource_blocking import AD_HOSTS, ANALYTICS_HOSTS, apply_profile
 
-class BasePage:
+class PageCore:
     """
-    WHY THIS EXISTS:
-    - Avoid code duplication
-    - Common methods available to all pages
-    - Single place to update navigation logic
+    What sync (BasePage) and async (AsyncBasePage) page objects share
+    
+    NO BROWSER CALLS HERE: Anything that talks to the page lives in
+    BasePage or AsyncBasePage, so neither inherits the other's calls
     """
     
+    # ============ RESOURCE BLOCKING ============
+    # What this page never needs; child pages override.
+    # Applied by navigate() before goto (see utils/resource_blocking.py)
+    BLOCKED_RESOURCE_TYPES = ("media",)
+    BLOCKED_HOSTS = AD_HOSTS + ANALYTICS_HOSTS
+    
     def __init__(self, page):
         """
         PARAMETERS:
@@ -18,10 +34,74 @@ class BasePage:
         
         STORES:
         - self.page: So all child classes can use it
+        - self.base_url: From config/settings.py (local stand-in or live site)
         """
         self.page = page
-        self.base_url = "https://www.automationexercise.com"
+        self.base_url = get_base_url()
+    
+    def _budget_limits(self, budget):
+        return get_page_budget(type(self), None if budget is True else budget)
     
+    def _report_budget(self, metrics, limits):
+        """Shared by the sync and async check_budget"""
+        if metrics is None:
+            print("⏱️ Budget skipped: no browser metrics in --protocol=http")
+            return
+        violations = budget_violations(metrics, limits)
+        if not violations:
+            print(f"⏱️ {type(self).__name__} within budget: {metrics}")
+            return
+        message = (
+            f"{type(self).__name__} over performance budget on {self.page.url}:\n"
+            + "\n".join(f"  - {violation}" for violation in violations)
+        )
+        if get_budget_mode() == "warn":
+            warnings.warn(message, PerformanceBudgetWarning, stacklevel=3)
+        else:
+            raise AssertionError(message)
+    
+    def _raise_for_failed_checks(self, checks, results):
+        failures = [
+            f"  - {check}: {message}"
+            for check, messages in zip(checks, results)
+            for message in messages
+        ]
+        if failures:
+            raise AssertionError(
+                f"{len(failures)} of {len(checks)} checks failed on {self.page.url}:\n"
+                + "\n".join(failures)
+            )
+        print(f"✅ {len(checks)} checks passed")
+
+class BasePage(PageCore):
+    """
+    WHY THIS EXISTS:
+    - Avoid code duplication
+    - Common methods available to all pages
+    - Single place to update navigation logic
+    
+    LOCATORS: Each page keeps them in a *Locators mixin (e.g.
+    HomeLocators), listed BEFORE BasePage so its BLOCKED_* win;
+    the async page objects share the same mixins
+    
+    DRIVER: Assertions, batched checks and budget metrics go through
+    self.driver - Playwright for browser pages, HttpDriver for
+    HttpPage (see pages/drivers.py) - so page objects work on both
+    """
+    
+    def __init__(self, page):
+        super().__init__(page)
+        self.driver = driver_for(page)
+    
+    def expect(self, target):
+        """
+        Assertions on self.page or one of its locators
+        
+        USAGE: self.expect(self.page).to_have_url(f"{self.base_url}/login")
+        """
+        return self.driver.expect(target)
+    
+    @action
     def navigate(self, path=""):
         """
         Navigate to any path on the website
@@ -29,9 +109,25 @@ class BasePage:
         EXAMPLE:
         - navigate() -> goes to home
         - navigate("/login") -> goes to login page
+        
+        BLOCKS: BLOCKED_RESOURCE_TYPES / BLOCKED_HOSTS of this class
+        
+        RECORD/REPLAY (pytest --network=record|replay):
+        - Routes the page's traffic through the test's HAR archive
+          (one per page, shared by every page object on it)
+        - Replay raises UnrecordedRequestError on unknown requests
         """
         url = f"{self.base_url}{path}"
-        self.page.goto(url)
+        router = get_active_router()
+        if router:
+            router.install(self.page)
+        # After HAR routes, so replay never sees blocked requests as missing
+        apply_profile(self.page, self.BLOCKED_RESOURCE_TYPES, self.BLOCKED_HOSTS)
+        try:
+            self.page.goto(url)
+        finally:
+            if router:
+                router.raise_for_misses()
         print(f"📍 Navigated to: {url}")
     
     def get_page_title(self):
@@ -40,4 +136,78 @@ class BasePage:
     
     def get_current_url(self):
         """Returns current URL"""
-        return self.page.url
\ No newline at end of file
+        return self.page.url
+    
+    def check_all(self, *checks, timeout=0):
+        """
+        Evaluate many Check expectations in ONE browser call
+        
+        PARAMETERS:
+        - checks: Check objects built from the CSS/XPath selectors
+          this page declares (see pages/checks.py)
+        - timeout: ms to wait for all checks to pass (0 = check once;
+          config.profiles.get_expect_timeout() = the profile's)
+        
+        RAISES: AssertionError listing EVERY failed check, not just the first
+        
+        EXAMPLE:
+        self.check_all(
+            Check(self.HOME_SLIDER, visible=True),
+            Check(self.LOGIN_LINK, visible=True),
+        )
+        """
+        specs = [check.to_js() for check in checks]
+        self._raise_for_failed_checks(checks, self.driver.run_checks(specs, timeout))
+    
+    # ============ PERFORMANCE BUDGET ============
+    
+    def check_budget(self, budget=True):
+        """
+        Compare the loaded page's browser metrics with its budget
+        
+        PARAMETERS:
+        - budget: True = this page's limits from config/budgets.py,
+          or {metric: limit} overriding some of them
+        
+        RETURNS: The measured metrics (None over --protocol=http)
+        
+        RAISES: AssertionError listing every metric over budget
+        (only warns with BUDGET_MODE=warn / --budget-mode=warn)
+        
+        USED BY: verify_*_loaded(budget=...) in child pages
+        """
+        limits = self._budget_limits(budget)
+        metrics = self.driver.budget_metrics()
+        self._report_budget(metrics, limits)
+        return metrics
+    
+    # ============ WAITS ============
+    
+    @contextmanager
+    def expect_dom_change(self, selector="body", quiet_ms=50, timeout=None):
+        """
+        Block until the action inside changed the DOM under selector
+        
+        WHY?: Replaces fixed sleeps (wait_for_timeout) - returns as
+        soon as the DOM changed and stayed quiet for quiet_ms
+        
+        USAGE:
+        with self.expect_dom_change("#cart_info tbody"):
+            self.delete_button(product_id).click()
+        """
+        token = next_token()
+        self.page.evaluate(WATCH_JS, [selector, token])
+        yield
+        self.page.wait_for_function(SETTLED_JS, arg=[token, quiet_ms, True], timeout=timeout)
+    
+    def wait_for_settled(self, selector="body", quiet_ms=100, timeout=None):
+        """
+        Wait until the DOM under selector stops changing for quiet_ms
+        
+        USAGE: After actions whose effect we can't name in advance
+        (animations, async re-renders, lazy content)
+        """
+        token = next_token()
+        self.page.evaluate(WATCH_JS, [selector, token])
+        self.page.wait_for_function(SETTLED_JS, arg=[token, quiet_ms, False], timeout=timeout)
+        print(f"⏳ DOM settled: {selector}")
\ No newline at end of file
@@ -3,12 +3,16 @@ Cart Page Object
 URL: https://www.automationexercise.com/view_cart
 """
 from pages.base_page import BasePage
-from playwright.sync_api import expect
+from pages.instrumentation import action
 
-class CartPage(BasePage):
+class CartLocators:
+    """
+    Locators of the cart page, shared by CartPage and AsyncCartPage
+    (pages/async_pages/) - selectors live in ONE place
+    """
     
-    def __init__(self, page):
-        super().__init__(page)
+    # Only the cart table matters
+    BLOCKED_RESOURCE_TYPES = ("media", "image", "font")
     
     # ============ LOCATORS ============
     
@@ -30,18 +34,59 @@ class CartPage(BasePage):
     def proceed_to_checkout_button(self):
         """Checkout button"""
         return self.page.locator("text=Proceed To Checkout")
+
+class CartPage(CartLocators, BasePage):
+    
+    def __init__(self, page):
+        super().__init__(page)
     
     # ============ ACTIONS ============
     
+    @action
     def navigate_to_cart(self):
         """Go to cart page"""
         self.navigate("/view_cart")
     
+    @action
+    def seed(self, items, open_cart=True):
+        """
+        Put products in the cart without touching the products page
+        
+        WHY?: Cart tests only need items in the cart; adding them
+        through the UI costs two navigations and a modal per test
+        
+        PARAMETERS:
+        - items: Product ids; repeat an id for a higher quantity
+        - open_cart: Navigate to /view_cart afterwards
+        
+        HOW: The site's own add-to-cart endpoint, called through
+        page.request, which shares cookies (the session) with the page
+        
+        EXAMPLE:
+        cart_page.seed([1, 1, 2])   # 2x product 1, 1x product 2
+        """
+        for product_id in items:
+            response = self.page.request.get(f"{self.base_url}/add_to_cart/{product_id}")
+            if not response.ok:
+                raise RuntimeError(
+                    f"Seeding cart failed: /add_to_cart/{product_id} returned {response.status}"
+                )
+        print(f"🌱 Seeded cart with: {list(items)}")
+        if open_cart:
+            self.navigate_to_cart()
+    
+    @action
     def remove_product(self, product_id):
-        """Remove product from cart"""
+        """
+        Remove product from cart
+        
+        RETURNS: Only after the cart table changed (no fixed sleep needed)
+        """
         print(f"🗑️ Removing product: {product_id}")
-        self.delete_button(product_id).click()
+        with self.expect_dom_change("#cart_info tbody"):
+            self.delete_button(product_id).click()
     
+    @action
     def proceed_to_checkout(self):
         """Click checkout button"""
         print("💳 Proceeding to checkout")
@@ -49,9 +94,17 @@ class CartPage(BasePage):
     
     # ============ VERIFICATIONS ============
     
-    def verify_cart_page_loaded(self):
-        """Verify cart page loaded"""
-        expect(self.page).to_have_url("https://www.automationexercise.com/view_cart")
+    def verify_cart_page_loaded(self, budget=None):
+        """
+        Verify cart page loaded
+        
+        PARAMETERS:
+        - budget: True/{metric: limit} also checks load performance
+          (see BasePage.check_budget, config/budgets.py)
+        """
+        self.expect(self.page).to_have_url(f"{self.base_url}/view_cart")
+        if budget:
+            self.check_budget(budget)
         print("✅ Cart page verified")
     
     def get_cart_item_count(self):
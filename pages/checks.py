@@ -0,0 +1,121 @@
+"""
+Batched Checks
+Declarative expectations evaluated together in ONE browser call (BasePage.check_all)
+"""
+import re
+
+# "text=...", "internal:role=...", "id=..." - Playwright selector engines
+ENGINE_PREFIX = re.compile(r"^[a-zA-Z][\w:-]*=")
+
+# Runs in the browser. Returns one list of failure messages per check.
+CHECKS_JS = """
+(checks) => {
+    const resolve = (selector) => {
+        if (/^(xpath=|\\/\\/|\\(\\/\\/)/.test(selector)) {
+            const result = document.evaluate(
+                selector.replace(/^xpath=/, ""), document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        }
+        return Array.from(document.querySelectorAll(selector));
+    };
+    // Same rule as Playwright: non-empty box and not visibility:hidden
+    const isVisible = (element) => {
+        if (getComputedStyle(element).visibility !== "visible") return false;
+        const box = element.getBoundingClientRect();
+        return box.width > 0 && box.height > 0;
+    };
+    return checks.map((check) => {
+        let elements;
+        try {
+            elements = resolve(check.selector);
+        } catch (error) {
+            return [`invalid selector: ${error.message}`];
+        }
+        const first = elements[0];
+        const failures = [];
+        if (check.count !== null && elements.length !== check.count) {
+            failures.push(`expected count ${check.count}, got ${elements.length}`);
+        }
+        if (check.visible !== null && (!!first && isVisible(first)) !== check.visible) {
+            failures.push(first ? `expected visible=${check.visible}` : "element not found");
+        }
+        if (check.text !== null) {
+            const text = first ? first.innerText.trim() : null;
+            if (text === null || !text.includes(check.text)) {
+                failures.push(`expected text containing ${JSON.stringify(check.text)}, got ${JSON.stringify(text)}`);
+            }
+        }
+        if (check.attribute !== null) {
+            const [name, value] = check.attribute;
+            const actual = first ? first.getAttribute(name) : null;
+            if (actual !== value) {
+                failures.push(`expected ${name}=${JSON.stringify(value)}, got ${JSON.stringify(actual)}`);
+            }
+        }
+        return failures;
+    });
+}
+"""
+
+# Same evaluation, as a wait_for_function predicate
+ALL_PASS_JS = f"(checks) => ({CHECKS_JS})(checks).every((failures) => failures.length === 0)"
+
+
+def batchable_selector(selector):
+    """
+    The selector as CHECKS_JS resolves it ("css=" prefix dropped)
+
+    RAISES: ValueError for anything but a CSS/XPath string - locators,
+    Playwright engines (text=, internal:role=...) and >> chains only
+    resolve in Playwright; use expect() for those
+    """
+    if not isinstance(selector, str):
+        raise ValueError(f"Check needs a CSS/XPath selector string, got {selector!r}")
+    if selector.startswith("css="):
+        selector = selector[len("css="):]
+    if ">>" in selector or (ENGINE_PREFIX.match(selector) and not selector.startswith("xpath=")):
+        raise ValueError(f"Check can't batch {selector!r}; use a CSS/XPath locator or expect()")
+    return selector
+
+
+class Check:
+    """
+    One expectation about the element(s) matching a selector
+
+    SELECTOR: CSS or XPath ("//a", "(//a)[1]", "xpath=..."), best one
+    the page object declares next to its locators (HomePage.HOME_SLIDER)
+    text/attribute/visible look at the FIRST match
+
+    EXAMPLES:
+    Check(home_page.HOME_SLIDER, visible=True)
+    Check(".productinfo", count=12)
+    Check("h2.title", text="All Products")
+    Check("html", attribute=("lang", "en"))
+    """
+
+    def __init__(self, selector, visible=None, text=None, attribute=None, count=None):
+        self.selector = batchable_selector(selector)
+        self.visible = visible
+        self.text = text
+        self.attribute = attribute
+        self.count = count
+
+    def to_js(self):
+        """Plain dict handed to the browser"""
+        return {
+            "selector": self.selector,
+            "visible": self.visible,
+            "text": self.text,
+            "attribute": list(self.attribute) if self.attribute else None,
+            "count": self.count,
+        }
+
+    def __repr__(self):
+        expectations = ", ".join(
+            f"{name}={value!r}"
+            for name, value in self.to_js().items()
+            if name != "selector" and value is not None
+        )
+        return f"Check({self.selector!r}, {expectations})"
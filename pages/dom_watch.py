@@ -0,0 +1,41 @@
+"""
+DOM Watch
+MutationObserver scripts behind BasePage.expect_dom_change / wait_for_settled
+"""
+import itertools
+
+# Starts recording mutations under a selector (whole document if missing)
+WATCH_JS = """
+([selector, token]) => {
+    const target = document.querySelector(selector) || document.documentElement;
+    const state = {changes: 0, last: performance.now()};
+    state.observer = new MutationObserver(() => {
+        state.changes += 1;
+        state.last = performance.now();
+    });
+    state.observer.observe(target, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    (window.__domWatches = window.__domWatches || {})[token] = state;
+}
+"""
+
+# wait_for_function predicate: quiet for quietMs (after at least one change if required)
+SETTLED_JS = """
+([token, quietMs, needChange]) => {
+    const state = (window.__domWatches || {})[token];
+    // Watch gone = the page navigated, which is a change too
+    if (!state) return true;
+    if (needChange && state.changes === 0) return false;
+    if (performance.now() - state.last < quietMs) return false;
+    state.observer.disconnect();
+    delete window.__domWatches[token];
+    return true;
+}
+"""
+
+_tokens = itertools.count()
+
+def next_token():
+    """Unique name for one watch on the page"""
+    return f"watch-{next(_tokens)}"
@@ -0,0 +1,89 @@
+"""
+Page Drivers
+What BasePage needs from a page beyond locators: assertions, batched checks, budget metrics
+
+WHY THIS EXISTS:
+- A browser page answers with Playwright (expect, page.evaluate)
+- An HttpPage (pages/http_page.py) has no JavaScript and answers
+  the same questions in Python
+- Page objects call self.expect/check_all/check_budget and never
+  need to know which one they drive
+
+IMPLEMENTATIONS:
+- BrowserDriver (here): Playwright pages, the default
+- AsyncBrowserDriver (here): async Playwright pages, every call awaited
+- HttpDriver (pages/http_page.py): HttpPage.driver
+
+USED BY: BasePage (self.driver = driver_for(page)),
+AsyncBasePage (self.driver = AsyncBrowserDriver(page))
+"""
+from pages.checks import ALL_PASS_JS, CHECKS_JS
+from pages.timing import BUDGET_METRICS_JS
+from playwright.async_api import expect as async_playwright_expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import expect as playwright_expect
+
+
+def driver_for(page):
+    """The page's own driver (HttpPage.driver), else a BrowserDriver"""
+    return getattr(page, "driver", None) or BrowserDriver(page)
+
+
+class BrowserDriver:
+    """Playwright page: web-first assertions and in-browser evaluation"""
+
+    def __init__(self, page):
+        self.page = page
+
+    def expect(self, target):
+        """playwright.sync_api.expect(target)"""
+        return playwright_expect(target)
+
+    def run_checks(self, specs, timeout=0):
+        """
+        Evaluate Check specs (pages/checks.py) in ONE browser call
+
+        PARAMETERS:
+        - specs: Check.to_js() of every check
+        - timeout: ms to wait for all of them to pass first (0 = check once)
+
+        RETURNS: One list of failure messages per check
+        """
+        if timeout:
+            try:
+                self.page.wait_for_function(ALL_PASS_JS, arg=specs, timeout=timeout)
+                return [[] for _ in specs]
+            except PlaywrightTimeoutError:
+                pass  # Report what is still failing below
+        return self.page.evaluate(CHECKS_JS, specs)
+
+    def budget_metrics(self):
+        """Navigation/paint metrics of the loaded page (pages/timing.py)"""
+        self.page.wait_for_load_state("load")
+        return self.page.evaluate(BUDGET_METRICS_JS)
+
+
+class AsyncBrowserDriver:
+    """Async Playwright page: same answers as BrowserDriver, awaited"""
+
+    def __init__(self, page):
+        self.page = page
+
+    def expect(self, target):
+        """playwright.async_api.expect(target) - await its assertions"""
+        return async_playwright_expect(target)
+
+    async def run_checks(self, specs, timeout=0):
+        """See BrowserDriver.run_checks"""
+        if timeout:
+            try:
+                await self.page.wait_for_function(ALL_PASS_JS, arg=specs, timeout=timeout)
+                return [[] for _ in specs]
+            except PlaywrightTimeoutError:
+                pass  # Report what is still failing below
+        return await self.page.evaluate(CHECKS_JS, specs)
+
+    async def budget_metrics(self):
+        """See BrowserDriver.budget_metrics"""
+        await self.page.wait_for_load_state("load")
+        return await self.page.evaluate(BUDGET_METRICS_JS)
@@ -4,23 +4,21 @@ URL: https://www.automationexercise.com/
 Contains: Locators and methods for home page interactions
 """
 from pages.base_page import BasePage
+from pages.instrumentation import action
 
-class HomePage(BasePage):
+class HomeLocators:
     """
-    INHERITANCE:
-    - Inherits from BasePage
-    - Gets navigate(), get_page_title() for free
-    
-    CONTAINS:
-    - Locators specific to home page
-    - Methods specific to home page actions
+    Locators of the home page, shared by HomePage and AsyncHomePage
+    (pages/async_pages/) - selectors live in ONE place
     """
     
-    def __init__(self, page):
-        """
-        Call parent constructor
-        """
-        super().__init__(page)
+    # ============ CHECK SELECTORS ============
+    # Plain CSS for batched checks (check_all, pages/checks.py),
+    # which can't resolve role/text locators
+    
+    PRODUCTS_LINK = ".shop-menu a[href='/products']"
+    LOGIN_LINK = "a[href='/login']"
+    HOME_SLIDER = "#slider"
     
     # ============ LOCATORS ============
     # WHY SEPARATE?: Easy to maintain, one place to update
@@ -33,34 +31,60 @@ class HomePage(BasePage):
     @property
     def login_link(self):
         """Login/Signup navigation link"""
-        return self.page.locator("a[href='/login']")
+        return self.page.locator(self.LOGIN_LINK)
     
     @property
     def home_slider(self):
         """Main carousel/slider on homepage"""
-        return self.page.locator("#slider")
+        return self.page.locator(self.HOME_SLIDER)
+
+class HomePage(HomeLocators, BasePage):
+    """
+    INHERITANCE:
+    - Inherits from BasePage
+    - Gets navigate(), get_page_title() for free
+    
+    CONTAINS:
+    - Locators specific to home page (HomeLocators)
+    - Methods specific to home page actions
+    """
+    
+    def __init__(self, page):
+        """
+        Call parent constructor
+        """
+        super().__init__(page)
     
     # ============ ACTIONS ============
     
+    @action
     def navigate_to_home(self):
         """Go to homepage"""
         self.navigate("/")
     
+    @action
     def click_products(self):
         """Navigate to Products page"""
         self.products_link.click()
         print("🖱️ Clicked Products link")
     
+    @action
     def click_login(self):
         """Navigate to Login page"""
         self.login_link.click()
         print("🖱️ Clicked Login link")
     
-    def is_home_page_loaded(self):
+    def is_home_page_loaded(self, budget=None):
         """
         Verify home page loaded correctly
         RETURNS: True if slider visible
+        
+        PARAMETERS:
+        - budget: True/{metric: limit} also checks load performance
+          (raises/warns when over budget, see BasePage.check_budget)
         """
         is_visible = self.home_slider.is_visible()
+        if budget:
+            self.check_budget(budget)
         print(f"🏠 Home page loaded: {is_visible}")
         return is_visible
\ No newline at end of file
@@ -0,0 +1,564 @@
+"""
+HTTP Protocol Mode
+A browserless stand-in for the Playwright Page, for fast smoke runs
+
+USAGE:
+pytest --protocol=http       # browser tests run only if @pytest.mark.browserless
+
+HOW:
+- goto()/link clicks/form submits are plain HTTP requests over
+  pooled keep-alive connections (HttpConnectionPool)
+- Responses are parsed with lxml; locators become CSS/XPath
+  queries against the parsed document
+- Cookies live on the HttpPage, like a browser context
+
+LIMITS: No JavaScript. Anything that needs it (modals, AJAX cart
+buttons, page.evaluate) raises BrowserRequiredError, so tests
+relying on it must keep running in a browser
+
+PAGE OBJECTS: BasePage talks to HttpPage.driver (HttpDriver) for
+assertions, batched checks and budgets, the way it talks to a
+BrowserDriver on a real page (see pages/drivers.py)
+
+NEEDS: pip install lxml cssselect (imported on first use)
+"""
+import http.client
+import re
+import threading
+import urllib.request
+from collections import defaultdict
+from http.cookiejar import CookieJar
+from urllib.parse import urlencode, urljoin, urlsplit
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10
+USER_AGENT = "automation-exercise-smoke/1.0 (HTTP protocol mode)"
+
+# Elements a browser never renders
+NEVER_VISIBLE = {"head", "script", "style", "template", "noscript", "title", "meta", "link"}
+HIDDEN_STYLE = re.compile(r"(display\s*:\s*none|visibility\s*:\s*hidden)", re.IGNORECASE)
+
+ROLE_SELECTORS = {
+    "link": "a[href]",
+    "button": "button, input[type=submit], input[type=button], [role=button]",
+    "heading": "h1, h2, h3, h4, h5, h6, [role=heading]",
+    "textbox": "input:not([type]), input[type=text], input[type=email], "
+               "input[type=password], input[type=search], textarea",
+}
+
+
+class BrowserRequiredError(Exception):
+    """The step needs a real browser (JavaScript, rendering, page.evaluate)"""
+
+
+class HttpLocatorError(AssertionError):
+    """Locator matched nothing, or several elements where one was expected"""
+
+
+def _lxml():
+    try:
+        import lxml.html
+        from lxml.cssselect import CSSSelector
+    except ImportError as error:
+        raise ImportError(
+            "HTTP protocol mode needs lxml and cssselect: pip install lxml cssselect"
+        ) from error
+    return lxml.html, CSSSelector
+
+
+# ============ CONNECTION POOL ============
+
+class HttpConnectionPool:
+    """
+    Keep-alive connections shared by every HttpPage in the session
+
+    WHY?: A new TCP connection per request would cost more than
+    the request itself on the local stand-in
+    """
+
+    def __init__(self, max_idle_per_host=8, timeout=30):
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def request(self, method, url, body=None, headers=None):
+        """
+        Send one request, reusing an idle connection when possible
+
+        RETURNS: (status, headers, body bytes, http.client.HTTPResponse)
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+
+        for attempt in range(2):
+            connection = self._checkout(key)
+            try:
+                connection.request(method, target, body=body, headers=headers or {})
+                response = connection.getresponse()
+                content = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server closed an idle keep-alive connection; retry once on a new one
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin(key, connection)
+            return response.status, response.headers, content, response
+
+    def _checkout(self, key):
+        with self._lock:
+            if self._idle[key]:
+                return self._idle[key].pop()
+        scheme, host, port = key
+        connection_class = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        return connection_class(host, port, timeout=self.timeout)
+
+    def _checkin(self, key, connection):
+        with self._lock:
+            if len(self._idle[key]) < self.max_idle_per_host:
+                self._idle[key].append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """Close every idle connection (end of session)"""
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle.clear()
+
+
+# ============ PAGE ============
+
+class HttpPage:
+    """
+    Quacks like the parts of playwright.sync_api.Page our page objects use
+
+    SUPPORTED: goto, url, title, content, locator, get_by_role,
+    get_by_placeholder, get_by_text, request.get, route (no-op),
+    wait_for_load_state, driver (for BasePage)
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.cookies = CookieJar()
+        self.url = "about:blank"
+        self.status = None
+        self.document = None
+
+    # ============ NAVIGATION ============
+
+    def goto(self, url, **kwargs):
+        """GET url (following redirects) and parse the response"""
+        return self._load("GET", urljoin(self.url, url))
+
+    def _load(self, method, url, body=None, content_type=None):
+        url, status, response_headers, content = self._fetch(method, url, body, content_type)
+        self.url = url
+        self.status = status
+        self.document = self._parse(content, response_headers.get_content_charset() or "utf-8")
+        print(f"🌐 HTTP {method} {url} -> {status}")
+        return self
+
+    def _fetch(self, method, url, body=None, content_type=None):
+        """One request + redirects, with this page's cookies"""
+        for _ in range(MAX_REDIRECTS):
+            request = urllib.request.Request(url, method=method)
+            self.cookies.add_cookie_header(request)
+            headers = {"User-Agent": USER_AGENT, "Accept": "text/html,*/*"}
+            headers.update(request.unredirected_hdrs)
+            if content_type:
+                headers["Content-Type"] = content_type
+            status, response_headers, content, response = self.pool.request(
+                method, url, body=body, headers=headers
+            )
+            self.cookies.extract_cookies(response, request)
+            if status not in REDIRECT_STATUSES:
+                break
+            url = urljoin(url, response_headers["Location"])
+            if status in (301, 302, 303):
+                method, body, content_type = "GET", None, None
+        return url, status, response_headers, content
+
+    def _parse(self, content, charset):
+        lxml_html, _ = _lxml()
+        text = content.decode(charset, errors="replace")
+        if not text.strip():
+            text = "<html><body></body></html>"
+        return lxml_html.document_fromstring(text, base_url=self.url)
+
+    def title(self):
+        found = self.document.findtext(".//title") if self.document is not None else None
+        return (found or "").strip()
+
+    def content(self):
+        lxml_html, _ = _lxml()
+        return lxml_html.tostring(self.document, encoding="unicode")
+
+    # ============ LOCATORS ============
+
+    def locator(self, selector):
+        return HttpLocator(self, selector)
+
+    def get_by_text(self, text):
+        return HttpLocator(self, f"text={text}")
+
+    def get_by_placeholder(self, text):
+        return HttpLocator(
+            self, "[placeholder]",
+            keep=lambda element: text.lower() in element.get("placeholder", "").lower()
+        )
+
+    def get_by_role(self, role, name=None):
+        if role not in ROLE_SELECTORS:
+            raise BrowserRequiredError(f"get_by_role({role!r}) is not supported over HTTP")
+        keep = None
+        if name is not None:
+            keep = lambda element: name.lower() in _accessible_name(element).lower()
+        return HttpLocator(self, ROLE_SELECTORS[role], keep=keep)
+
+    @property
+    def request(self):
+        """Like page.request: API calls sharing this page's cookies"""
+        return HttpAPIRequest(self)
+
+    # ============ BROWSER-ONLY ============
+
+    def route(self, url, handler):
+        """No subresources are fetched, so there is nothing to block"""
+
+    def wait_for_load_state(self, state="load", **kwargs):
+        """The parsed document is already complete"""
+
+    def evaluate(self, expression, arg=None):
+        raise BrowserRequiredError("page.evaluate needs a browser (run without --protocol=http)")
+
+    def wait_for_function(self, expression, **kwargs):
+        raise BrowserRequiredError("page.wait_for_function needs a browser")
+
+    def close(self):
+        self.document = None
+
+    @property
+    def driver(self):
+        """What BasePage uses instead of Playwright (pages/drivers.py)"""
+        return HttpDriver(self)
+
+    # ============ BATCHED CHECKS ============
+
+    def run_checks(self, specs):
+        """
+        Python twin of pages/checks.py CHECKS_JS
+
+        RETURNS: One list of failure messages per check
+        """
+        results = []
+        for spec in specs:
+            elements = HttpLocator(self, spec["selector"]).all_elements()
+            first = elements[0] if elements else None
+            failures = []
+            if spec["count"] is not None and len(elements) != spec["count"]:
+                failures.append(f"expected count {spec['count']}, got {len(elements)}")
+            if spec["visible"] is not None and (first is not None and _is_visible(first)) != spec["visible"]:
+                failures.append(f"expected visible={spec['visible']}" if first is not None else "element not found")
+            if spec["text"] is not None:
+                text = _text(first) if first is not None else None
+                if text is None or spec["text"] not in text:
+                    failures.append(f"expected text containing {spec['text']!r}, got {text!r}")
+            if spec["attribute"] is not None:
+                name, value = spec["attribute"]
+                actual = first.get(name) if first is not None else None
+                if actual != value:
+                    failures.append(f"expected {name}={value!r}, got {actual!r}")
+            results.append(failures)
+        return results
+
+    # ============ FORMS ============
+
+    def submit(self, form, submitter=None):
+        """Submit a form the way a browser would (no JavaScript)"""
+        fields = []
+        for field in form.iter("input", "select", "textarea"):
+            name = field.get("name")
+            kind = (field.get("type") or "text").lower()
+            if not name or field.get("disabled") is not None:
+                continue
+            if kind in ("submit", "button", "image", "reset"):
+                continue
+            if kind in ("checkbox", "radio") and field.get("checked") is None:
+                continue
+            if field.get("required") is not None and not _field_value(field):
+                print(f"⛔ Not submitted: required field {name!r} is empty")
+                return self
+            fields.append((name, _field_value(field)))
+        if submitter is not None and submitter.get("name"):
+            fields.append((submitter.get("name"), submitter.get("value", "")))
+
+        action = urljoin(self.url, form.get("action") or self.url)
+        if (form.get("method") or "get").lower() == "post":
+            return self._load(
+                "POST", action,
+                body=urlencode(fields).encode("utf-8"),
+                content_type="application/x-www-form-urlencoded",
+            )
+        return self._load("GET", f"{action.split('?')[0]}?{urlencode(fields)}")
+
+
+class HttpAPIResponse:
+    """The parts of playwright APIResponse our page objects read"""
+
+    def __init__(self, url, status, body):
+        self.url = url
+        self.status = status
+        self.ok = 200 <= status < 300
+        self._body = body
+
+    def body(self):
+        return self._body
+
+    def text(self):
+        return self._body.decode("utf-8", errors="replace")
+
+
+class HttpAPIRequest:
+    """page.request for HttpPage: leaves the parsed document alone"""
+
+    def __init__(self, page):
+        self.page = page
+
+    def get(self, url, **kwargs):
+        url, status, _, content = self.page._fetch("GET", urljoin(self.page.url, url))
+        return HttpAPIResponse(url, status, content)
+
+
+class HttpLocator:
+    """
+    Lazily re-queried on every use, like a Playwright Locator
+
+    SELECTORS: CSS, XPath ("//a", "(//a)[1]", "xpath=..."),
+    text=Foo (case-insensitive substring) and text="Foo" (exact)
+    """
+
+    def __init__(self, page, selector, keep=None, index=None):
+        self.page = page
+        self.selector = selector
+        self._keep = keep
+        self._index = index
+
+    def __repr__(self):
+        suffix = f" [{self._index}]" if self._index is not None else ""
+        return f"HttpLocator({self.selector!r}{suffix})"
+
+    # ============ QUERYING ============
+
+    def all_elements(self):
+        if self.page.document is None:
+            return []
+        elements = _query(self.page.document, self.selector)
+        if self._keep:
+            elements = [element for element in elements if self._keep(element)]
+        if self._index is not None:
+            try:
+                return [elements[self._index]]
+            except IndexError:
+                return []
+        return elements
+
+    def _one(self):
+        # Strict like Playwright: actions need exactly one element
+        elements = self.all_elements()
+        if not elements:
+            raise HttpLocatorError(f"{self!r} matched no element on {self.page.url}")
+        if len(elements) > 1:
+            raise HttpLocatorError(f"{self!r} matched {len(elements)} elements on {self.page.url}")
+        return elements[0]
+
+    @property
+    def first(self):
+        return self.nth(0)
+
+    @property
+    def last(self):
+        return self.nth(-1)
+
+    def nth(self, index):
+        return HttpLocator(self.page, self.selector, self._keep, index)
+
+    def count(self):
+        return len(self.all_elements())
+
+    def is_visible(self):
+        elements = self.all_elements()
+        if len(elements) > 1:
+            raise HttpLocatorError(f"{self!r} matched {len(elements)} elements on {self.page.url}")
+        return bool(elements) and _is_visible(elements[0])
+
+    def inner_text(self):
+        return _text(self._one())
+
+    def text_content(self):
+        return self._one().text_content()
+
+    def get_attribute(self, name):
+        return self._one().get(name)
+
+    def input_value(self):
+        return _field_value(self._one())
+
+    # ============ ACTIONS ============
+
+    def fill(self, value):
+        element = self._one()
+        if element.tag == "textarea":
+            element.text = value
+        elif element.tag == "input":
+            element.set("value", value)
+        else:
+            raise HttpLocatorError(f"{self!r} is a <{element.tag}>, not a form field")
+
+    def click(self):
+        """Follow a link or submit a form; anything else needs JavaScript"""
+        element = self._one()
+        href = element.get("href")
+        if element.tag == "a" and href and href != "#" and not href.startswith("javascript:"):
+            self.page.goto(href)
+            return
+        kind = (element.get("type") or "submit").lower()
+        if element.tag in ("button", "input") and kind == "submit":
+            form = next((parent for parent in element.iterancestors("form")), None)
+            if form is not None:
+                self.page.submit(form, submitter=element)
+                return
+        raise BrowserRequiredError(
+            f"Clicking {self!r} (<{element.tag}>) runs JavaScript; needs a browser"
+        )
+
+
+# ============ ASSERTIONS ============
+
+class HttpPageAssertions:
+    def __init__(self, page):
+        self.page = page
+
+    def to_have_url(self, url, **kwargs):
+        matches = url.search(self.page.url) if hasattr(url, "search") else self.page.url == url
+        assert matches, f"expected URL {url!r}, got {self.page.url!r}"
+
+    def to_have_title(self, title, **kwargs):
+        actual = self.page.title()
+        matches = title.search(actual) if hasattr(title, "search") else actual == title
+        assert matches, f"expected title {title!r}, got {actual!r}"
+
+
+class HttpLocatorAssertions:
+    def __init__(self, locator):
+        self.locator = locator
+
+    def to_be_visible(self, **kwargs):
+        assert self.locator.is_visible(), f"{self.locator!r} is not visible"
+
+    def to_be_hidden(self, **kwargs):
+        assert not self.locator.is_visible(), f"{self.locator!r} is visible"
+
+    def to_have_count(self, count, **kwargs):
+        actual = self.locator.count()
+        assert actual == count, f"{self.locator!r}: expected count {count}, got {actual}"
+
+    def to_contain_text(self, text, **kwargs):
+        actual = self.locator.inner_text()
+        assert text in actual, f"{self.locator!r}: expected text containing {text!r}, got {actual!r}"
+
+
+class HttpDriver:
+    """
+    BrowserDriver's twin for HttpPage (see pages/drivers.py)
+
+    - expect: the assertion subset above, checked once (the parsed
+      document never changes by itself, so there is nothing to wait for)
+    - run_checks: HttpPage.run_checks, the timeout is moot for the same reason
+    - budget_metrics: None, there are no browser metrics
+    """
+
+    def __init__(self, page):
+        self.page = page
+
+    def expect(self, target):
+        if isinstance(target, HttpLocator):
+            return HttpLocatorAssertions(target)
+        return HttpPageAssertions(target)
+
+    def run_checks(self, specs, timeout=0):
+        return self.page.run_checks(specs)
+
+    def budget_metrics(self):
+        return None
+
+
+# ============ HELPERS ============
+
+def _query(document, selector):
+    if selector.startswith("text="):
+        return _by_text(document, selector[len("text="):])
+    if re.match(r"^(xpath=|//|\(//)", selector):
+        return document.xpath(selector[len("xpath="):] if selector.startswith("xpath=") else selector)
+    _, css_selector = _lxml()
+    return css_selector(selector)(document)
+
+
+def _by_text(document, text):
+    """Smallest elements whose text matches (Playwright text= semantics)"""
+    exact = len(text) > 1 and text[0] == text[-1] and text[0] in "\"'"
+    needle = text[1:-1] if exact else text.lower()
+
+    def matches(element):
+        value = _text(element)
+        return value == needle if exact else needle in value.lower()
+
+    body = document.find("body")
+    candidates = [element for element in (body if body is not None else document).iter()
+                  if isinstance(element.tag, str) and element.tag not in NEVER_VISIBLE]
+    found = [element for element in candidates if matches(element)]
+    found_set = set(found)
+    return [
+        element for element in found
+        if not any(child in found_set for child in element.iterdescendants())
+    ]
+
+
+def _text(element):
+    return " ".join(element.text_content().split())
+
+
+def _accessible_name(element):
+    return element.get("aria-label") or _text(element) or element.get("value") or ""
+
+
+def _field_value(element):
+    if element.tag == "textarea":
+        return element.text or ""
+    if element.tag == "select":
+        selected = element.xpath(".//option[@selected]") or element.xpath(".//option")
+        return (selected[0].get("value") or _text(selected[0])) if selected else ""
+    return element.get("value", "")
+
+
+def _is_visible(element):
+    """No layout engine: hidden = hidden attribute, inline display/visibility, or <head>"""
+    if (element.tag == "input" and (element.get("type") or "").lower() == "hidden"):
+        return False
+    for node in [element, *element.iterancestors()]:
+        if node.tag in NEVER_VISIBLE or node.get("hidden") is not None:
+            return False
+        if HIDDEN_STYLE.search(node.get("style", "")):
+            return False
+    return True
@@ -0,0 +1,66 @@
+"""
+Page-Object Action Hooks
+@action marks navigate() and page-object actions so listeners can observe them
+
+LISTENER INTERFACE:
+- before(page_object, name) -> state
+- after(state, error)                 (sync page objects)
+- async after_async(state, error)     (pages/async_pages)
+
+No listeners registered = the wrapper just calls the action.
+"""
+import functools
+import inspect
+
+_listeners = []
+
+def add_action_listener(listener):
+    """Start observing every page-object action"""
+    _listeners.append(listener)
+
+def remove_action_listener(listener):
+    """Stop observing page-object actions"""
+    _listeners.remove(listener)
+
+def action(func):
+    """
+    Decorator for page-object actions
+
+    NAME REPORTED: "<PageClass>.<method>", e.g. "LoginPage.perform_login"
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not _listeners:
+                return await func(self, *args, **kwargs)
+            started = _start(self, func)
+            error = None
+            try:
+                return await func(self, *args, **kwargs)
+            except BaseException as exc:
+                error = exc
+                raise
+            finally:
+                for listener, state in reversed(started):
+                    await listener.after_async(state, error)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not _listeners:
+            return func(self, *args, **kwargs)
+        started = _start(self, func)
+        error = None
+        try:
+            return func(self, *args, **kwargs)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            for listener, state in reversed(started):
+                listener.after(state, error)
+    return wrapper
+
+def _start(page_object, func):
+    name = f"{type(page_object).__name__}.{func.__name__}"
+    return [(listener, listener.before(page_object, name)) for listener in list(_listeners)]
@@ -4,15 +4,21 @@ URL: https://www.automationexercise.com/login
 Contains: Login and Signup functionality
 """
 from pages.base_page import BasePage
-from playwright.sync_api import expect
+from pages.instrumentation import action
 
-class LoginPage(BasePage):
+class LoginLocators:
     """
-    Handles both Login and Signup forms
+    Locators of the login/signup page, shared by LoginPage and AsyncLoginPage
+    (pages/async_pages/) - selectors live in ONE place
     """
     
-    def __init__(self, page):
-        super().__init__(page)
+    # Forms only
+    BLOCKED_RESOURCE_TYPES = ("media", "image", "font")
+    
+    # ============ CHECK SELECTORS ============
+    # Plain CSS for batched checks (check_all, pages/checks.py)
+    
+    LOGIN_BUTTON = "button[data-qa='login-button']"
     
     # ============ LOCATORS - LOGIN SECTION ============
     
@@ -29,7 +35,7 @@ class LoginPage(BasePage):
     @property
     def login_button(self):
         """Login submit button"""
-        return self.page.locator("button[data-qa='login-button']")
+        return self.page.locator(self.LOGIN_BUTTON)
     
     # ============ LOCATORS - SIGNUP SECTION ============
     
@@ -48,12 +54,29 @@ class LoginPage(BasePage):
         """Signup submit button"""
         return self.page.locator("button[data-qa='signup-button']")
     
+    # ============ LOCATORS - LOGGED IN ============
+    
+    @property
+    def logged_in_as(self):
+        """'Logged in as <name>' header shown after a successful login"""
+        return self.page.locator("text=Logged in as")
+
+class LoginPage(LoginLocators, BasePage):
+    """
+    Handles both Login and Signup forms
+    """
+    
+    def __init__(self, page):
+        super().__init__(page)
+    
     # ============ ACTIONS - LOGIN ============
     
+    @action
     def navigate_to_login(self):
         """Go to login page"""
         self.navigate("/login")
     
+    @action
     def perform_login(self, email, password):
         """
         Complete login workflow
@@ -75,6 +98,7 @@ class LoginPage(BasePage):
     
     # ============ ACTIONS - SIGNUP ============
     
+    @action
     def perform_signup(self, name, email):
         """
         Complete signup workflow
@@ -96,8 +120,21 @@ class LoginPage(BasePage):
     
     # ============ VERIFICATIONS ============
     
-    def verify_login_page_loaded(self):
-        """Verify we're on login page"""
-        expect(self.page).to_have_url("https://www.automationexercise.com/login")
-        expect(self.login_button).to_be_visible()
-        print("✅ Login page verified")
\ No newline at end of file
+    def verify_login_page_loaded(self, budget=None):
+        """
+        Verify we're on login page
+        
+        PARAMETERS:
+        - budget: True/{metric: limit} also checks load performance
+          (see BasePage.check_budget, config/budgets.py)
+        """
+        self.expect(self.page).to_have_url(f"{self.base_url}/login")
+        self.expect(self.login_button).to_be_visible()
+        if budget:
+            self.check_budget(budget)
+        print("✅ Login page verified")
+    
+    def verify_logged_in(self):
+        """Verify login succeeded (header shows the user)"""
+        self.expect(self.logged_in_as).to_be_visible()
+        print("✅ Logged in verified")
\ No newline at end of file
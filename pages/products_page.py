@@ -3,12 +3,87 @@ Products Page Object
 URL: https://www.automationexercise.com/products
 """
 from pages.base_page import BasePage
-from playwright.sync_api import expect
+from pages.instrumentation import action
 
-class ProductsPage(BasePage):
+# Runs in the browser: reads every card in ONE round trip
+CATALOG_JS = """
+(selector) => {
+    const catalog = {id: [], name: [], price: [], category: [], add_to_cart: []};
+    for (const card of document.querySelectorAll(selector)) {
+        const wrapper = card.closest(".product-image-wrapper") || card;
+        const button = card.querySelector("[data-product-id]");
+        const details = wrapper.querySelector("a[href*='/product_details/']");
+        const name = card.querySelector("p");
+        const price = card.querySelector("h2");
+        catalog.id.push(details ? details.getAttribute("href").split("/").pop()
+                                : button && button.dataset.productId);
+        catalog.name.push(name ? name.textContent.trim() : "");
+        catalog.price.push(price ? price.textContent.trim() : "");
+        catalog.category.push(wrapper.dataset.category || null);
+        catalog.add_to_cart.push(button ? button.dataset.productId : null);
+    }
+    return catalog;
+}
+"""
+
+class ProductCatalog:
+    """
+    Column-oriented snapshot of the product cards
     
-    def __init__(self, page):
-        super().__init__(page)
+    COLUMNS: id, name, price, category, add_to_cart
+    (category is None when the page doesn't expose it)
+    
+    USAGE:
+    catalog = products_page.snapshot_catalog()
+    catalog["price"]                        # all prices
+    catalog.where(category="Women > Tops")  # filtered catalog
+    catalog.where(price=lambda p: not p.startswith("Rs"))
+    """
+    
+    COLUMNS = ("id", "name", "price", "category", "add_to_cart")
+    
+    def __init__(self, columns):
+        self.columns = {name: tuple(columns[name]) for name in self.COLUMNS}
+    
+    def __len__(self):
+        return len(self.columns["id"])
+    
+    def __getitem__(self, column):
+        return self.columns[column]
+    
+    def rows(self):
+        """One dict per product (for readable failure messages)"""
+        for values in zip(*self.columns.values()):
+            yield dict(zip(self.COLUMNS, values))
+    
+    def where(self, **conditions):
+        """
+        Keep products matching every condition
+        
+        A condition is a value to compare with, or a function
+        that gets the column value and returns True/False
+        """
+        keep = [
+            index for index in range(len(self))
+            if all(
+                condition(self.columns[column][index]) if callable(condition)
+                else self.columns[column][index] == condition
+                for column, condition in conditions.items()
+            )
+        ]
+        return ProductCatalog({
+            name: [values[index] for index in keep]
+            for name, values in self.columns.items()
+        })
+
+class ProductsLocators:
+    """
+    Locators of the products page, shared by ProductsPage and AsyncProductsPage
+    (pages/async_pages/) - selectors live in ONE place
+    """
+    
+    # Checks read text/attributes, never pixels
+    BLOCKED_RESOURCE_TYPES = ("media", "image", "font")
     
     # ============ LOCATORS ============
     
@@ -44,13 +119,20 @@ class ProductsPage(BasePage):
     def view_cart_button(self):
         """View cart button in modal"""
         return self.page.locator("text=View Cart")
+
+class ProductsPage(ProductsLocators, BasePage):
+    
+    def __init__(self, page):
+        super().__init__(page)
     
     # ============ ACTIONS ============
     
+    @action
     def navigate_to_products(self):
         """Go to products page"""
         self.navigate("/products")
     
+    @action
     def search_product(self, product_name):
         """
         Search for a product
@@ -63,6 +145,7 @@ class ProductsPage(BasePage):
         self.search_box.fill(product_name)
         self.search_button.click()
     
+    @action
     def add_first_product_to_cart(self):
         """Add first product to cart"""
         print("🛒 Adding first product to cart")
@@ -70,6 +153,7 @@ class ProductsPage(BasePage):
         # Handle modal
         self.continue_shopping_button.click()
     
+    @action
     def add_product_and_view_cart(self, product_number=1):
         """Add product and navigate to cart"""
         print(f"🛒 Adding product {product_number} and viewing cart")
@@ -78,12 +162,33 @@ class ProductsPage(BasePage):
     
     # ============ VERIFICATIONS ============
     
-    def verify_products_page_loaded(self):
-        """Verify products page loaded"""
-        expect(self.page).to_have_url("https://www.automationexercise.com/products")
-        expect(self.all_products.first).to_be_visible()
+    def verify_products_page_loaded(self, budget=None):
+        """
+        Verify products page loaded
+        
+        PARAMETERS:
+        - budget: True/{metric: limit} also checks load performance
+          (see BasePage.check_budget, config/budgets.py)
+        """
+        self.expect(self.page).to_have_url(f"{self.base_url}/products")
+        self.expect(self.all_products.first).to_be_visible()
+        if budget:
+            self.check_budget(budget)
         print("✅ Products page verified")
     
+    def snapshot_catalog(self):
+        """
+        Read every product card in one browser call
+        
+        WHY?: .count() / .inner_text() per card is one IPC hop
+        each; this is a single page.evaluate
+        
+        RETURNS: ProductCatalog
+        """
+        catalog = ProductCatalog(self.page.evaluate(CATALOG_JS, ".productinfo"))
+        print(f"📦 Catalog snapshot: {len(catalog)} products")
+        return catalog
+    
     def get_product_count(self):
         """Count visible products"""
         count = self.all_products.count()
@@ -0,0 +1,86 @@
+"""
+Browser Timing
+What the browser itself measured for the current document (ms since navigation start)
+
+NAVIGATION TIMING:
+- ttfb: Request sent -> first response byte (the site)
+- response_end: Last response byte
+- dom_content_loaded / load: Parsing, scripts, subresources (the browser)
+
+PAINT TIMING:
+- first_paint / first_contentful_paint
+
+BUDGETS: BUDGET_METRICS_JS feeds BasePage.check_budget (limits in config/budgets.py)
+"""
+
+TIMING_JS = """
+() => {
+    const round = (value) => Math.round(value * 10) / 10;
+    const [nav] = performance.getEntriesByType("navigation");
+    const paint = {};
+    for (const entry of performance.getEntriesByType("paint")) {
+        paint[entry.name.replace(/-/g, "_")] = round(entry.startTime);
+    }
+    return {
+        navigation: nav ? {
+            type: nav.type,
+            ttfb: round(nav.responseStart - nav.requestStart),
+            response_end: round(nav.responseEnd),
+            dom_content_loaded: round(nav.domContentLoadedEventEnd),
+            load: round(nav.loadEventEnd),
+            transfer_size: nav.transferSize,
+        } : null,
+        paint: paint,
+    };
+}
+"""
+
+# Resolves after the LCP observer had a chance to replay buffered entries
+BUDGET_METRICS_JS = """
+async () => {
+    const [nav] = performance.getEntriesByType("navigation");
+    const resources = performance.getEntriesByType("resource");
+    const lcp = await new Promise((resolve) => {
+        if (!(PerformanceObserver.supportedEntryTypes || []).includes("largest-contentful-paint")) {
+            resolve(null);
+            return;
+        }
+        const observer = new PerformanceObserver((list) => {
+            const entries = list.getEntries();
+            observer.disconnect();
+            resolve(entries[entries.length - 1].startTime);
+        });
+        observer.observe({type: "largest-contentful-paint", buffered: true});
+        setTimeout(() => { observer.disconnect(); resolve(null); }, 100);
+    });
+    return {
+        dom_content_loaded: nav ? Math.round(nav.domContentLoadedEventEnd) : null,
+        load: nav ? Math.round(nav.loadEventEnd) : null,
+        lcp: lcp === null ? null : Math.round(lcp),
+        // Cross-origin resources without Timing-Allow-Origin report 0
+        transfer_bytes: (nav ? nav.transferSize : 0)
+            + resources.reduce((total, entry) => total + entry.transferSize, 0),
+        requests: resources.length + (nav ? 1 : 0),
+    };
+}
+"""
+
+
+class PerformanceBudgetWarning(UserWarning):
+    """Over budget while the budget mode is 'warn'"""
+
+
+def budget_violations(metrics, limits):
+    """
+    Metrics over their limit
+
+    Metrics the browser didn't report (None) and limits set to
+    None are skipped
+
+    RETURNS: ["load: 7120 > 6000", ...]
+    """
+    return [
+        f"{name}: {metrics[name]} > {limit}"
+        for name, limit in limits.items()
+        if limit is not None and metrics.get(name) is not None and metrics[name] > limit
+    ]
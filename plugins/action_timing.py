@@ -0,0 +1,238 @@
+"""
+Action Timing
+Records a timing span for every page-object action (see pages/instrumentation.py)
+
+USAGE:
+pytest --timing-log=spans.jsonl                     # record + summary table
+python -m plugins.action_timing spans.jsonl         # summary of an old run
+
+ONE SPAN (one JSON line):
+{"action": "LoginPage.perform_login", "parent": null, "duration_ms": 812.4,
+ "ok": true, "error": null, "test": "tests/test_login.py::test_...",
+ "locale": "en-US", "worker": "gw0", "profile": "perf", "url": "http://127.0.0.1:8000/",
+ "navigated": true, "browser": {"navigation": {...}, "paint": {...}}}
+
+READING IT:
+- browser.navigation.ttfb high        -> the site is slow
+- load - response_end high            -> the browser (scripts, images)
+- duration_ms far above browser.load  -> our own waits
+"""
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from config.profiles import get_active_profile
+from pages.instrumentation import add_action_listener, remove_action_listener
+from pages.timing import TIMING_JS
+from utils.stats import percentile
+
+PERCENTILES = (50, 95, 99)
+
+
+def summarize(spans):
+    """
+    Per-action statistics
+
+    RETURNS: {action: {"count", "failed", "p50", "p95", "p99"}} (ms)
+    """
+    durations = defaultdict(list)
+    failed = defaultdict(int)
+    for span in spans:
+        durations[span["action"]].append(span["duration_ms"])
+        if not span["ok"]:
+            failed[span["action"]] += 1
+    return {
+        name: {
+            "count": len(values),
+            "failed": failed[name],
+            **{f"p{pct}": percentile(values, pct) for pct in PERCENTILES},
+        }
+        for name, values in sorted(durations.items())
+    }
+
+
+def read_spans(path):
+    with open(path, encoding="utf-8") as stream:
+        return [json.loads(line) for line in stream if line.strip()]
+
+
+def format_summary(summary):
+    """Plain text table, slowest p95 first"""
+    width = max([len("action")] + [len(name) for name in summary])
+    lines = [f"{'action':<{width}}  {'count':>5}  {'failed':>6}  {'p50':>9}  {'p95':>9}  {'p99':>9}"]
+    for name, stats in sorted(summary.items(), key=lambda item: -item[1]["p95"]):
+        lines.append(
+            f"{name:<{width}}  {stats['count']:>5}  {stats['failed']:>6}  "
+            + "  ".join(f"{stats[f'p{pct}']:>7.1f}ms" for pct in PERCENTILES)
+        )
+    return "\n".join(lines)
+
+
+class SpanRecorder:
+    """
+    Action listener that appends one JSON line per span
+
+    TAGS: Set per test by the plugin (test id, locale, worker, profile)
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.tags = {"test": None, "locale": None, "worker": None, "profile": get_active_profile()}
+        self._lock = threading.Lock()
+        # Enclosing action, so nested spans (navigate inside navigate_to_home) are told apart
+        self._current = contextvars.ContextVar(f"current_action_{id(self)}", default=None)
+
+    def before(self, page_object, name):
+        parent = self._current.get()
+        return {
+            "page": page_object.page,
+            "name": name,
+            "parent": parent,
+            "token": self._current.set(name),
+            "url": page_object.page.url,
+            "loads": self._watch_navigations(page_object.page),
+            "start": time.time(),
+            "perf": time.perf_counter(),
+        }
+
+    def after(self, state, error):
+        duration = time.perf_counter() - state["perf"]
+        navigated = self._navigated(state)
+        browser = None
+        if navigated:
+            try:
+                browser = state["page"].evaluate(TIMING_JS)
+            except Exception:
+                pass  # page closed or mid-navigation; wall time is still useful
+        self._finish(state, duration, error, navigated, browser)
+
+    async def after_async(self, state, error):
+        duration = time.perf_counter() - state["perf"]
+        navigated = self._navigated(state)
+        browser = None
+        if navigated:
+            try:
+                browser = await state["page"].evaluate(TIMING_JS)
+            except Exception:
+                pass
+        self._finish(state, duration, error, navigated, browser)
+
+    @staticmethod
+    def _watch_navigations(page):
+        """
+        Count main-frame navigations during the action (framenavigated)
+
+        Catches what a URL comparison misses: reloads, same-URL
+        navigations and form posts back to the same page
+
+        RETURNS: (listener, loads list), or None for pages without
+        events (HttpPage)
+        """
+        if not hasattr(page, "on"):
+            return None
+        loads = []
+
+        def listener(frame):
+            if frame.parent_frame is None:
+                loads.append(frame.url)
+
+        page.on("framenavigated", listener)
+        return listener, loads
+
+    @staticmethod
+    def _navigated(state):
+        # Browser timings only change when a new document loaded
+        if state["loads"] is None:
+            return state["page"].url != state["url"]
+        listener, loads = state["loads"]
+        state["page"].remove_listener("framenavigated", listener)
+        return bool(loads)
+
+    def _finish(self, state, duration, error, navigated, browser):
+        self._current.reset(state["token"])
+        span = {
+            "action": state["name"],
+            "parent": state["parent"],
+            "start": round(state["start"], 3),
+            "duration_ms": round(duration * 1000, 1),
+            "ok": error is None,
+            "error": f"{type(error).__name__}: {error}"[:200] if error else None,
+            **self.tags,
+            "url": state["page"].url,
+            "navigated": navigated,
+            "browser": browser,
+        }
+        line = json.dumps(span) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as stream:
+            stream.write(line)
+
+
+class ActionTimingPlugin:
+    """Tags spans with the running test and prints the summary"""
+
+    def __init__(self, config, recorder):
+        self.config = config
+        self.recorder = recorder
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        callspec = getattr(item, "callspec", None)
+        locale = callspec.params.get("locale") if callspec else None
+        self.recorder.tags.update(
+            test=item.nodeid,
+            locale=locale or self.config.getoption("--locale", default=None),
+            worker=os.environ.get("PYTEST_XDIST_WORKER", "main"),
+            profile=get_active_profile(),
+        )
+
+    def pytest_unconfigure(self):
+        remove_action_listener(self.recorder)
+
+
+# ============ PYTEST HOOKS ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("action timing")
+    group.addoption(
+        "--timing-log",
+        action="store",
+        default=None,
+        help="Write page-object action timing spans to this JSONL file"
+    )
+
+
+def pytest_configure(config):
+    path = config.getoption("--timing-log")
+    if not path:
+        return
+    path = Path(config.rootpath) / path
+    if not hasattr(config, "workerinput"):
+        # Controller starts a fresh file; xdist workers append to it
+        path.write_text("", encoding="utf-8")
+    recorder = SpanRecorder(path)
+    add_action_listener(recorder)
+    config.pluginmanager.register(ActionTimingPlugin(config, recorder), "action-timing")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    path = config.getoption("--timing-log")
+    if not path or hasattr(config, "workerinput"):
+        return
+    spans = read_spans(Path(config.rootpath) / path)
+    if spans:
+        profiles = ", ".join(sorted({str(span.get("profile")) for span in spans}))
+        terminalreporter.write_sep("=", f"action timing (profile: {profiles})")
+        terminalreporter.write_line(format_summary(summarize(spans)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m plugins.action_timing SPANS.jsonl")
+    print(format_summary(summarize(read_spans(sys.argv[1]))))
@@ -0,0 +1,134 @@
+"""
+Artifact Pipeline Plugin
+Finalizes test videos on background threads instead of in teardown
+
+USAGE:
+pytest --video=retain-on-failure --artifact-pipeline
+pytest --profile=ci                     # ci turns the pipeline on
+
+WHAT CHANGES:
+- pytest-playwright's own video handling is switched off
+  (it copies and deletes every video before the next test starts)
+- Pages record into .artifacts-recording/ and utils/artifacts.py
+  keeps or drops the videos in the background
+- <output>/manifest.json lists the artifacts of every failed test
+
+Screenshots and traces are still taken by pytest-playwright: both
+need the page/context alive, so they can't leave teardown.
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from utils.artifacts import ArtifactPipeline, set_active_pipeline, write_manifest
+
+RECORDING_DIR = ".artifacts-recording"
+
+
+def _worker_id():
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def _output_dir(config):
+    return Path(os.path.abspath(config.getoption("--output")))
+
+
+class ArtifactPipelinePlugin:
+    """Hands every finished test to the pipeline"""
+
+    def __init__(self, config, pipeline):
+        self.config = config
+        self.pipeline = pipeline
+        self.failed = set()
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self.failed.add(report.nodeid)
+        if report.when == "teardown":
+            # After pytest-playwright moved screenshots/traces into the folder
+            self.pipeline.finish_test(report.nodeid, failed=report.nodeid in self.failed)
+            self.failed.discard(report.nodeid)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self):
+        manifest = self.pipeline.close()
+        set_active_pipeline(None)
+        name = "manifest.json" if _worker_id() == "main" else f"manifest-{_worker_id()}.json"
+        if manifest:
+            write_manifest(_output_dir(self.config) / name, manifest)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        stats = self.pipeline.stats
+        terminalreporter.write_line(
+            f"🎞️ videos kept: {stats['kept']}, dropped: {stats['discarded']}, "
+            f"teardown blocked on a full queue: {stats['blocked_seconds']:.2f}s"
+        )
+
+
+# ============ PYTEST HOOKS ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("artifact pipeline")
+    group.addoption(
+        "--artifact-pipeline",
+        action="store_true",
+        help="Keep/drop videos on background threads and index failed tests' artifacts"
+    )
+    group.addoption(
+        "--artifact-workers",
+        action="store",
+        type=int,
+        default=2,
+        help="Background threads per pytest process (default: 2)"
+    )
+    group.addoption(
+        "--artifact-queue-size",
+        action="store",
+        type=int,
+        default=16,
+        help="Finished tests that may wait for the threads before teardown blocks (default: 16)"
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--artifact-pipeline") or config.getoption("--protocol", "browser") == "http":
+        return
+    if not hasattr(config.option, "artifact_video"):
+        # Remembered as an option so xdist workers receive it too
+        config.option.artifact_video = config.getoption("--video")
+    config.option.video = "off"
+    if not hasattr(config, "workerinput"):
+        # Don't report an earlier run's failures
+        for old in _output_dir(config).glob("manifest*.json"):
+            old.unlink()
+        if config.getoption("dist", "no") != "no":
+            return  # xdist controller: its workers run the tests
+
+    pipeline = ArtifactPipeline(
+        Path(config.rootpath) / RECORDING_DIR / _worker_id(),
+        keep_videos=config.option.artifact_video,
+        workers=config.getoption("--artifact-workers"),
+        max_pending=config.getoption("--artifact-queue-size"),
+    )
+    set_active_pipeline(pipeline)
+    config.pluginmanager.register(ArtifactPipelinePlugin(config, pipeline), "artifact-pipeline")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--artifact-pipeline") or hasattr(config, "workerinput"):
+        return
+    output = _output_dir(config)
+    parts = sorted(output.glob("manifest-*.json"))
+    if parts:
+        # xdist: merge what each worker indexed
+        entries = [entry for part in parts for entry in json.loads(part.read_text(encoding="utf-8"))]
+        write_manifest(output / "manifest.json", entries)
+        for part in parts:
+            part.unlink()
+    manifest = output / "manifest.json"
+    if manifest.exists():
+        entries = json.loads(manifest.read_text(encoding="utf-8"))
+        terminalreporter.write_sep("=", "artifacts")
+        terminalreporter.write_line(f"{len(entries)} failed test(s) indexed in {manifest}")
@@ -0,0 +1,158 @@
+"""
+Duration-Aware Sharding
+Splits tests across pytest-xdist workers using recorded test durations
+
+USAGE:
+pytest --store-durations             # record timings only
+pytest -n 4 --shard-by-duration      # record + balance workers
+
+HOW:
+- Each test's setup + call + teardown time goes to .test_durations.json
+- Longest-processing-time-first (LPT): slowest test goes to the
+  least loaded worker, repeat
+- Each shard becomes one xdist_group, run with --dist=loadgroup
+"""
+import heapq
+import json
+import os
+import re
+import statistics
+from pathlib import Path
+
+import pytest
+
+DEFAULT_DURATIONS_FILE = ".test_durations.json"
+# Weight of the newest run when updating a stored duration
+SMOOTHING = 0.5
+# Used for tests we have never timed when there is no history at all
+FALLBACK_DURATION = 1.0
+# xdist appends "@<group>" to node ids under --dist=loadgroup
+SHARD_SUFFIX = re.compile(r"@shard\d+$")
+
+
+class DurationStore:
+    """
+    Persistent {test id: seconds} timings
+
+    USAGE:
+    store = DurationStore(".test_durations.json")
+    store.add("tests/test_cart.py::test_remove_from_cart[chromium]", 2.4)
+    store.save()
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.durations = {}
+        if self.path.exists():
+            self.durations = json.loads(self.path.read_text(encoding="utf-8"))
+        self._measured = {}
+
+    def estimate(self, nodeid):
+        """Known duration, else the median of everything we know"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return FALLBACK_DURATION
+
+    def add(self, nodeid, seconds):
+        """Add one phase (setup/call/teardown) of the current run"""
+        self._measured[nodeid] = self._measured.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        """Blend this run into the history and write it out"""
+        for nodeid, seconds in self._measured.items():
+            previous = self.durations.get(nodeid)
+            if previous is not None:
+                seconds = SMOOTHING * seconds + (1 - SMOOTHING) * previous
+            self.durations[nodeid] = round(seconds, 4)
+        self.path.write_text(
+            json.dumps(self.durations, indent=2, sort_keys=True), encoding="utf-8"
+        )
+
+
+def lpt_shards(durations, workers):
+    """
+    Longest-processing-time-first partition
+
+    PARAMETERS:
+    - durations: {test id: expected seconds}
+    - workers: Number of shards
+
+    RETURNS: {test id: shard index}
+    """
+    loads = [(0.0, shard) for shard in range(workers)]
+    assignment = {}
+    # Ties broken by id so every xdist worker computes the same split
+    for nodeid, seconds in sorted(durations.items(), key=lambda item: (-item[1], item[0])):
+        load, shard = heapq.heappop(loads)
+        assignment[nodeid] = shard
+        heapq.heappush(loads, (load + seconds, shard))
+    return assignment
+
+
+class DurationRecorder:
+    """Collects report durations and saves them when the session ends"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def pytest_runtest_logreport(self, report):
+        # On the xdist controller this sees every worker's reports
+        self.store.add(SHARD_SUFFIX.sub("", report.nodeid), report.duration)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        self.store.save()
+
+
+def _store_path(config):
+    return Path(config.rootpath) / config.getoption("--durations-file")
+
+
+# ============ PYTEST HOOKS ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("duration sharding")
+    group.addoption(
+        "--store-durations",
+        action="store_true",
+        help="Record test durations to the durations file"
+    )
+    group.addoption(
+        "--shard-by-duration",
+        action="store_true",
+        help="Balance pytest-xdist workers by recorded durations (implies --store-durations)"
+    )
+    group.addoption(
+        "--durations-file",
+        action="store",
+        default=DEFAULT_DURATIONS_FILE,
+        help="Where test durations are stored (relative to rootdir)"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--shard-by-duration") and config.getoption("dist", "no") != "no":
+        # Each shard is an xdist_group, so one worker runs it
+        config.option.dist = "loadgroup"
+
+    is_worker = hasattr(config, "workerinput")
+    if not is_worker and (
+        config.getoption("--store-durations") or config.getoption("--shard-by-duration")
+    ):
+        store = DurationStore(_store_path(config))
+        config.pluginmanager.register(DurationRecorder(store), "duration-recorder")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Only workers need groups; runs before xdist appends them to node ids
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 0))
+    if not config.getoption("--shard-by-duration") or workers < 2:
+        return
+
+    store = DurationStore(_store_path(config))
+    shards = lpt_shards({item.nodeid: store.estimate(item.nodeid) for item in items}, workers)
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(f"shard{shards[item.nodeid]}"))
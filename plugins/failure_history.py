@@ -0,0 +1,330 @@
+"""
+Failure History
+SQLite history of every test's outcomes, and a run order that puts likely failures first
+
+USAGE:
+pytest --history                         # record outcomes only
+pytest --history-first                   # record + risky tests first
+pytest --fail-fast-budget=1              # risky tests first + --maxfail=1
+python -m plugins.failure_history        # flakiest / most failing tests
+
+ORDER (--history-first):
+1. Recently failed tests - a failure 1 run ago weighs 1, 2 runs ago 0.5,
+   3 runs ago 0.25...
+2. Recently changed tests - test file content differs from the last
+   recorded run (SHA-1, so a fresh clone changes nothing), or a test
+   never seen before
+3. Everything else, fastest first
+Within a tier, faster tests go first: the red test shows up sooner.
+
+FAILURE SIGNATURE: hash of exception type + crash location + message
+with numbers blanked, so "timeout 5000ms exceeded" and
+"timeout 5012ms exceeded" count as the same failure.
+"""
+import argparse
+import hashlib
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+DEFAULT_HISTORY_DB = ".test_history.sqlite"
+# Runs looked at when scoring recent failures
+RECENT_RUNS = 10
+# Weight of a failure halves with every run since
+DECAY = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    signature TEXT,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results(nodeid, run_id);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+"""
+
+
+def failure_signature(report):
+    """Stable id of how a test failed, or None when it didn't"""
+    if not report.failed:
+        return None
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is None:
+        text = str(report.longrepr).strip().splitlines()
+        location, message = "", text[-1] if text else ""
+    else:
+        location, message = f"{Path(crash.path).name}:{crash.lineno}", crash.message
+    first_line = message.splitlines()[0] if message else ""
+    # pytest -v drops the "AssertionError: " prefix of assert failures
+    first_line = first_line.removeprefix("AssertionError: ")
+    normalized = re.sub(r"\d+", "N", first_line)
+    return hashlib.sha1(f"{location}|{normalized}".encode()).hexdigest()[:12]
+
+
+class FailureHistory:
+    """
+    The SQLite database
+
+    USAGE:
+    history = FailureHistory(".test_history.sqlite")
+    run_id = history.start_run()
+    history.record(run_id, nodeid, "failed", 1.2, signature, message)
+    history.failure_scores()      # {nodeid: recency-weighted failures}
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def start_run(self):
+        with self.db:
+            return self.db.execute("INSERT INTO runs (started) VALUES (?)", (time.time(),)).lastrowid
+
+    def record(self, run_id, nodeid, outcome, duration, signature=None, message=None):
+        """Committed by close(), not per test"""
+        self.db.execute(
+            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)",
+            (run_id, nodeid, outcome, duration, signature, message),
+        )
+
+    def record_file(self, path, digest):
+        """Content hash of a test file as of this run"""
+        self.db.execute("INSERT OR REPLACE INTO files VALUES (?, ?)", (path, digest))
+
+    def file_digests(self):
+        """{test file path: content hash at its last recorded run}"""
+        return dict(self.db.execute("SELECT path, digest FROM files"))
+
+    def failure_scores(self, recent_runs=RECENT_RUNS):
+        """{nodeid: sum of DECAY ** (runs ago)} over recent failures"""
+        run_ids = [row[0] for row in self.db.execute(
+            "SELECT DISTINCT run_id FROM results ORDER BY run_id DESC LIMIT ?", (recent_runs,)
+        )]
+        age = {run_id: index for index, run_id in enumerate(run_ids)}
+        scores = {}
+        if not run_ids:
+            return scores
+        placeholders = ",".join("?" * len(run_ids))
+        rows = self.db.execute(
+            f"SELECT nodeid, run_id FROM results WHERE outcome = 'failed' AND run_id IN ({placeholders})",
+            run_ids,
+        )
+        for nodeid, run_id in rows:
+            scores[nodeid] = scores.get(nodeid, 0.0) + DECAY ** age[run_id]
+        return scores
+
+    def durations(self):
+        """{nodeid: average duration}"""
+        return dict(self.db.execute("SELECT nodeid, AVG(duration) FROM results GROUP BY nodeid"))
+
+    def known(self):
+        return {row[0] for row in self.db.execute("SELECT DISTINCT nodeid FROM results")}
+
+    def summary(self, limit=20):
+        """
+        Worst tests first: [(nodeid, runs, failures, distinct signatures, flaky)]
+
+        flaky = both passed and failed in the recorded runs
+        """
+        return self.db.execute(
+            """
+            SELECT nodeid,
+                   COUNT(*) AS runs,
+                   SUM(outcome = 'failed') AS failures,
+                   COUNT(DISTINCT signature) AS signatures,
+                   SUM(outcome = 'passed') > 0 AND SUM(outcome = 'failed') > 0 AS flaky
+            FROM results
+            GROUP BY nodeid
+            HAVING failures > 0
+            ORDER BY failures DESC, runs DESC, nodeid
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+
+
+def prioritize(nodeids, failure_scores, changed, durations):
+    """
+    Run order for --history-first
+
+    PARAMETERS:
+    - nodeids: collected test ids, in collection order
+    - failure_scores: {nodeid: recency-weighted failures}
+    - changed: ids of new tests or tests whose file changed
+    - durations: {nodeid: seconds}
+
+    RETURNS: nodeids, reordered (stable: ties keep collection order)
+    """
+    def key(nodeid):
+        score = failure_scores.get(nodeid, 0.0)
+        tier = 0 if score else 1 if nodeid in changed else 2
+        return tier, -score, durations.get(nodeid, 0.0)
+    return sorted(nodeids, key=key)
+
+
+def file_digest(path):
+    """SHA-1 of a file's content (None if it's gone)"""
+    try:
+        return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def changed_tests(nodeids, known, stored_digests, root):
+    """
+    Ids of tests that are new, or whose file's content changed since
+    it was last recorded (files never hashed count as changed)
+    """
+    digests = {}
+    changed = set()
+    for nodeid in nodeids:
+        path = nodeid.split("::")[0]
+        if path not in digests:
+            digests[path] = file_digest(Path(root) / path)
+        if nodeid not in known or stored_digests.get(path) != digests[path]:
+            changed.add(nodeid)
+    return changed
+
+
+class HistoryRecorder:
+    """Records every test's outcome (on the xdist controller: every worker's)"""
+
+    def __init__(self, config, history):
+        self.config = config
+        self.history = history
+        self.run_id = history.start_run()
+        self.phases = {}
+        self.files = set()
+
+    def pytest_runtest_logreport(self, report):
+        entry = self.phases.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0, "report": None})
+        entry["duration"] += report.duration
+        if report.failed and entry["outcome"] != "failed":
+            entry.update(outcome="failed", report=report)
+        elif report.skipped and report.when != "teardown" and entry["outcome"] == "passed":
+            entry["outcome"] = "skipped"
+        if report.when != "teardown":
+            return
+
+        entry = self.phases.pop(report.nodeid)
+        failed = entry["report"]
+        crash = getattr(getattr(failed, "longrepr", None), "reprcrash", None)
+        self.history.record(
+            self.run_id, report.nodeid, entry["outcome"], entry["duration"],
+            failure_signature(failed) if failed else None,
+            crash.message.splitlines()[0][:300] if crash and crash.message else None,
+        )
+        self.files.add(report.nodeid.split("::")[0])
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        for path in sorted(self.files):
+            digest = file_digest(Path(self.config.rootpath) / path)
+            if digest:
+                self.history.record_file(path, digest)
+        self.history.close()
+
+
+def _db_path(config):
+    return Path(config.rootpath) / config.getoption("--history-db")
+
+
+# ============ PYTEST HOOKS ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("failure history")
+    group.addoption(
+        "--history",
+        action="store_true",
+        help="Record test outcomes, durations and failure signatures in the history database"
+    )
+    group.addoption(
+        "--history-first",
+        action="store_true",
+        help="Run recently failed, then changed/new, then remaining tests (implies --history)"
+    )
+    group.addoption(
+        "--fail-fast-budget",
+        action="store",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Recently failed/changed tests first and stop after N failures (--history-first + --maxfail=N)"
+    )
+    group.addoption(
+        "--history-db",
+        action="store",
+        default=DEFAULT_HISTORY_DB,
+        help="History database (relative to rootdir)"
+    )
+
+
+def pytest_configure(config):
+    budget = config.getoption("--fail-fast-budget")
+    if budget:
+        # pytest's own stop (xdist's controller reads it too, later in configure)
+        config.option.maxfail = budget
+        config.option.history_first = True
+    if config.getoption("--history-first"):
+        config.option.history = True
+    if config.getoption("--history") and not hasattr(config, "workerinput"):
+        history = FailureHistory(_db_path(config))
+        config.pluginmanager.register(HistoryRecorder(config, history), "history-recorder")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Workers order their own copy; the same database gives the same order
+    if not config.getoption("--history-first") or not _db_path(config).exists():
+        return
+    history = FailureHistory(_db_path(config))
+    try:
+        nodeids = [item.nodeid for item in items]
+        changed = changed_tests(nodeids, history.known(), history.file_digests(), config.rootpath)
+        order = prioritize(nodeids, history.failure_scores(), changed, history.durations())
+    finally:
+        history.close()
+    position = {nodeid: index for index, nodeid in enumerate(order)}
+    items.sort(key=lambda item: position[item.nodeid])
+
+
+def pytest_report_header(config):
+    if config.getoption("--history-first"):
+        budget = config.getoption("--fail-fast-budget")
+        stop = f", stop after {budget} failure(s)" if budget else ""
+        return f"history: recently failed/changed tests first{stop}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tests that fail most, from the failure history")
+    parser.add_argument("--db", default=DEFAULT_HISTORY_DB)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    if not Path(args.db).exists():
+        raise SystemExit(f"No history at {args.db}; run pytest --history first")
+    history = FailureHistory(args.db)
+    for nodeid, runs, failures, signatures, flaky in history.summary(args.limit):
+        label = "FLAKY " if flaky else ""
+        print(f"{failures:>4}/{runs:<4} {label}{nodeid} ({signatures} failure signature(s))")
+    history.close()
+
+
+if __name__ == "__main__":
+    main()
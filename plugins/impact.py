@@ -0,0 +1,544 @@
+"""
+Test Impact Analysis
+Runs only the tests that use page-object code changed since a git ref
+
+USAGE:
+pytest --impacted-since=origin/main            # pre-merge: affected tests only
+python -m plugins.impact LoginPage.signup_button
+python -m plugins.impact --since origin/main
+
+HOW (static, from the source - nothing is imported or run):
+- Page objects: every class under pages/, its methods/properties and
+  which of its own (or inherited) members each one uses
+  (CartPage.seed -> CartPage.navigate_to_cart -> BasePage.navigate)
+- Tests: which page-object members a test touches, directly or through
+  its fixtures (conftest's cart_page returns CartPage(page), so
+  cart_page.seed() is CartPage.seed)
+- git diff: changed lines -> changed members, fixtures and tests
+
+A TEST RUNS WHEN:
+- its own code, or a fixture it uses, changed
+- a page-object member it (transitively) uses changed
+- its module imports helpers (utils/...) that use a changed page class
+
+EVERYTHING RUNS (it can't tell) WHEN:
+- other Python code changed (config/, utils/, plugins/, conftest code
+  outside fixtures, module-level code in pages/ without classes)
+- a changed page-object member is used by no test it can see
+- pytest.ini or other non-Markdown files changed
+"""
+import argparse
+import ast
+import subprocess
+from pathlib import Path
+
+PAGES_DIR = "pages"
+TESTS_DIR = "tests"
+# Changes here never affect a test run
+IGNORED_SUFFIXES = (".md", ".txt", ".rst")
+# Helper packages whose page-object use is followed into test modules
+HELPER_DIRS = ("utils",)
+
+
+# ============ AST HELPERS ============
+
+def _parse(path):
+    return ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+
+
+def _span(node):
+    """Lines of a definition, decorators included"""
+    start = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+    return start, node.end_lineno
+
+
+def _fixture_decorator(node):
+    """The @pytest.fixture decorator of a function, or None"""
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if isinstance(target, ast.Attribute) and target.attr == "fixture":
+            return decorator
+        if isinstance(target, ast.Name) and target.id == "fixture":
+            return decorator
+    return None
+
+
+def _is_autouse(decorator):
+    return isinstance(decorator, ast.Call) and any(
+        keyword.arg == "autouse" and getattr(keyword.value, "value", False) for keyword in decorator.keywords
+    )
+
+
+def _functions(tree):
+    return [node for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+
+
+class FunctionUses:
+    """
+    What one function does with page objects
+
+    - uses: {(class, member)} e.g. ("CartPage", "seed")
+    - returns: classes it returns/yields (fixtures)
+    - calls: names of plain functions it calls (module helpers)
+    - requested: fixtures asked for by request.getfixturevalue("...")
+    - returned_names: variables returned/yielded as-is (`yield home_page`)
+    """
+
+    def __init__(self, node, page_classes, env=None):
+        self.uses, self.returns, self.calls, self.requested = set(), set(), set(), set()
+        self.returned_names = set()
+        env = {name: set(classes) for name, classes in (env or {}).items()}
+
+        # Pass 1: variable -> classes (order-independent, good enough for tests)
+        for child in ast.walk(node):
+            if isinstance(child, ast.Assign):
+                for target in child.targets:
+                    self._bind(target, child.value, env, page_classes)
+            elif isinstance(child, ast.AnnAssign) and child.value is not None:
+                self._bind(child.target, child.value, env, page_classes)
+
+        # Pass 2: member uses
+        for child in ast.walk(node):
+            if isinstance(child, ast.Attribute):
+                for cls in self._classes_of(child.value, env, page_classes):
+                    self.uses.add((cls, child.attr))
+            elif isinstance(child, ast.Call) and isinstance(child.func, ast.Name):
+                if child.func.id in page_classes:
+                    self.uses.add((child.func.id, "__init__"))
+                else:
+                    self.calls.add(child.func.id)
+            if (isinstance(child, ast.Call) and isinstance(child.func, ast.Attribute)
+                    and child.func.attr == "getfixturevalue" and child.args
+                    and isinstance(child.args[0], ast.Constant)):
+                self.requested.add(child.args[0].value)
+            if isinstance(child, (ast.Return, ast.Yield)) and child.value is not None:
+                self.returns |= self._classes_of(child.value, env, page_classes)
+                if isinstance(child.value, ast.Name):
+                    self.returned_names.add(child.value.id)
+
+    def _bind(self, target, value, env, page_classes):
+        if isinstance(target, ast.Tuple) and isinstance(value, ast.Tuple):
+            for sub_target, sub_value in zip(target.elts, value.elts):
+                self._bind(sub_target, sub_value, env, page_classes)
+        elif isinstance(target, ast.Name):
+            classes = self._classes_of(value, env, page_classes)
+            if classes:
+                env.setdefault(target.id, set()).update(classes)
+
+    @staticmethod
+    def _classes_of(node, env, page_classes):
+        if isinstance(node, ast.Name):
+            return env.get(node.id, set())
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in page_classes:
+            return {node.func.id}
+        return set()
+
+
+# ============ THE INDEX ============
+
+class ImpactIndex:
+    """
+    Which tests use which page-object members
+
+    USAGE:
+    index = ImpactIndex(".")
+    index.tests_using("LoginPage.signup_button")
+    index.dependencies["tests/test_cart.py::test_remove_from_cart"]
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.classes = {}        # "CartPage" -> {"path", "span", "bases", "members": {name: span}}
+        self.member_uses = {}    # "CartPage.seed" -> {"CartPage.navigate_to_cart", ...}
+        self.fixtures = {}       # (path, name) -> {"span", "params", "uses": FunctionUses}
+        self.tests = {}          # test key -> {"path", "span", "params", "uses": FunctionUses}
+        self.module_classes = {}  # test path -> page classes reached through helper imports
+        self.dependencies = {}   # test key -> {"CartPage.seed", "BasePage.navigate", ...}
+        self.test_fixtures = {}  # test key -> {(path, fixture name)}
+        self._index_pages()
+        self._index_tests()
+        self._resolve()
+
+    def _relative(self, path):
+        return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+
+    # ---------- pages/ ----------
+
+    def _index_pages(self):
+        trees = {}
+        for path in sorted((self.root / PAGES_DIR).rglob("*.py")):
+            trees[self._relative(path)] = tree = _parse(path)
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef):
+                    self.classes[node.name] = {
+                        "path": self._relative(path),
+                        "span": _span(node),
+                        "bases": [base.id for base in node.bases if isinstance(base, ast.Name)],
+                        "members": {},
+                        "node": node,
+                    }
+        names = set(self.classes)
+        for name, info in self.classes.items():
+            for node in info["node"].body:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    info["members"][node.name] = _span(node)
+                    uses = FunctionUses(node, names, env={"self": {name}})
+                    self.member_uses[f"{name}.{node.name}"] = uses.uses
+                elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                    for target in node.targets if isinstance(node, ast.Assign) else [node.target]:
+                        if isinstance(target, ast.Name):
+                            info["members"][target.id] = _span(node)
+
+    def resolve(self, cls, member):
+        """ "CartPage", "navigate" -> "BasePage.navigate" (the class that defines it)"""
+        seen, queue = set(), [cls]
+        while queue:
+            current = queue.pop(0)
+            if current in seen or current not in self.classes:
+                continue
+            seen.add(current)
+            if member in self.classes[current]["members"]:
+                return f"{current}.{member}"
+            queue.extend(self.classes[current]["bases"])
+        return None
+
+    def _closure(self, raw_uses):
+        """Resolved members used, following page-object internals"""
+        found, queue = set(), list(raw_uses)
+        while queue:
+            resolved = self.resolve(*queue.pop())
+            if resolved and resolved not in found:
+                found.add(resolved)
+                queue.extend(self.member_uses.get(resolved, ()))
+        return found
+
+    # ---------- tests/ ----------
+
+    def _index_tests(self):
+        names = set(self.classes)
+        helper_classes = self._helper_classes(names)
+        for path in sorted((self.root / TESTS_DIR).rglob("*.py")):
+            relative = self._relative(path)
+            tree = _parse(path)
+            is_test_module = path.name.startswith("test_")
+            self.module_classes[relative] = set()
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.Import, ast.ImportFrom)):
+                    module = node.module if isinstance(node, ast.ImportFrom) else node.names[0].name
+                    self.module_classes[relative] |= helper_classes.get(module or "", set())
+
+            helpers = {node.name: FunctionUses(node, names) for node in _functions(tree) if _fixture_decorator(node) is None}
+            for node in _functions(tree):
+                params = [arg.arg for arg in node.args.args]
+                decorator = _fixture_decorator(node)
+                if decorator is not None:
+                    self.fixtures[(relative, node.name)] = {
+                        "span": _span(node), "params": params, "uses": FunctionUses(node, names),
+                        "autouse": _is_autouse(decorator),
+                    }
+                elif is_test_module and node.name.startswith("test_"):
+                    self._add_test(f"{relative}::{node.name}", relative, node, params, helpers, names)
+            for node in tree.body:
+                if is_test_module and isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+                    for method in _functions(node):
+                        if method.name.startswith("test_"):
+                            params = [arg.arg for arg in method.args.args[1:]]
+                            key = f"{relative}::{node.name}::{method.name}"
+                            self._add_test(key, relative, method, params, helpers, names)
+
+    def _add_test(self, key, path, node, params, helpers, names):
+        uses = FunctionUses(node, names)
+        for called in uses.calls & set(helpers):
+            uses.uses |= helpers[called].uses
+        self.tests[key] = {"path": path, "span": _span(node), "params": params, "uses": uses, "node": node}
+
+    def _helper_classes(self, names):
+        """{"utils.journeys": {"AsyncHomePage", ...}} for helper modules"""
+        found = {}
+        for directory in HELPER_DIRS:
+            for path in sorted((self.root / directory).rglob("*.py")):
+                module = self._relative(path)[:-3].replace("/", ".")
+                tree = _parse(path)
+                found[module] = {
+                    node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and node.id in names
+                }
+        return found
+
+    def _fixture(self, test_path, name):
+        """Fixture visible from a test module: its own first, then conftest.py files"""
+        folder = Path(test_path).parent
+        candidates = [test_path] + [
+            (parent / "conftest.py").as_posix() for parent in [folder, *folder.parents] if parent.as_posix() != "."
+        ]
+        for candidate in candidates:
+            if (candidate, name) in self.fixtures:
+                return candidate, name
+        return None
+
+    def _fixture_types(self, key, seen=None):
+        """Classes a fixture's value may be (follows `return home_page` into the home_page fixture)"""
+        seen = seen if seen is not None else set()
+        if key is None or key in seen:
+            return set()
+        seen.add(key)
+        fixture = self.fixtures[key]
+        classes = set(fixture["uses"].returns)
+        for param in set(fixture["params"]) & fixture["uses"].returned_names:
+            classes |= self._fixture_types(self._fixture(key[0], param), seen)
+        return classes
+
+    def _resolve(self):
+        names = set(self.classes)
+        for key, test in self.tests.items():
+            fixtures, raw = set(), set(test["uses"].uses)
+            queue = [(test["path"], param) for param in test["params"]] + [
+                (test["path"], name) for name in test["uses"].requested
+            ]
+            env = {}
+            while queue:
+                found = self._fixture(*queue.pop())
+                if found is None or found in fixtures:
+                    continue
+                fixtures.add(found)
+                fixture = self.fixtures[found]
+                raw |= fixture["uses"].uses
+                queue.extend((found[0], param) for param in fixture["params"])
+                queue.extend((found[0], name) for name in fixture["uses"].requested)
+            for param in test["params"]:
+                classes = self._fixture_types(self._fixture(test["path"], param))
+                if classes:
+                    env[param] = classes
+            # Re-read the test with its parameters typed by their fixtures
+            raw |= FunctionUses(test["node"], names, env=env).uses
+            self.test_fixtures[key] = fixtures
+            self.dependencies[key] = self._closure(raw)
+
+    # ---------- queries ----------
+
+    def tests_using(self, member):
+        """Test keys whose dependencies include a member ("LoginPage.signup_button")"""
+        cls, _, name = member.partition(".")
+        resolved = self.resolve(cls, name) or member
+        return sorted(key for key, members in self.dependencies.items() if resolved in members)
+
+    def impacted(self, changes):
+        """
+        Tests to run for a set of changes (see changes_from_diff)
+
+        RETURNS: (test keys, None) or (None, reason to run everything)
+        """
+        if changes["everything"]:
+            return None, changes["everything"]
+        changed_classes = self._with_subclasses(changes["classes"])
+        # HomeLocators.login_link is also AsyncHomePage's, which helpers use
+        touched_classes = changed_classes | self._with_subclasses({member.split(".")[0] for member in changes["members"]})
+        selected = set()
+        for key, test in self.tests.items():
+            members = self.dependencies[key]
+            if (
+                test["path"] in changes["modules"]
+                or any(self._overlaps(test["span"], lines) for lines in changes["lines"].get(test["path"], []))
+                or self.test_fixtures[key] & changes["fixtures"]
+                or members & changes["members"]
+                or {member.split(".")[0] for member in members} & changed_classes
+                or self.module_classes.get(test["path"], set()) & touched_classes
+            ):
+                selected.add(key)
+
+        used = set().union(*self.dependencies.values())
+        helper_used = set().union(*self.module_classes.values())
+        for member in sorted(changes["members"]):
+            if member not in used and not self._with_subclasses({member.split(".")[0]}) & helper_used:
+                # Unused, or used in a way this can't see (getattr, another package...)
+                return None, f"{member} changed and no test visibly uses it"
+        return selected, None
+
+    def _with_subclasses(self, classes):
+        found = set(classes)
+        grew = True
+        while grew:
+            subclasses = {name for name, info in self.classes.items() if found & set(info["bases"])}
+            grew = not subclasses <= found
+            found |= subclasses
+        return found
+
+    @staticmethod
+    def _overlaps(span, lines):
+        start, end = lines
+        return start <= span[1] and end >= span[0]
+
+    # ---------- git diff -> changes ----------
+
+    def changes_from_diff(self, changed_lines):
+        """
+        {path: [(first, last) changed line ranges, or None for the whole file]}
+        -> {"members", "classes", "fixtures", "modules", "lines", "everything"}
+        """
+        changes = {"members": set(), "classes": set(), "fixtures": set(), "modules": set(),
+                   "lines": {}, "everything": None}
+        for path, ranges in sorted(changed_lines.items()):
+            if path.endswith(IGNORED_SUFFIXES):
+                continue
+            if path.startswith(f"{TESTS_DIR}/snapshots/"):
+                # Visual baselines: tests using the snapshot fixture
+                changes["fixtures"] |= {key for key in self.fixtures if key[1] == "visual_snapshot"}
+                continue
+            if not (self.root / path).exists():
+                changes["everything"] = f"{path} was deleted"
+                break
+            if path.startswith(f"{PAGES_DIR}/") and path.endswith(".py"):
+                reason = self._page_changes(path, ranges, changes)
+            elif path.startswith(f"{TESTS_DIR}/") and path.endswith(".py"):
+                reason = self._test_changes(path, ranges, changes)
+            else:
+                reason = f"{path} changed"
+            if reason:
+                changes["everything"] = reason
+                break
+        return changes
+
+    def _page_changes(self, path, ranges, changes):
+        classes = [name for name, info in self.classes.items() if info["path"] == path]
+        if not classes:
+            return f"{path} changed (page-object infrastructure)"
+        for lines in ranges:
+            if lines is None:
+                changes["classes"] |= set(classes)
+                continue
+            hit_class = False
+            for name in classes:
+                info = self.classes[name]
+                if not self._overlaps(info["span"], lines):
+                    continue
+                hit_class = True
+                members = [member for member, span in info["members"].items() if self._overlaps(span, lines)]
+                if members:
+                    changes["members"] |= {f"{name}.{member}" for member in members}
+                else:
+                    changes["classes"].add(name)  # Class line or docstring: all of it
+            if not hit_class:
+                changes["classes"] |= set(classes)  # Imports / module constants
+        return None
+
+    def _test_changes(self, path, ranges, changes):
+        is_conftest = Path(path).name == "conftest.py"
+        fixtures = {key: fixture for key, fixture in self.fixtures.items() if key[0] == path}
+        tests = [test for test in self.tests.values() if test["path"] == path]
+        for lines in ranges:
+            if lines is None:
+                if is_conftest:
+                    return f"{path} is new"
+                changes["modules"].add(path)
+                continue
+            touched = {key for key, fixture in fixtures.items() if self._overlaps(fixture["span"], lines)}
+            autouse = sorted(name for key_path, name in touched if fixtures[(key_path, name)]["autouse"])
+            if autouse:
+                return f"autouse fixture {autouse[0]} changed ({path})"
+            changes["fixtures"] |= touched
+            in_test = any(self._overlaps(test["span"], lines) for test in tests)
+            if in_test:
+                changes["lines"].setdefault(path, []).append(lines)
+            elif not touched:
+                if is_conftest:
+                    return f"{path} changed outside fixtures"
+                changes["modules"].add(path)  # Imports, helpers, module-level code
+        return None
+
+
+def git_changed_lines(root, ref):
+    """
+    {path: [(first, last), ...]} changed between ref and the working tree
+    (untracked files count as changed entirely: [None])
+    """
+    diff = subprocess.run(
+        ["git", "diff", "--unified=0", "--no-color", "--no-ext-diff", ref, "--"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    changed, path = {}, None
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            path = None if line == "+++ /dev/null" else line[6:]
+        elif line.startswith("--- ") and path is None:
+            continue
+        elif line.startswith("diff --git "):
+            # Deleted files only have "--- a/<path>"
+            path = line.split(" b/", 1)[-1]
+            changed.setdefault(path, [])
+        elif line.startswith("@@") and path:
+            new = line.split("+", 1)[1].split(" ", 1)[0]
+            start, _, count = new.partition(",")
+            start, count = int(start), int(count or 1)
+            # Pure deletions (count 0) touch the lines around the cut
+            changed[path].append((start, start + count - 1) if count else (start, start + 1))
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    for path in untracked.splitlines():
+        changed[path] = [None]
+    for path, ranges in changed.items():
+        if not ranges:
+            ranges.append(None)  # Binary, mode or rename-only change
+    return changed
+
+
+# ============ PYTEST HOOKS ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("test impact")
+    group.addoption(
+        "--impacted-since",
+        action="store",
+        default=None,
+        metavar="REF",
+        help="Only run tests affected by changes since this git ref (e.g. origin/main)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    ref = config.getoption("--impacted-since")
+    if not ref:
+        return
+    index = ImpactIndex(config.rootpath)
+    selected, everything = index.impacted(index.changes_from_diff(git_changed_lines(config.rootpath, ref)))
+    config._impact_summary = everything or f"{len(selected)} affected test function(s) since {ref}"
+    if selected is None:
+        return
+    keep = [item for item in items if item.nodeid.split("[")[0] in selected]
+    dropped = [item for item in items if item.nodeid.split("[")[0] not in selected]
+    if dropped:
+        config.hook.pytest_deselected(items=dropped)
+        items[:] = keep
+
+
+def pytest_report_collectionfinish(config):
+    summary = getattr(config, "_impact_summary", None)
+    if summary:
+        return f"impact: {summary}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Which tests use which page-object members")
+    parser.add_argument("member", nargs="*", help='e.g. "LoginPage.signup_button"')
+    parser.add_argument("--since", help="List the tests affected by changes since this git ref")
+    parser.add_argument("--root", default=".")
+    args = parser.parse_args()
+
+    index = ImpactIndex(args.root)
+    if args.since:
+        selected, everything = index.impacted(index.changes_from_diff(git_changed_lines(args.root, args.since)))
+        if everything:
+            print(f"Everything runs: {everything}")
+            return
+        print(f"{len(selected)} affected test(s) since {args.since}:")
+        for key in sorted(selected):
+            print(f"   {key}")
+    for member in args.member:
+        tests = index.tests_using(member)
+        print(f"{member}: {len(tests)} test(s)")
+        for key in tests:
+            print(f"   {key}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Locale Matrix Reduction
+Runs a covering subset of locale × browser cases instead of all of them
+
+WHY THIS EXISTS:
+- @pytest.mark.locale_matrix tests run once per locale, and again per
+  --browser: 8 locales × 3 browsers = 24 sessions per test
+- Many locales format alike (5 write dates with "/", 4 put the
+  currency symbol after the amount...)
+
+MODES (--locale-matrix):
+- each (default): every attribute value (and every browser) runs at
+  least once - 8 locales × 3 browsers -> 6 cases
+- pairwise: every PAIR of values that occurs in the full matrix runs,
+  e.g. "rtl=True" with "browser=webkit". Locales with a value of their
+  own (ja-JP's 0-decimal yen, de-DE's "." dates) must then run on
+  every browser - 8 × 3 -> 20 cases
+- full: every locale on every browser (nothing deselected)
+
+ATTRIBUTES: Formatting shape from config/locale_registry.py plus the
+browser ("€" after the amount and "﷼" after the amount count as one
+value). Timezones are compared by region (Europe/..., Asia/...):
+every locale has its own zone, so exact zones would keep everything.
+
+REPORT: The terminal summary lists the cases kept and how many
+attribute pairs they cover.
+"""
+import re
+from itertools import combinations
+
+from config.locale_registry import LOCALE_REGISTRY
+
+MODES = {"each": 1, "pairwise": 2, "full": None}
+DEFAULT_MODE = "each"
+
+# What a locale changes in the page, by shape ("€" and "$" format alike)
+ATTRIBUTES = {
+    "currency": lambda record: f"{record.currency_position}/{record.currency_decimals}dp",
+    "decimal": lambda record: record.decimal_separator,
+    "thousands": lambda record: record.thousands_separator,
+    "date_order": lambda record: "".join(token[0] for token in re.findall("YYYY|MM|DD", record.date_format)),
+    "date_separator": lambda record: next(char for char in record.date_format if not char.isalpha()),
+    "rtl": lambda record: record.rtl,
+    "timezone": lambda record: record.timezone.split("/")[0],
+}
+
+
+def case_factors(locale, browser):
+    """(attribute, value) pairs a locale × browser case exercises"""
+    record = LOCALE_REGISTRY[locale]
+    factors = [(name, read(record)) for name, read in ATTRIBUTES.items()]
+    if browser is not None:
+        factors.append(("browser", browser))
+    return factors
+
+
+def combinations_of(cases, strength):
+    """Every strength-sized set of (attribute, value) the cases exercise"""
+    return {
+        combo
+        for case in cases
+        for combo in combinations(case_factors(*case), strength)
+    }
+
+
+def covering_cases(cases, strength):
+    """
+    Greedy covering subset of cases
+
+    PARAMETERS:
+    - cases: [(locale, browser or None)], the full matrix
+    - strength: 1 (each value) or 2 (pairwise)
+
+    RETURNS: Cases that together exercise every combination the full
+    matrix does, in the input order. Greedy set cover: not always the
+    smallest subset, but deterministic, so xdist workers agree.
+    """
+    uncovered = combinations_of(cases, strength)
+    chosen = []
+    while uncovered:
+        best = max(
+            cases,
+            key=lambda case: len(uncovered & combinations_of([case], strength))
+        )
+        chosen.append(best)
+        uncovered -= combinations_of([best], strength)
+    return [case for case in cases if case in chosen]
+
+
+def _case_of(item):
+    callspec = getattr(item, "callspec", None)
+    if callspec is None or "locale" not in callspec.params:
+        return None
+    return callspec.params["locale"], callspec.params.get("browser_name")
+
+
+# ============ PYTEST HOOKS ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("locale matrix")
+    group.addoption(
+        "--locale-matrix",
+        action="store",
+        default=DEFAULT_MODE,
+        choices=tuple(MODES),
+        help="@pytest.mark.locale_matrix tests: covering subset of locale × browser (default: each), or full"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    strength = MODES[config.getoption("--locale-matrix")]
+    if strength is None:
+        return
+
+    # One reduction per test function (its own locales × browsers)
+    matrices = {}
+    for item in items:
+        case = _case_of(item)
+        if case and item.get_closest_marker("locale_matrix"):
+            cases = matrices.setdefault(item.originalname, [])
+            if case not in cases:
+                cases.append(case)
+    if not matrices:
+        return
+    keep = {name: set(covering_cases(cases, strength)) for name, cases in matrices.items()}
+
+    selected, deselected = [], []
+    for item in items:
+        name = getattr(item, "originalname", None)
+        if name in keep and _case_of(item) not in keep[name]:
+            deselected.append(item)
+        else:
+            selected.append(item)
+            if name in keep:
+                # Travels with the report, also from xdist workers
+                item.user_properties.append(("locale_matrix", {"case": _case_of(item), "matrix": matrices[name]}))
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    mode = config.getoption("--locale-matrix")
+    ran, matrices = {}, {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "call":
+                continue
+            for key, value in getattr(report, "user_properties", ()):
+                if key == "locale_matrix":
+                    test = report.nodeid.split("[")[0]
+                    ran.setdefault(test, []).append(tuple(value["case"]))
+                    matrices[test] = [tuple(case) for case in value["matrix"]]
+    if not ran:
+        return
+
+    terminalreporter.write_sep("=", f"locale matrix ({mode})")
+    for test, cases in sorted(ran.items()):
+        possible = combinations_of(matrices[test], 2)
+        covered = combinations_of(cases, 2)
+        terminalreporter.write_line(
+            f"{test}: {len(cases)} of {len(matrices[test])} locale × browser cases, "
+            f"{len(covered)}/{len(possible)} attribute pairs covered"
+        )
+        for locale, browser in sorted(cases, key=lambda case: (case[0], case[1] or "")):
+            values = ", ".join(f"{name}={value!r}" for name, value in case_factors(locale, None))
+            terminalreporter.write_line(f"   {locale:<6} {browser or '':<9} {values}")
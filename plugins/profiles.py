@@ -0,0 +1,92 @@
+"""
+Execution Profiles Plugin
+Applies a named profile from config/profiles.py to pytest-playwright and xdist options
+
+USAGE:
+pytest --profile=perf
+TEST_PROFILE=ci pytest
+pytest --profile=ci --headed      # explicit flags win over the profile
+
+RECORDED IN:
+- The report header ("profile: perf (...)")
+- Every action timing span (plugins/action_timing.py)
+"""
+import os
+import shlex
+
+import pytest
+from playwright.sync_api import expect
+
+from config.profiles import (
+    DEFAULT_PROFILE,
+    PROFILES,
+    get_active_profile,
+    get_profile,
+    set_active_profile,
+)
+
+# profile key -> (option dest, command-line spellings)
+PROFILE_OPTIONS = {
+    "headed": ("headed", ("--headed",)),
+    "slowmo": ("slowmo", ("--slowmo",)),
+    "screenshot": ("screenshot", ("--screenshot",)),
+    "video": ("video", ("--video",)),
+    "tracing": ("tracing", ("--tracing",)),
+    "workers": ("numprocesses", ("-n", "--numprocesses")),
+    "artifact_pipeline": ("artifact_pipeline", ("--artifact-pipeline",)),
+}
+
+def explicit_dests(args):
+    """Option dests the user spelled out (command line or PYTEST_ADDOPTS)"""
+    given = set()
+    for arg in args:
+        for dest, flags in PROFILE_OPTIONS.values():
+            for flag in flags:
+                # "--video=on", "--video on", "-n4", "-n 4"
+                if arg == flag or arg.startswith(f"{flag}=") or (flag == "-n" and arg.startswith("-n")):
+                    given.add(dest)
+    return given
+
+
+# ============ PYTEST HOOKS ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("profiles")
+    group.addoption(
+        "--profile",
+        action="store",
+        default=None,
+        choices=sorted(PROFILES),
+        help=f"Execution profile (default: TEST_PROFILE env var, else {DEFAULT_PROFILE})"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    # Before xdist turns --numprocesses into workers
+    name = config.getoption("--profile") or os.environ.get("TEST_PROFILE") or DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise pytest.UsageError(f"TEST_PROFILE={name!r} is not one of {sorted(PROFILES)}")
+    config.option.profile = name
+    set_active_profile(name)
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return  # Workers get the controller's final options
+
+    args = list(config.invocation_params.args) + shlex.split(os.environ.get("PYTEST_ADDOPTS", ""))
+    given = explicit_dests(args)
+    for key, (dest, _) in PROFILE_OPTIONS.items():
+        value = get_profile(name)[key]
+        if value is None or dest in given or not hasattr(config.option, dest):
+            continue
+        setattr(config.option, dest, value)
+
+
+def pytest_configure(config):
+    if config.getoption("--profile"):
+        set_active_profile(config.getoption("--profile"))
+    expect.set_options(timeout=get_profile(get_active_profile())["expect_timeout_ms"])
+
+
+def pytest_report_header(config):
+    name = get_active_profile()
+    return f"profile: {name} ({get_profile(name)['description']})"
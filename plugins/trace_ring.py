@@ -0,0 +1,207 @@
+"""
+Trace Ring Buffer
+Traces every page-object action, keeps only the last few, writes them only on failure
+
+USAGE:
+pytest --trace-ring                                 # last 10 actions / 30 seconds
+pytest --trace-ring --trace-ring-actions=5 --trace-ring-seconds=10 tests/test_cart.py
+
+WHAT YOU GET (failed tests only):
+test-results/<test>/trace-ring/
+    01-CartPage.navigate.zip
+    02-test-code.zip                ← your code between two actions
+    03-CartPage.proceed_to_checkout.zip
+    04-test-code.zip                ← the failing assertion
+    playwright show-trace test-results/<test>/trace-ring/04-test-code.zip
+
+HOW:
+- Tracing starts once per context; every page-object action (see
+  pages/instrumentation.py) is one trace chunk (start_chunk/stop_chunk)
+- Code between actions gets its own chunk, so assertions are covered
+- Chunks are kept as bytes in a bounded deque, newest last
+- Green tests drop the deque; nothing reaches the disk
+
+COST: Snapshots are still taken while tracing, so this is cheaper
+than --tracing=on (no per-test trace file) but not free.
+"""
+import os
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Page
+from slugify import slugify
+
+from pages.instrumentation import add_action_listener, remove_action_listener
+
+BETWEEN_ACTIONS = "test-code"
+
+
+class TraceRing:
+    """
+    Last max_actions actions plus the test code around them
+    (2 * max_actions + 1 chunks), none older than max_seconds
+
+    USAGE:
+    ring = TraceRing(max_actions=10, max_seconds=30)
+    ring.add("LoginPage.perform_login", zip_bytes)
+    ring.chunks()    # [(label, finished_at, bytes)], oldest first
+    """
+
+    def __init__(self, max_actions=10, max_seconds=30.0, clock=time.monotonic):
+        self.max_seconds = max_seconds
+        self.clock = clock
+        self._chunks = deque(maxlen=2 * max_actions + 1)
+
+    def add(self, label, data):
+        self._chunks.append((label, self.clock(), data))
+
+    def chunks(self):
+        oldest = self.clock() - self.max_seconds
+        return [chunk for chunk in self._chunks if chunk[1] >= oldest]
+
+    def clear(self):
+        self._chunks.clear()
+
+    def dump(self, folder):
+        """Write the chunks as numbered trace files, return their paths"""
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for index, (label, _, data) in enumerate(self.chunks(), start=1):
+            path = folder / f"{index:02d}-{label}.zip"
+            path.write_bytes(data)
+            paths.append(path)
+        return paths
+
+
+class TraceRingRecorder:
+    """
+    Action listener that cuts a trace chunk around every outermost action
+
+    Sync page objects only: async ones (utils/load_runner.py) are ignored.
+    """
+
+    def __init__(self, ring, page_type=Page):
+        self.ring = ring
+        self.page_type = page_type  # Pages of any other type are not traced
+        self._open = {}  # context -> label of its running chunk
+        self._depth = 0
+
+    def before(self, page_object, name):
+        page = page_object.page
+        if not isinstance(page, self.page_type):
+            return None  # HttpPage or async page
+        self._depth += 1
+        if self._depth == 1:
+            self._cut(page.context, name)
+        return page.context
+
+    def after(self, context, error):
+        if context is None:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            self._cut(context, BETWEEN_ACTIONS)
+
+    async def after_async(self, state, error):
+        pass
+
+    def finish(self, keep):
+        """End of a test: close every chunk, stop tracing, keep or drop the ring"""
+        for context in list(self._open):
+            try:
+                if keep:
+                    self._stop_chunk(context)
+                context.tracing.stop()
+            except Exception:
+                pass  # Context already closed; its last chunk is lost
+        self._open.clear()
+        self._depth = 0
+
+    def _cut(self, context, label):
+        try:
+            if context in self._open:
+                self._stop_chunk(context)
+            else:
+                context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            context.tracing.start_chunk(title=label)
+            self._open[context] = label
+        except Exception:
+            # Never fail a test because its trace couldn't be cut
+            self._open.pop(context, None)
+
+    def _stop_chunk(self, context):
+        handle, path = tempfile.mkstemp(suffix=".zip")
+        os.close(handle)
+        try:
+            context.tracing.stop_chunk(path=path)
+            self.ring.add(self._open[context], Path(path).read_bytes())
+        finally:
+            os.unlink(path)
+
+
+class TraceRingPlugin:
+    """Finishes the ring when a test's body is done, while its contexts are still open"""
+
+    def __init__(self, config, recorder):
+        self.config = config
+        self.recorder = recorder
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when == "call" or (report.when == "setup" and not report.passed):
+            self.recorder.finish(keep=report.failed)
+            if report.failed and self.recorder.ring.chunks():
+                folder = Path(self.config.getoption("--output")).absolute() / slugify(item.nodeid)
+                paths = self.recorder.ring.dump(folder / "trace-ring")
+                # Shown with the failure (also from xdist workers), not mid progress line
+                report.sections.append((
+                    "trace ring",
+                    f"🧵 Last {len(paths)} trace chunk(s): {paths[-1].parent}\n"
+                    f"   playwright show-trace {paths[-1]}",
+                ))
+            self.recorder.ring.clear()
+
+    def pytest_unconfigure(self):
+        remove_action_listener(self.recorder)
+
+
+# ============ PYTEST HOOKS ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("trace ring")
+    group.addoption(
+        "--trace-ring",
+        action="store_true",
+        help="Trace page-object actions into a ring buffer, written only for failed tests"
+    )
+    group.addoption(
+        "--trace-ring-actions",
+        action="store",
+        type=int,
+        default=10,
+        help="Page-object actions kept before a failure (default: 10)"
+    )
+    group.addoption(
+        "--trace-ring-seconds",
+        action="store",
+        type=float,
+        default=30.0,
+        help="Drop chunks older than this before a failure (default: 30)"
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--trace-ring") or config.getoption("--protocol", "browser") == "http":
+        return
+    # A context can only run one trace; the ring replaces pytest-playwright's
+    config.option.tracing = "off"
+    ring = TraceRing(config.getoption("--trace-ring-actions"), config.getoption("--trace-ring-seconds"))
+    recorder = TraceRingRecorder(ring)
+    add_action_listener(recorder)
+    config.pluginmanager.register(TraceRingPlugin(config, recorder), "trace-ring")
@@ -5,20 +5,53 @@ WHAT IS conftest.py?
 - Fixtures defined here available to ALL tests
 - No need to import
 """
+import os
+import re
 import sys
 from pathlib import Path
-from config.locales import get_all_locales,get_locale_config
+from urllib.parse import urlsplit
+from config.locales import get_all_locales,get_context_args,get_locale_config
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 import pytest
+from config.budgets import BUDGET_MODES, get_budget_mode, set_budget_mode
+from config.profiles import apply_timeouts
+from config.settings import LIVE_BASE_URL, set_base_url
 from pages.home_page import HomePage
+from pages.http_page import HttpConnectionPool, HttpPage
 from pages.login_page import LoginPage
+from utils.artifacts import get_active_pipeline
+from utils.auth_state import StorageStateCache
+from utils.browser_server import ensure_server, split_launch_args
+from utils.context_pool import ContextPool
+from utils.local_site import LocalSite
+from utils.network import LIVE, NETWORK_MODES, HarRouter, set_active_router
+from utils.visual import BaselineStore, assert_snapshot, mask_regions
+from utils import resource_blocking
+
+# Requesting any of these means a browser gets launched
+BROWSER_FIXTURES = {
+    "page", "context", "browser", "new_context",
+    "locale_page", "logged_in_page", "browser_type_launch_args",
+}
+
+# Plugins with their own options and hooks (see plugins/)
+pytest_plugins = [
+    "plugins.action_timing",
+    "plugins.artifacts",
+    "plugins.duration_sharding",
+    "plugins.failure_history",
+    "plugins.locale_matrix",
+    "plugins.profiles",
+    "plugins.impact",
+    "plugins.trace_ring",
+]
 
 # ============ BASIC FIXTURES ============
 
-@pytest.fixture(scope="session")
-def base_url():
+@pytest.fixture(scope="session", autouse=True)
+def base_url(request):
     """
     FIXTURE: Provides base URL
     
@@ -26,11 +59,92 @@ def base_url():
     - Single place to change URL
     - Can be overridden for different environments
     
+    SOURCES (first match wins):
+    - pytest --base-url=https://staging.example.com
+    - pytest --site=live -> https://www.automationexercise.com
+    - default: bundled local stand-in (local_site fixture)
+    
+    AUTOUSE: Page objects read the same URL via config/settings.py,
+    so it must be set before any test builds one
+    
     USAGE in test:
     def test_something(base_url):
-        print(base_url)  # https://www.automationexercise.com
+        print(base_url)  # http://127.0.0.1:8100
+    """
+    url = request.config.getoption("--base-url", default=None)
+    if not url and request.config.getoption("--site") == "live":
+        url = LIVE_BASE_URL
+    elif not url:
+        url = request.getfixturevalue("local_site").url
+    
+    set_base_url(url)
+    return url.rstrip("/")
+
+@pytest.fixture(scope="session")
+def local_site(request):
+    """
+    FIXTURE: The bundled stand-in, started once per session and worker
+    
+    PORT: --local-port plus the xdist worker number (gw0 -> 8100,
+    gw1 -> 8101...), the same every run, so the base URL keys
+    caches (.auth/) and HAR origins consistently. --local-port=0 picks free ports
+    
+    RETURNS: LocalSite, or None when tests target another site
+    """
+    if request.config.getoption("--base-url", default=None) or request.config.getoption("--site") != "local":
+        yield None
+        return
+    
+    port = request.config.getoption("--local-port")
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    if port:
+        port += int(worker.removeprefix("gw") or 0)
+    try:
+        site = LocalSite(port=port).start()
+    except OSError as error:
+        pytest.fail(f"Local site can't listen on port {port} ({error}); pick another with --local-port", pytrace=False)
+    print(f"\n🏠 Local site running at: {site.url}")
+    yield site
+    site.stop()
+
+@pytest.fixture(scope="session")
+def har_router(request):
+    """
+    FIXTURE: HAR record/replay router for the whole session
+    
+    USAGE:
+    pytest --network=record   # capture traffic into hars/
+    pytest --network=replay   # serve it back from disk
+    
+    RETURNS: HarRouter, or None in live mode
     """
-    return "https://www.automationexercise.com"
+    mode = request.config.getoption("--network")
+    if mode == LIVE:
+        yield None
+        return
+    
+    router = HarRouter(mode, request.config.getoption("--har-dir"))
+    set_active_router(router)
+    print(f"\n📼 Network mode: {mode} ({router.har_dir})")
+    yield router
+    set_active_router(None)
+    router.close()
+
+@pytest.fixture(autouse=True)
+def network_mode(request, har_router):
+    """
+    FIXTURE: Scopes HAR archives to the running test
+    
+    TEARDOWN: Fails the test if replay saw unrecorded requests
+    (e.g. from a click after the last navigate)
+    """
+    if har_router is None:
+        yield
+        return
+    
+    har_router.start_test(request.node.nodeid)
+    yield
+    har_router.raise_for_misses()
 
 @pytest.fixture
 def test_user():
@@ -88,6 +202,68 @@ def login_page(page):
     """
     return LoginPage(page)
 
+# ============ AUTHENTICATION FIXTURES ============
+
+@pytest.fixture(scope="session")
+def auth_state_cache(request, browser, browser_context_args, base_url, local_site):
+    """
+    FIXTURE: Logs in once per user and worker, then reuses the session
+    
+    SCOPE: session (one per pytest-xdist worker)
+    
+    HOW:
+    - Drives LoginPage.perform_login in a throwaway context
+    - Saves storage_state under .auth/<worker>/<base URL>/ - host AND
+      port, so two apps on 127.0.0.1 never share a login
+    - Reused until --auth-ttl passes or a cookie expires; for the local
+      stand-in, only while the server that issued it is running
+    
+    RETURNS: Function user -> storage_state path
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    site = re.sub(r"[^\w.-]+", "_", base_url.split("://")[-1])
+    cache = StorageStateCache(
+        project_root / ".auth" / worker / site,
+        ttl=request.config.getoption("--auth-ttl"),
+        valid_since=local_site.started_at if local_site else None
+    )
+    # No videos/HARs for the login itself
+    login_context_args = {
+        key: value for key, value in browser_context_args.items()
+        if not key.startswith("record_")
+    }
+    
+    def storage_state_for(user):
+        def login(path):
+            context = browser.new_context(**login_context_args)
+            try:
+                login_page = LoginPage(context.new_page())
+                login_page.navigate_to_login()
+                login_page.perform_login(user["email"], user["password"])
+                login_page.verify_logged_in()
+                context.storage_state(path=path)
+            finally:
+                context.close()
+        
+        return cache.get(user["email"], login)
+    
+    return storage_state_for
+
+@pytest.fixture
+def logged_in_page(request, new_context, auth_state_cache, test_user):
+    """
+    FIXTURE: Page already logged in as test_user (no login form)
+    
+    USAGE:
+    def test_account(logged_in_page):
+        HomePage(logged_in_page).navigate_to_home()
+    """
+    context = new_context(storage_state=auth_state_cache(test_user))
+    page = context.new_page()
+    apply_timeouts(page)
+    track_artifacts(request, page)
+    return page
+
 # ============ SETUP/TEARDOWN FIXTURES ============
 
 @pytest.fixture(scope="function")
@@ -139,10 +315,120 @@ def browser_context_args(browser_context_args):
             "height": 1080
         },
         "locale": "en-US",
-        "timezone_id": "America/New_York"
+        "timezone_id": "America/New_York",
+        **pipeline_context_args()
     }
 
+def pipeline_context_args():
+    """
+    --artifact-pipeline: record videos where the pipeline picks them up
+    (pytest-playwright's own recording is off, see plugins/artifacts.py)
+    """
+    pipeline = get_active_pipeline()
+    if not pipeline or pipeline.keep_videos == "off":
+        return {}
+    return {"record_video_dir": str(pipeline.recording_dir)}
+
+def track_artifacts(request, page):
+    """Tell the artifact pipeline (if on) which video belongs to this test"""
+    pipeline = get_active_pipeline()
+    if pipeline and not request.node.get_closest_marker("shared_context"):
+        pipeline.track(request.node.nodeid, page, request.getfixturevalue("output_path"))
+
+
+
+# ============ CONTEXT POOL FIXTURES ============
+
+@pytest.fixture(scope="session")
+def context_pool(browser):
+    """
+    FIXTURE: Warm browser contexts shared across tests
+    
+    SCOPE: session (closed at the end of the run)
+    """
+    pool = ContextPool(browser)
+    yield pool
+    pool.close()
+
+@pytest.fixture
+def context(request, new_context, browser_context_args):
+    """
+    FIXTURE: Browser context for the test (overrides pytest-playwright)
+    
+    DEFAULT: Fresh context per test, with video/trace/screenshots
+    
+    @pytest.mark.shared_context:
+    - Borrows a warm context from context_pool instead
+    - Reset afterwards (cookies, storage, permissions, routes)
+    - No per-test video, trace or failure screenshot
+    
+    USAGE:
+    @pytest.mark.shared_context
+    def test_read_only(page):
+        ...
+    """
+    if not request.node.get_closest_marker("shared_context"):
+        yield new_context()
+        return
+    
+    marker = request.node.get_closest_marker("browser_context_args")
+    context_args = {**browser_context_args, **(marker.kwargs if marker else {})}
+    pool = request.getfixturevalue("context_pool")
+    pooled = pool.acquire(context_args)
+    yield pooled
+    pool.release(pooled)
+
+# ============ BROWSER SERVER ============
+
+@pytest.fixture(scope="session")
+def connect_options(request, browser_name, browser_type_launch_args):
+    """
+    FIXTURE: Connect to a warm browser instead of launching one
+    (overrides pytest-playwright)
+    
+    pytest --reuse-browser-server:
+    - First session starts a browser server and leaves it running
+    - Later sessions connect in milliseconds
+    - Restarted when unhealthy or started with other
+      playwright version / launch options (utils/browser_server.py)
+    """
+    if not request.config.getoption("--reuse-browser-server"):
+        return None
+    server_options, per_connection = split_launch_args(browser_type_launch_args)
+    return {"ws_endpoint": ensure_server(browser_name, server_options), **per_connection}
+
+# ============ HTTP PROTOCOL MODE ============
 
+@pytest.fixture(scope="session")
+def http_connection_pool():
+    """
+    FIXTURE: Keep-alive HTTP connections for --protocol=http
+    
+    SCOPE: session (every HttpPage reuses the same sockets)
+    """
+    pool = HttpConnectionPool()
+    yield pool
+    pool.close()
+
+@pytest.fixture
+def page(request):
+    """
+    FIXTURE: Page for the test (overrides pytest-playwright)
+    
+    --protocol=browser (default): context.new_page(), with the
+    execution profile's timeout (plugins/profiles.py)
+    --protocol=http: HttpPage, no browser is launched
+    (see pages/http_page.py)
+    """
+    if request.config.getoption("--protocol") == "http":
+        http_page = HttpPage(request.getfixturevalue("http_connection_pool"))
+        yield http_page
+        http_page.close()
+        return
+    browser_page = request.getfixturevalue("context").new_page()
+    apply_timeouts(browser_page)
+    track_artifacts(request, browser_page)
+    yield browser_page
 
 # ============ LOCALE FIXTURES ============
 
@@ -180,15 +466,93 @@ def browser_context_args_with_locale(browser_context_args, request):
     pytest --locale=fr-FR
     """
     locale = request.config.getoption("--locale", default="en-US")
-    config = get_locale_config(locale)
     
     return {
         **browser_context_args,
-        "locale": config["locale"],
-        "timezone_id": config["timezone"],
+        **get_context_args(locale),
         "viewport": {"width": 1920, "height": 1080}
     }
 
+@pytest.fixture
+def locale_page(locale, browser_context_args_with_locale, context_pool):
+    """
+    FIXTURE: Page whose context really uses the test's locale
+    
+    HOW:
+    - One context per locale (locale + timezone_id), built on first use
+    - Cached in context_pool and reset between cases, so an
+      8-locale matrix builds 8 contexts, not one per test
+    
+    USAGE:
+    @pytest.mark.parametrize("locale", ["en-US", "fr-FR"])
+    def test_something(locale_page, locale):
+        locale_page.goto(...)
+    """
+    context = context_pool.acquire({
+        **browser_context_args_with_locale,
+        **get_context_args(locale)
+    })
+    page = context.new_page()
+    apply_timeouts(page)
+    yield page
+    context_pool.release(context)
+
+# ============ VISUAL SNAPSHOTS ============
+
+def site_key(config, base_url):
+    """
+    "local" for the bundled stand-in, else the site's host
+
+    EXAMPLE: --site=live -> "www.automationexercise.com"
+    """
+    if not config.getoption("--base-url", default=None) and config.getoption("--site") == "local":
+        return "local"
+    return urlsplit(base_url).hostname
+
+@pytest.fixture
+def visual_snapshot(request, browser_name, base_url):
+    """
+    FIXTURE: Compare a page's screenshot with its stored baseline
+    
+    USAGE:
+    def test_home_looks_right(page, visual_snapshot):
+        HomePage(page).navigate_to_home()
+        visual_snapshot(page, "home", mask=[page.locator("#cartModal")])
+    
+    BASELINES: --snapshot-dir (default tests/snapshots), one per
+    name + site + browser + platform (home-local-chromium-linux),
+    so stand-in and live screenshots are never compared;
+    refresh with --update-snapshots (see utils/visual.py)
+    
+    NO BASELINE YET:
+    - CI (CI env var set): the test FAILS - a skipped check there
+      is a check nobody runs
+    - Locally: skipped until someone creates and commits one with
+      --update-snapshots on that site + browser + platform
+    """
+    store = BaselineStore(request.config.getoption("--snapshot-dir"))
+    update = request.config.getoption("--update-snapshots")
+    site = site_key(request.config, base_url)
+    
+    def check(target_page, name, mask=(), tolerance=0.001, mode="perceptual", threshold=0.1, full_page=False):
+        baseline = f"{name}-{site}-{browser_name}-{sys.platform}"
+        if not update and store.digest(baseline) is None:
+            message = (
+                f"No visual baseline {baseline!r}; create it with: pytest --update-snapshots "
+                f"--site={request.config.getoption('--site')} --browser={browser_name}, then commit it"
+            )
+            if os.environ.get("CI"):
+                pytest.fail(message)
+            pytest.skip(message)
+        png = target_page.screenshot(full_page=full_page, animations="disabled", caret="hide")
+        return assert_snapshot(
+            store, baseline, png,
+            output_dir=request.getfixturevalue("output_path"), update=update,
+            tolerance=tolerance, mode=mode, threshold=threshold, masks=mask_regions(mask)
+        )
+    
+    return check
+
 # ============ COMMAND LINE OPTIONS ============
 
 def pytest_addoption(parser):
@@ -198,6 +562,8 @@ def pytest_addoption(parser):
     USAGE:
     pytest --locale=fr-FR
     pytest --browser=firefox
+    pytest --site=live
+    pytest --network=replay
     """
     parser.addoption(
         "--locale",
@@ -205,6 +571,107 @@ def pytest_addoption(parser):
         default="en-US",
         help="Locale for testing (e.g., en-US, fr-FR)"
     )
+    parser.addoption(
+        "--site",
+        action="store",
+        default="local",
+        choices=("local", "live"),
+        help="Run against the bundled local stand-in (default) or the live site"
+    )
+    parser.addoption(
+        "--local-port",
+        action="store",
+        type=int,
+        default=8100,
+        help="Port of the local stand-in (xdist workers add their number; 0 = any free port)"
+    )
+    parser.addoption(
+        "--network",
+        action="store",
+        default=LIVE,
+        choices=NETWORK_MODES,
+        help="Record page-object traffic to HAR archives, replay it, or go live (default)"
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        default=str(project_root / "hars"),
+        help="Folder for HAR archives used by --network=record|replay"
+    )
+    parser.addoption(
+        "--auth-ttl",
+        action="store",
+        type=int,
+        default=1800,
+        help="Seconds a cached login (storage_state) stays valid"
+    )
+    parser.addoption(
+        "--resource-blocking",
+        action="store",
+        default="on",
+        choices=("on", "off"),
+        help="Block ads/trackers/fonts/images page objects declare they don't need"
+    )
+    parser.addoption(
+        "--budget-mode",
+        action="store",
+        default=None,
+        choices=BUDGET_MODES,
+        help="Over performance budget: fail the test or only warn (default: BUDGET_MODE env var, else fail)"
+    )
+    parser.addoption(
+        "--reuse-browser-server",
+        action="store_true",
+        help="Connect to a persistent browser server (started on first use) instead of launching"
+    )
+    parser.addoption(
+        "--update-snapshots",
+        action="store_true",
+        help="Save screenshots as the new visual baselines instead of comparing"
+    )
+    parser.addoption(
+        "--snapshot-dir",
+        action="store",
+        default=str(project_root / "tests" / "snapshots"),
+        help="Folder of content-addressed visual baselines"
+    )
+    parser.addoption(
+        "--protocol",
+        action="store",
+        default="browser",
+        choices=("browser", "http"),
+        help="http: no browser; page is an HttpPage and browser tests not marked browserless are deselected"
+    )
+
+def pytest_configure(config):
+    """
+    Apply session-wide settings from command line options
+    """
+    resource_blocking.set_enabled(config.getoption("--resource-blocking") == "on")
+    budget_mode = config.getoption("--budget-mode") or get_budget_mode()
+    if budget_mode not in BUDGET_MODES:
+        raise pytest.UsageError(f"BUDGET_MODE={budget_mode!r} is not one of {list(BUDGET_MODES)}")
+    set_budget_mode(budget_mode)
+    if config.getoption("--protocol") == "http" and config.getoption("--network") != LIVE:
+        raise pytest.UsageError("--network=record/replay needs a browser; drop --protocol=http")
+
+def pytest_collection_modifyitems(config, items):
+    """
+    --protocol=http: deselect tests that need a real browser
+    (browser fixtures without @pytest.mark.browserless)
+    """
+    if config.getoption("--protocol") != "http":
+        return
+    
+    def needs_browser(item):
+        uses_browser = BROWSER_FIXTURES.intersection(getattr(item, "fixturenames", ()))
+        return uses_browser and not item.get_closest_marker("browserless")
+    
+    selected = [item for item in items if not needs_browser(item)]
+    deselected = [item for item in items if needs_browser(item)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
     
 
 # ============ RTL (Right-to-Left) FIXTURE ============
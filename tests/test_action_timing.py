@@ -0,0 +1,113 @@
+"""
+Action Timing Tests
+Covers: @action spans and the p50/p95/p99 summary (no browser needed)
+"""
+import json
+
+import pytest
+
+from pages.instrumentation import action, add_action_listener, remove_action_listener
+from plugins.action_timing import SpanRecorder, summarize
+from utils.stats import percentile
+
+class FakePage:
+    url = "http://example.test/"
+
+class FakeFrame:
+    parent_frame = None
+
+    def __init__(self, url):
+        self.url = url
+
+class FakeEventPage(FakePage):
+    """Page that emits framenavigated, like Playwright's"""
+
+    def __init__(self):
+        self.listeners = []
+
+    def on(self, event, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, event, listener):
+        self.listeners.remove(listener)
+
+    def reload(self):
+        for listener in list(self.listeners):
+            listener(FakeFrame(self.url))
+
+    def evaluate(self, expression):
+        return {"navigation": {"load": 42}}
+
+class FakePageObject:
+    def __init__(self):
+        self.page = FakePage()
+
+    @action
+    def outer(self):
+        return self.inner()
+
+    @action
+    def inner(self):
+        return "done"
+
+    @action
+    def reload(self):
+        self.page.reload()
+
+    @action
+    def broken(self):
+        raise ValueError("no such button")
+
+@pytest.fixture
+def recorder(tmp_path):
+    recorder = SpanRecorder(tmp_path / "spans.jsonl")
+    recorder.tags.update(test="test_x", locale="fr-FR", worker="gw1")
+    add_action_listener(recorder)
+    yield recorder
+    remove_action_listener(recorder)
+
+def read(recorder):
+    return [json.loads(line) for line in recorder.path.read_text().splitlines()]
+
+def test_nested_actions_record_parent(recorder):
+    """
+    TEST: Every action writes one tagged span; inner spans name their parent
+    """
+    assert FakePageObject().outer() == "done"
+    inner, outer = read(recorder)
+    assert (inner["action"], inner["parent"]) == ("FakePageObject.inner", "FakePageObject.outer")
+    assert outer["parent"] is None
+    assert outer["locale"] == "fr-FR" and outer["worker"] == "gw1"
+    assert outer["navigated"] is False and outer["browser"] is None
+
+def test_same_url_reload_counts_as_navigation(recorder):
+    """
+    TEST: A reload keeps the URL but loads a new document -> browser timings recorded
+    """
+    page_object = FakePageObject()
+    page_object.page = FakeEventPage()
+    page_object.reload()
+    [span] = read(recorder)
+    assert span["navigated"] is True
+    assert span["browser"] == {"navigation": {"load": 42}}
+    assert page_object.page.listeners == []
+
+def test_failed_action_is_recorded(recorder):
+    """
+    TEST: The span is written even when the action raises
+    """
+    with pytest.raises(ValueError):
+        FakePageObject().broken()
+    [span] = read(recorder)
+    assert span["ok"] is False
+    assert span["error"] == "ValueError: no such button"
+
+def test_summary_percentiles():
+    """
+    TEST: Nearest-rank p50/p95/p99 per action
+    """
+    assert percentile(list(range(1, 101)), 95) == 95
+    spans = [{"action": "CartPage.remove_product", "duration_ms": ms, "ok": ms < 100}
+             for ms in (10, 20, 30, 40, 500)]
+    stats = summarize(spans)["CartPage.remove_product"]
+    assert stats == {"count": 5, "failed": 1, "p50": 30, "p95": 500, "p99": 500}
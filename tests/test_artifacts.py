@@ -0,0 +1,73 @@
+"""
+Artifact Pipeline Tests
+Covers: keeping/dropping videos, the manifest and backpressure (no browser needed)
+"""
+import threading
+
+from utils.artifacts import ArtifactPipeline
+
+class FakeVideo:
+    def __init__(self, path):
+        self._path = path
+
+    def path(self):
+        return self._path
+
+class FakePage:
+    def __init__(self, video_path):
+        self.video = FakeVideo(str(video_path))
+
+def record(tmp_path, name):
+    video = tmp_path / "recording" / f"{name}.webm"
+    video.parent.mkdir(exist_ok=True)
+    video.write_bytes(b"webm")
+    return video
+
+def test_passing_videos_dropped_failing_videos_indexed(tmp_path):
+    """
+    TEST: retain-on-failure keeps only the failed test's video, next to its screenshot
+    """
+    pipeline = ArtifactPipeline(tmp_path / "recording", keep_videos="retain-on-failure")
+    passed, failed = record(tmp_path, "passed"), record(tmp_path, "failed")
+    failed_output = tmp_path / "output" / "test-failed"
+    failed_output.mkdir(parents=True)
+    (failed_output / "test-failed-1.png").write_bytes(b"png")
+
+    pipeline.track("test_passed", FakePage(passed), str(tmp_path / "output" / "test-passed"))
+    pipeline.track("test_failed", FakePage(failed), str(failed_output))
+    pipeline.finish_test("test_passed", failed=False)
+    pipeline.finish_test("test_failed", failed=True)
+    manifest = pipeline.close()
+
+    assert not passed.exists() and not (tmp_path / "output" / "test-passed").exists()
+    assert (failed_output / "video.webm").read_bytes() == b"webm"
+    assert [entry["test"] for entry in manifest] == ["test_failed"]
+    kinds = sorted(artifact["kind"] for artifact in manifest[0]["artifacts"])
+    assert kinds == ["screenshot", "video"]
+    assert pipeline.stats["kept"] == 1 and pipeline.stats["discarded"] == 1
+
+def test_full_queue_blocks_until_a_thread_frees_a_slot(tmp_path):
+    """
+    TEST: Backpressure - memory stays bounded by max_pending jobs
+    """
+    pipeline = ArtifactPipeline(tmp_path / "recording", workers=1, max_pending=1)
+    release = threading.Event()
+    original_discard = pipeline._discard
+    pipeline._discard = lambda *job: (release.wait(), original_discard(*job))
+
+    for index in range(2):
+        # First job occupies the thread, second fills the queue
+        pipeline.track(f"test_{index}", FakePage(record(tmp_path, str(index))), str(tmp_path))
+        pipeline.finish_test(f"test_{index}", failed=False)
+
+    pipeline.track("test_2", FakePage(record(tmp_path, "2")), str(tmp_path))
+    blocked = threading.Thread(target=pipeline.finish_test, args=("test_2", False))
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(timeout=5)
+    assert not blocked.is_alive()
+    pipeline.close()
+    assert pipeline.stats["discarded"] == 3
@@ -0,0 +1,74 @@
+"""
+Async Page Object Tests
+Covers: Async pages share locators with the sync ones, and offer every BasePage call awaitable (no browser needed)
+"""
+import asyncio
+import inspect
+from types import SimpleNamespace
+
+import pytest
+
+from pages.async_pages.base_page import AsyncBasePage
+from pages.async_pages.cart_page import AsyncCartPage
+from pages.async_pages.home_page import AsyncHomePage
+from pages.async_pages.login_page import AsyncLoginPage
+from pages.async_pages.products_page import AsyncProductsPage
+from pages.base_page import BasePage, PageCore
+from pages.cart_page import CartPage
+from pages.login_page import LoginPage
+
+ASYNC_PAGES = [AsyncCartPage, AsyncHomePage, AsyncLoginPage, AsyncProductsPage]
+
+def is_async(function):
+    function = getattr(function, "__wrapped__", function)
+    return inspect.iscoroutinefunction(function) or inspect.isasyncgenfunction(function)
+
+@pytest.mark.parametrize("page_class", ASYNC_PAGES, ids=lambda cls: cls.__name__)
+def test_every_call_is_awaitable(page_class):
+    """
+    TEST: Outside the shared *Locators mixins, every public method is async
+    """
+    for name, value in inspect.getmembers(page_class, inspect.isfunction):
+        owner = next(cls for cls in page_class.__mro__ if name in vars(cls))
+        if name.startswith("__") or name == "expect" or owner.__name__.endswith("Locators"):
+            continue  # expect() hands back async assertions to await
+        assert is_async(value) or owner is PageCore, f"{page_class.__name__}.{name} is sync"
+
+def test_sync_only_calls_are_not_inherited():
+    """
+    TEST: check_all & co. would return un-awaited coroutines on an async Page
+    """
+    assert not issubclass(AsyncLoginPage, BasePage)
+    assert not issubclass(AsyncLoginPage, LoginPage)
+    assert is_async(AsyncCartPage.expect_dom_change)
+    assert is_async(AsyncCartPage.check_budget)
+
+def test_async_base_page_matches_base_page():
+    """
+    TEST: Every BasePage method has an async twin on AsyncBasePage
+    """
+    def public(cls):
+        return {name for name in vars(cls) if not name.startswith("_")}
+    assert public(AsyncBasePage) == public(BasePage)
+    for name in public(BasePage) - {"expect"}:
+        assert is_async(getattr(AsyncBasePage, name)), name
+
+def test_async_budget_skips_missing_metrics():
+    """
+    TEST: No metrics -> skipped, like the sync check_budget over --protocol=http
+    """
+    class NoMetrics:
+        async def budget_metrics(self):
+            return None
+
+    page = AsyncLoginPage(SimpleNamespace(url="about:blank"))
+    page.driver = NoMetrics()
+    assert asyncio.run(page.check_budget()) is None
+
+def test_locators_are_shared():
+    """
+    TEST: Same selectors and resource blocking in both flavours
+    """
+    assert AsyncCartPage.delete_button is CartPage.delete_button
+    assert AsyncLoginPage.signup_button is LoginPage.signup_button
+    assert AsyncCartPage.BLOCKED_RESOURCE_TYPES == CartPage.BLOCKED_RESOURCE_TYPES == ("media", "image", "font")
@@ -0,0 +1,58 @@
+"""
+Cached Login State Tests
+Covers: When a saved storage_state is reused or refreshed
+"""
+import json
+import os
+import time
+from utils.auth_state import StorageStateCache
+
+def save_state(path, cookies):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"cookies": cookies, "origins": []}))
+
+def test_login_runs_once_while_fresh(tmp_path):
+    """
+    TEST: Second request reuses the saved state
+    """
+    cache = StorageStateCache(tmp_path, ttl=60)
+    logins = []
+
+    def login(path):
+        logins.append(path)
+        save_state(path, [{"name": "sessionid", "expires": -1}])
+
+    first = cache.get("testuser@example.com", login)
+    second = cache.get("testuser@example.com", login)
+    assert first == second
+    assert len(logins) == 1
+
+def test_state_expires_after_ttl(tmp_path):
+    """
+    TEST: Old files are not reused
+    """
+    cache = StorageStateCache(tmp_path, ttl=60)
+    path = cache.path_for("testuser@example.com")
+    save_state(path, [])
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert not cache.is_fresh(path)
+
+def test_state_expires_with_cookie(tmp_path):
+    """
+    TEST: An expired cookie invalidates the state before the TTL
+    """
+    cache = StorageStateCache(tmp_path, ttl=3600)
+    path = cache.path_for("testuser@example.com")
+    save_state(path, [{"name": "sessionid", "expires": time.time() - 1}])
+    assert not cache.is_fresh(path)
+
+def test_state_from_before_the_server_started_is_stale(tmp_path):
+    """
+    TEST: The local stand-in forgets sessions on restart -> saved state is not reused
+    """
+    path = StorageStateCache(tmp_path).path_for("testuser@example.com")
+    save_state(path, [{"name": "sessionid", "expires": -1}])
+    saved = path.stat().st_mtime
+    assert StorageStateCache(tmp_path, valid_since=saved - 10).is_fresh(path)
+    assert not StorageStateCache(tmp_path, valid_since=saved + 10).is_fresh(path)
@@ -0,0 +1,79 @@
+"""
+Browser Server Tests
+Covers: launch option split, pins, health checks and safe stops (no browser needed)
+"""
+import json
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from utils import browser_server
+from utils.browser_server import SERVER_MARKER, BrowserServerError, is_healthy, is_our_server, pins, split_launch_args
+
+def test_launch_args_split():
+    """
+    TEST: slow_mo stays per connection; headless needs its own server
+    """
+    server, connect = split_launch_args({"headless": False, "slow_mo": 500, "args": ["--foo"]})
+    assert server == {"headless": False, "args": ["--foo"]}
+    assert connect == {"slow_mo": 500}
+
+def test_pins_change_with_launch_options():
+    """
+    TEST: A headed server is never reused for a headless session
+    """
+    assert pins("chromium", {"headless": True}) != pins("chromium", {"headless": False})
+    assert pins("chromium", {"headless": True}) == pins("chromium", {"headless": True})
+
+def test_health_check_needs_a_listening_endpoint():
+    """
+    TEST: Healthy while something listens on the endpoint, not after
+    """
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    port = listener.getsockname()[1]
+    state = {"ws_endpoint": f"ws://127.0.0.1:{port}/abc"}
+    assert is_healthy(state)
+    listener.close()
+    assert not is_healthy(state)
+    assert not is_healthy(None)
+
+def sleeper(*args, **options):
+    return subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)", *args], **options)
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX process groups")
+def test_stop_never_signals_a_recycled_pid(tmp_path, monkeypatch):
+    """
+    TEST: Our server (own group + marker) is stopped; a stranger on the recorded pid is left alone
+    """
+    monkeypatch.setattr(browser_server, "STATE_DIR", tmp_path)
+    ours = sleeper(SERVER_MARKER, start_new_session=True)
+    stranger = sleeper(start_new_session=True)
+    try:
+        assert is_our_server({"pid": ours.pid})
+        assert not is_our_server({"pid": stranger.pid})
+        assert not is_our_server({"pid": None})
+
+        (tmp_path / "chromium.json").write_text(json.dumps({"pid": stranger.pid}), encoding="utf-8")
+        browser_server.stop("chromium")
+        assert stranger.poll() is None
+        assert not (tmp_path / "chromium.json").exists()
+
+        (tmp_path / "chromium.json").write_text(json.dumps({"pid": ours.pid}), encoding="utf-8")
+        browser_server.stop("chromium")
+        assert ours.wait(timeout=5) is not None
+    finally:
+        for process in (ours, stranger):
+            process.kill()
+            process.wait()
+
+def test_private_driver_api_is_version_gated(monkeypatch):
+    """
+    TEST: An untested playwright version fails with a clear message, not deep in _impl
+    """
+    monkeypatch.setattr(browser_server, "version", lambda name: "2.3.0")
+    with pytest.raises(BrowserServerError, match="DRIVER_API_VERSIONS"):
+        browser_server.start("chromium", {"headless": True})
@@ -0,0 +1,64 @@
+"""
+Performance Budget Tests
+Covers: per-page budget lookup and fail/warn reporting (no browser needed)
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from config import budgets
+from config.budgets import PAGE_BUDGETS, get_page_budget
+from pages.async_pages.home_page import AsyncHomePage
+from pages.base_page import BasePage
+from pages.home_page import HomePage
+from pages.timing import PerformanceBudgetWarning, budget_violations
+
+class FakePage:
+    url = "http://example.test/"
+
+def test_async_pages_share_sync_budget():
+    """
+    TEST: AsyncHomePage uses the HomePage entry; unknown pages the default
+    """
+    assert get_page_budget(AsyncHomePage) == PAGE_BUDGETS["HomePage"]
+    assert get_page_budget(BasePage) == PAGE_BUDGETS["default"]
+    assert get_page_budget(HomePage, {"load": 1, "lcp": None})["load"] == 1
+
+def test_violations_skip_unmeasured_metrics():
+    """
+    TEST: No LCP outside Chromium (None) is not a violation
+    """
+    metrics = {"load": 7000, "lcp": None, "requests": 10}
+    limits = {"load": 6000, "lcp": 4000, "requests": None}
+    assert budget_violations(metrics, limits) == ["load: 7000 > 6000"]
+
+@pytest.mark.parametrize("mode", ["fail", "warn"])
+def test_over_budget_fails_or_warns(mode, monkeypatch):
+    """
+    TEST: --budget-mode decides between AssertionError and a warning
+    """
+    monkeypatch.setattr(budgets, "_mode", mode)
+    home_page = HomePage(FakePage())
+    limits = get_page_budget(HomePage, {"requests": 5})
+    metrics = {"requests": 9}
+    if mode == "fail":
+        with pytest.raises(AssertionError, match="requests: 9 > 5"):
+            home_page._report_budget(metrics, limits)
+    else:
+        with pytest.warns(PerformanceBudgetWarning, match="requests: 9 > 5"):
+            home_page._report_budget(metrics, limits)
+
+def test_unknown_budget_mode_is_a_usage_error():
+    """
+    TEST: BUDGET_MODE=typo stops pytest with a usage error, not a traceback
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", __file__],
+        cwd=Path(__file__).parent.parent, env={**os.environ, "BUDGET_MODE": "loud"},
+        capture_output=True, text=True,
+    )
+    assert result.returncode == pytest.ExitCode.USAGE_ERROR
+    assert "BUDGET_MODE='loud' is not one of ['fail', 'warn']" in result.stderr
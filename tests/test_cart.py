@@ -28,17 +28,27 @@ def test_add_to_cart_and_verify(products_page, cart_page):
     # Verify item in cart
     assert cart_page.get_cart_item_count() > 0
 
-def test_remove_from_cart(products_page, cart_page):
+def test_remove_from_cart(cart_page):
     """
     TEST 5: Remove product from cart
     """
-    # Add product
-    products_page.navigate_to_products()
-    products_page.add_product_and_view_cart(product_number=1)
+    # Start on /view_cart with the product already in the cart
+    cart_page.seed([1])
     
     # Remove product
     cart_page.remove_product(product_id="1")
     
-    # Verify cart is empty (wait for page update)
-    cart_page.page.wait_for_timeout(1000)
-    assert cart_page.get_cart_item_count() == 0
\ No newline at end of file
+    # Verify cart is empty (remove_product waits for the table update)
+    assert cart_page.get_cart_item_count() == 0
+
+@pytest.mark.browserless
+def test_seeded_cart_contents(cart_page):
+    """
+    TEST 13: Seeded items and quantities show up in the cart
+    """
+    cart_page.seed([1, 1, 2])
+    
+    cart_page.verify_cart_page_loaded()
+    assert cart_page.get_cart_item_count() == 2
+    assert cart_page.page.locator("#product-1 .cart_quantity").inner_text() == "2"
+    assert not cart_page.is_cart_empty()
@@ -0,0 +1,101 @@
+"""
+Batched Check Tests
+Covers: Check selectors, check_all and its failure report (no browser needed)
+"""
+from types import SimpleNamespace
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.base_page import BasePage
+from pages.checks import ALL_PASS_JS, CHECKS_JS, Check, batchable_selector
+from pages.home_page import HomePage
+from pages.http_page import HttpLocator
+from pages.login_page import LoginPage
+
+class FakePage:
+    """Answers check_all's browser calls with canned results"""
+
+    def __init__(self, results, settles=False):
+        self.url = "http://127.0.0.1:8000/login"
+        self.results = results
+        self.settles = settles
+        self.calls = []
+
+    def evaluate(self, expression, arg=None):
+        self.calls.append(("evaluate", expression, arg))
+        return self.results
+
+    def wait_for_function(self, expression, arg=None, timeout=None):
+        self.calls.append(("wait_for_function", expression, timeout))
+        if not self.settles:
+            raise PlaywrightTimeoutError("Timeout exceeded")
+
+def test_only_css_and_xpath_selectors_batch():
+    """
+    TEST: Declared CSS/XPath selectors batch; locators and Playwright-only selectors are refused
+    """
+    assert batchable_selector(HomePage.HOME_SLIDER) == "#slider"
+    assert batchable_selector("css=#slider") == "#slider"
+    assert batchable_selector("xpath=//a") == "xpath=//a"
+    for unbatchable in (
+        HttpLocator(None, "#slider"),
+        SimpleNamespace(selector="#slider"),
+        'internal:role=link[name="Products"i]',
+        "#cart >> text=Delete",
+        "text=Logged in as",
+    ):
+        with pytest.raises(ValueError):
+            Check(unbatchable, visible=True)
+
+def test_locators_use_the_declared_selectors():
+    """
+    TEST: Locators and checks can't drift apart: both read the same constant
+    """
+    page = SimpleNamespace(locator=lambda selector: selector)
+    assert HomePage(page).login_link == HomePage.LOGIN_LINK
+    assert HomePage(page).home_slider == HomePage.HOME_SLIDER
+    assert LoginPage(page).login_button == LoginPage.LOGIN_BUTTON
+
+def test_check_all_is_one_browser_call():
+    """
+    TEST: Every check goes to the browser in one evaluate
+    """
+    page = FakePage([[], []])
+    BasePage(page).check_all(
+        Check(HomePage.HOME_SLIDER, visible=True),
+        Check(".productinfo", count=12),
+    )
+    [(kind, expression, specs)] = page.calls
+    assert (kind, expression) == ("evaluate", CHECKS_JS)
+    assert specs[1] == {"selector": ".productinfo", "visible": None, "text": None, "attribute": None, "count": 12}
+
+def test_check_all_waits_then_reports():
+    """
+    TEST: With a timeout, it waits first; still failing -> current failures reported
+    """
+    page = FakePage([["element not found"]], settles=True)
+    BasePage(page).check_all(Check("#slider", visible=True), timeout=5000)
+    assert page.calls == [("wait_for_function", ALL_PASS_JS, 5000)]
+
+    page = FakePage([["element not found"]])
+    with pytest.raises(AssertionError, match="element not found"):
+        BasePage(page).check_all(Check("#slider", visible=True), timeout=5000)
+    assert [call[0] for call in page.calls] == ["wait_for_function", "evaluate"]
+
+def test_failure_report_lists_every_failed_check():
+    """
+    TEST: All failures in one AssertionError, not just the first
+    """
+    checks = [Check("#slider", visible=True), Check("h2", text="All Products"), Check(".productinfo", count=12)]
+    page = FakePage(None)
+    with pytest.raises(AssertionError) as failure:
+        BasePage(page)._raise_for_failed_checks(
+            checks, [["element not found"], [], ["expected count 12, got 3", "element not found"]]
+        )
+    message = str(failure.value)
+    assert message.startswith(f"3 of 3 checks failed on {page.url}:")
+    assert "Check('#slider', visible=True): element not found" in message
+    assert "All Products" not in message
+    assert message.count("\n  - ") == 3
+    BasePage(page)._raise_for_failed_checks(checks, [[], [], []])
@@ -0,0 +1,151 @@
+"""
+Context Pool Tests
+Covers: pool keys, reuse, max idle and what reset_context clears (no browser needed)
+"""
+import pytest
+
+from utils.context_pool import CLEAR_STORAGE_JS, ContextPool, reset_context
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.calls = []
+        self.closed = False
+
+    def route(self, url, handler):
+        self.calls.append(("route", url))
+
+    def goto(self, url):
+        self.calls.append(("goto", url))
+
+    def evaluate(self, expression):
+        self.calls.append(("evaluate", expression))
+
+    def close(self):
+        self.closed = True
+        self.context.pages.remove(self)
+
+class FakeContext:
+    """Records what reset_context does to it"""
+
+    def __init__(self, args, origins=(), broken=False):
+        self.args = args
+        self.origins = list(origins)
+        self.broken = broken
+        self.pages = []
+        self.opened = []  # Every page ever made, closed ones too
+        self.calls = []
+        self.closed = False
+
+    def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        self.opened.append(page)
+        self.calls.append("new_page")
+        return page
+
+    def unroute_all(self, behavior=None):
+        if self.broken:
+            raise RuntimeError("Target closed")
+        self.calls.append("unroute_all")
+
+    def clear_cookies(self):
+        self.calls.append("clear_cookies")
+
+    def clear_permissions(self):
+        self.calls.append("clear_permissions")
+
+    def set_extra_http_headers(self, headers):
+        self.calls.append(("set_extra_http_headers", headers))
+
+    def set_offline(self, offline):
+        self.calls.append(("set_offline", offline))
+
+    def storage_state(self):
+        return {"cookies": [], "origins": [{"origin": origin, "localStorage": []} for origin in self.origins]}
+
+    def close(self):
+        self.closed = True
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **args):
+        context = FakeContext(args)
+        self.contexts.append(context)
+        return context
+
+def test_pool_key_ignores_artifact_recording():
+    """
+    TEST: Video/HAR paths are dropped; viewport, locale... still tell contexts apart
+    """
+    browser = FakeBrowser()
+    pool = ContextPool(browser)
+    args = {"viewport": {"width": 1280, "height": 720}, "locale": "en-US"}
+    context = pool.acquire({**args, "record_video_dir": "videos/test-a", "record_har_path": "a.har"})
+    assert context.args == args
+    pool.release(context)
+
+    assert pool.acquire({**args, "record_video_dir": "videos/test-b"}) is context
+    assert pool.acquire({**args, "locale": "de-DE"}) is not context
+    assert len(browser.contexts) == 2
+
+def test_release_keeps_at_most_max_idle():
+    """
+    TEST: Released contexts are reused; beyond max_idle_per_key they are closed
+    """
+    browser = FakeBrowser()
+    pool = ContextPool(browser, max_idle_per_key=1)
+    first, second = pool.acquire({}), pool.acquire({})
+    pool.release(first)
+    pool.release(second)
+    assert not first.closed and second.closed
+    assert pool.acquire({}) is first
+
+    pool.release(first)
+    pool.close()
+    assert first.closed
+
+def test_unresettable_context_is_not_shared():
+    """
+    TEST: A context reset_context fails on is closed, never handed out again
+    """
+    browser = FakeBrowser()
+    pool = ContextPool(browser)
+    context = pool.acquire({})
+    context.broken = True
+    with pytest.raises(RuntimeError):
+        pool.release(context)
+    assert context.closed
+    assert pool.acquire({}) is not context
+
+def test_reset_clears_test_state():
+    """
+    TEST: Routes, cookies, permissions, headers, offline, pages and every origin's storage
+    """
+    context = FakeContext({}, origins=["http://127.0.0.1:8000", "https://example.com"])
+    leftover = context.new_page()
+    reset_context(context)
+
+    assert leftover.closed and context.pages == []
+    assert context.calls[1:] == [
+        "unroute_all", "clear_cookies", "clear_permissions",
+        ("set_extra_http_headers", {}), ("set_offline", False), "new_page",
+    ]
+    # One stub page visits each origin and clears its storage there
+    [_, stub] = context.opened
+    assert stub.closed
+    assert stub.calls == [
+        ("route", "**/*"),
+        ("goto", "http://127.0.0.1:8000"), ("evaluate", CLEAR_STORAGE_JS),
+        ("goto", "https://example.com"), ("evaluate", CLEAR_STORAGE_JS),
+    ]
+
+def test_reset_without_storage_opens_no_page():
+    """
+    TEST: Nothing stored -> no stub page, no navigation
+    """
+    context = FakeContext({})
+    reset_context(context)
+    assert "new_page" not in context.calls
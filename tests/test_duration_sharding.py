@@ -0,0 +1,52 @@
+"""
+Duration-Aware Sharding Tests
+Covers: LPT balancing and the persistent timing store
+"""
+from plugins.duration_sharding import DurationStore, lpt_shards
+
+def shard_loads(durations, assignment, workers):
+    loads = [0.0] * workers
+    for nodeid, shard in assignment.items():
+        loads[shard] += durations[nodeid]
+    return loads
+
+def test_slow_tests_spread_across_workers():
+    """
+    TEST: Slow locale/cart tests don't all land on one worker
+    """
+    durations = {
+        "test_i18n.py::test_all_supported_locales[en-US]": 8.0,
+        "test_i18n.py::test_all_supported_locales[fr-FR]": 8.0,
+        "test_cart.py::test_remove_from_cart": 6.0,
+        "test_cart.py::test_add_to_cart_and_verify": 6.0,
+        "test_home.py::test_homepage_loads": 1.0,
+        "test_home.py::test_homepage_navigation_links": 1.0,
+    }
+    assignment = lpt_shards(durations, 2)
+    assert shard_loads(durations, assignment, 2) == [15.0, 15.0]
+
+def test_assignment_is_deterministic():
+    """
+    TEST: Every xdist worker must compute the same split
+    """
+    durations = {f"test_{index}": 1.0 for index in range(10)}
+    assert lpt_shards(durations, 3) == lpt_shards(dict(reversed(list(durations.items()))), 3)
+
+def test_store_blends_runs_and_estimates_unknown(tmp_path):
+    """
+    TEST: Phases add up, history is smoothed, unknown tests get the median
+    """
+    path = tmp_path / "durations.json"
+    store = DurationStore(path)
+    store.add("test_a", 1.0)  # setup
+    store.add("test_a", 3.0)  # call
+    store.add("test_b", 2.0)
+    store.save()
+
+    store = DurationStore(path)
+    assert store.estimate("test_a") == 4.0
+    assert store.estimate("test_new") == 3.0
+
+    store.add("test_a", 2.0)
+    store.save()
+    assert DurationStore(path).estimate("test_a") == 3.0
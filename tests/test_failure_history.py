@@ -0,0 +1,69 @@
+"""
+Failure History Tests
+Covers: failure signatures, recency scores and run order (no browser needed)
+"""
+from types import SimpleNamespace
+
+from plugins.failure_history import FailureHistory, changed_tests, failure_signature, file_digest, prioritize
+
+def failed_report(message, lineno=42):
+    crash = SimpleNamespace(path="/repo/tests/test_cart.py", lineno=lineno, message=message)
+    return SimpleNamespace(failed=True, longrepr=SimpleNamespace(reprcrash=crash))
+
+def test_signature_ignores_numbers_but_not_location():
+    """
+    TEST: Same timeout with other numbers = same failure; other line = other failure
+    """
+    first = failed_report("TimeoutError: Timeout 5000ms exceeded")
+    again = failed_report("TimeoutError: Timeout 5012ms exceeded")
+    elsewhere = failed_report("TimeoutError: Timeout 5000ms exceeded", lineno=50)
+    assert failure_signature(first) == failure_signature(again)
+    assert failure_signature(first) != failure_signature(elsewhere)
+    assert failure_signature(SimpleNamespace(failed=False)) is None
+
+def test_recent_failures_weigh_more(tmp_path):
+    """
+    TEST: A failure in the last run outranks one three runs ago
+    """
+    history = FailureHistory(tmp_path / "history.sqlite")
+    for outcomes in (("failed", "passed"), ("passed", "passed"), ("passed", "passed"), ("passed", "failed")):
+        run_id = history.start_run()
+        for nodeid, outcome in zip(("test_old", "test_new"), outcomes):
+            history.record(run_id, nodeid, outcome, 1.0)
+    scores = history.failure_scores()
+    assert scores["test_new"] == 1.0
+    assert scores["test_old"] == 0.125
+    [(nodeid, runs, failures, _, flaky)] = history.summary(limit=1)
+    assert (runs, failures, flaky) == (4, 1, 1)
+    history.close()
+
+def test_failed_then_changed_then_fastest():
+    """
+    TEST: The red test the developer cares about runs first
+    """
+    order = prioritize(
+        ["test_slow", "test_fast", "test_edited", "test_flaky_cart", "test_broken_login"],
+        failure_scores={"test_flaky_cart": 0.5, "test_broken_login": 1.0},
+        changed={"test_edited"},
+        durations={"test_slow": 9.0, "test_fast": 0.1, "test_edited": 3.0},
+    )
+    assert order == ["test_broken_login", "test_flaky_cart", "test_edited", "test_fast", "test_slow"]
+
+def test_changed_means_new_content_not_new_mtime(tmp_path):
+    """
+    TEST: A fresh clone (same content, new mtimes) changes nothing; an edit does
+    """
+    (tmp_path / "tests").mkdir()
+    test_file = tmp_path / "tests" / "test_cart.py"
+    test_file.write_text("def test_a(): pass\n")
+    history = FailureHistory(tmp_path / "history.sqlite")
+    history.record_file("tests/test_cart.py", file_digest(test_file))
+    known = {"tests/test_cart.py::test_a"}
+    nodeids = ["tests/test_cart.py::test_a", "tests/test_cart.py::test_b"]
+
+    test_file.touch()
+    assert changed_tests(nodeids, known, history.file_digests(), tmp_path) == {"tests/test_cart.py::test_b"}
+
+    test_file.write_text("def test_a(): assert False\n")
+    assert changed_tests(nodeids, known, history.file_digests(), tmp_path) == set(nodeids)
+    history.close()
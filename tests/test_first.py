@@ -3,7 +3,7 @@ Our very first Playwright test
 Learning: Basic page interaction
 """
 
-def test_open_website(page):
+def test_open_website(page, base_url):
     """
     WHAT THIS DOES:
     1. Opens automation practice website
@@ -13,7 +13,7 @@ def test_open_website(page):
     - page: Playwright's built-in fixture (browser page object)
     """
     # Step 1: Navigate to website
-    page.goto("https://www.automationexercise.com/")
+    page.goto(f"{base_url}/")
     
     # Step 2: Verify we're on correct site
     assert "Automation Exercise" in page.title()
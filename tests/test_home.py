@@ -3,28 +3,36 @@ Homepage Tests
 Covers: Homepage functionality
 """
 import pytest
+from pages.checks import Check
 from pages.home_page import HomePage
 
+# Read-only checks: safe to reuse a pooled context
+pytestmark = pytest.mark.shared_context
+
 @pytest.fixture
 def home_page(page):
     return HomePage(page)
 
+@pytest.mark.browserless
 def test_homepage_loads(home_page):
     """
-    TEST 9: Verify homepage loads correctly
+    TEST 9: Verify homepage loads correctly (and within budget)
     """
     home_page.navigate_to_home()
-    assert home_page.is_home_page_loaded()
+    assert home_page.is_home_page_loaded(budget=True)
     assert "Automation Exercise" in home_page.get_page_title()
 
+@pytest.mark.browserless
 def test_homepage_navigation_links(home_page):
     """
     TEST 10: Verify all main navigation links are visible
     """
     home_page.navigate_to_home()
     
-    # Verify key links visible
-    assert home_page.products_link.is_visible()
-    assert home_page.login_link.is_visible()
+    # Verify key links visible (one browser call, all failures reported)
+    home_page.check_all(
+        Check(home_page.PRODUCTS_LINK, visible=True),
+        Check(home_page.LOGIN_LINK, visible=True)
+    )
     
     print("✅ All navigation links visible")
\ No newline at end of file
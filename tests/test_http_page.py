@@ -0,0 +1,103 @@
+"""
+HTTP Protocol Mode Tests
+Covers: HttpPage links, forms, visibility, page objects on it and its browser-only limits (no browser needed)
+"""
+import pytest
+from pages.checks import Check
+from pages.drivers import BrowserDriver, driver_for
+from pages.http_page import BrowserRequiredError, HttpConnectionPool, HttpDriver, HttpPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.local_site import LocalSite
+
+@pytest.fixture(scope="module")
+def site():
+    with LocalSite() as site:
+        yield site
+
+@pytest.fixture
+def pool():
+    pool = HttpConnectionPool()
+    yield pool
+    pool.close()
+
+@pytest.fixture
+def http_page(pool):
+    return HttpPage(pool)
+
+def test_links_forms_and_cookies(site, http_page):
+    """
+    TEST: Login form POST, redirect and session cookie, like a browser
+    """
+    expect = http_page.driver.expect
+    http_page.goto(f"{site.url}/")
+    http_page.locator("a[href='/login']").click()
+    expect(http_page).to_have_url(f"{site.url}/login")
+    
+    http_page.locator("input[data-qa='login-email']").fill("testuser@example.com")
+    http_page.locator("input[data-qa='login-password']").fill("Test@123")
+    http_page.locator("button[data-qa='login-button']").click()
+    
+    expect(http_page).to_have_url(f"{site.url}/")
+    expect(http_page.locator("text=Logged in as")).to_contain_text("Test User")
+
+def test_required_fields_block_submit(site, http_page):
+    """
+    TEST: Empty required field = no request, same as the browser
+    """
+    http_page.goto(f"{site.url}/login")
+    http_page.locator("button[data-qa='login-button']").click()
+    assert http_page.url == f"{site.url}/login"
+
+def test_hidden_elements_and_strict_locators(site, http_page):
+    """
+    TEST: hidden/display:none count as not visible; actions need one match
+    """
+    http_page.goto(f"{site.url}/view_cart")
+    assert http_page.locator("#empty_cart").is_visible()
+    http_page.goto(f"{site.url}/products")
+    assert not http_page.locator("#cartModal").is_visible()
+    assert http_page.locator(".productinfo").count() == 12
+    with pytest.raises(AssertionError, match="matched 12 elements"):
+        http_page.locator(".productinfo").inner_text()
+
+def test_javascript_actions_need_a_browser(site, http_page):
+    """
+    TEST: AJAX add-to-cart fails loudly instead of silently doing nothing
+    """
+    http_page.goto(f"{site.url}/products")
+    with pytest.raises(BrowserRequiredError):
+        http_page.locator(".add-to-cart").first.click()
+
+def test_connections_are_reused(site, pool, http_page):
+    """
+    TEST: Keep-alive: sequential requests share one connection
+    """
+    for _ in range(5):
+        http_page.goto(f"{site.url}/")
+    assert sum(len(idle) for idle in pool._idle.values()) == 1
+
+def test_page_objects_run_unchanged(site, http_page):
+    """
+    TEST: Batched checks, budgets and assertions of page objects work on HttpPage
+    """
+    http_page.goto(f"{site.url}/login")
+    login_page = LoginPage(http_page)
+    login_page.check_all(Check(login_page.LOGIN_BUTTON, visible=True), timeout=1000)
+    with pytest.raises(AssertionError, match="1 of 1 checks failed"):
+        login_page.check_all(Check("#no-such-form", visible=True), timeout=1000)
+    assert login_page.check_budget() is None
+
+    products_page = ProductsPage(http_page)
+    products_page.base_url = site.url
+    http_page.goto(f"{site.url}/products")
+    products_page.verify_products_page_loaded()
+    with pytest.raises(BrowserRequiredError):
+        http_page.evaluate("() => document.title")
+
+def test_page_objects_pick_their_driver(pool):
+    """
+    TEST: HttpPage brings its own driver; anything else is driven as a browser page
+    """
+    assert isinstance(driver_for(HttpPage(pool)), HttpDriver)
+    assert isinstance(driver_for(object()), BrowserDriver)
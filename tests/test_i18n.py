@@ -2,14 +2,22 @@
 Internationalization (i18n) Tests
 Tests application behavior across different locales
 """
+import re
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
 import pytest
+from config.locale_registry import SITE_FORMAT, get_locale
 from config.locales import get_all_locales, get_locale_config
+from pages.async_pages.home_page import AsyncHomePage
 from pages.home_page import HomePage
+from pages.products_page import ProductsPage
+from utils.locale_fanout import fan_out_locales, raise_for_failures
 
 # ============ PARAMETERIZED LOCALE TESTS ============
 
 @pytest.mark.parametrize("locale", ["en-US", "fr-FR", "de-DE"])
-def test_homepage_in_different_locales(page, locale, locale_config):
+def test_homepage_in_different_locales(locale_page, locale, locale_config):
     """
     TEST: Verify homepage works in multiple locales
     
@@ -21,16 +29,17 @@ def test_homepage_in_different_locales(page, locale, locale_config):
     """
     print(f"\n🌍 Testing with locale: {locale_config['name']}")
     
-    # Create new context with specific locale
-    home_page = HomePage(page)
+    # locale_page: context built with this locale + timezone
+    home_page = HomePage(locale_page)
     home_page.navigate_to_home()
     
     # Verify page loads
     assert home_page.is_home_page_loaded()
     print(f"✅ Homepage loaded for {locale}")
 
+@pytest.mark.locale_matrix
 @pytest.mark.parametrize("locale", get_all_locales())
-def test_all_supported_locales(page, locale, locale_config):
+def test_all_supported_locales(locale_page, locale, locale_config):
     """
     TEST: Verify site works in ALL supported locales
     
@@ -38,132 +47,190 @@ def test_all_supported_locales(page, locale, locale_config):
     - Dynamic parameterization
     - Testing against all configured locales
     
-    RUNS: Once for each locale in locales.py
+    RUNS: Once for each locale in locales.py with --locale-matrix=full;
+    by default only a subset covering every formatting attribute
+    (see plugins/locale_matrix.py)
     """
     print(f"\n🌍 Locale: {locale_config['name']}")
     print(f"   Timezone: {locale_config['timezone']}")
     print(f"   Currency: {locale_config['currency_symbol']}")
     
-    home_page = HomePage(page)
+    home_page = HomePage(locale_page)
     home_page.navigate_to_home()
     
     # Basic verification
     assert "Automation" in home_page.get_page_title()
+    
+    # Browser really runs in this locale/timezone
+    assert locale_page.evaluate("() => navigator.language") == locale
+    assert locale_page.evaluate(
+        "() => Intl.DateTimeFormat().resolvedOptions().timeZone"
+    ) == locale_config["timezone"]
     print(f"✅ Passed for {locale}")
 
+def test_all_locales_concurrently(base_url, browser_name, browser_type_launch_args):
+    """
+    TEST: Same homepage check, every locale at the same time
+    
+    DEMONSTRATES:
+    - Async page objects (pages/async_pages/)
+    - One browser, one context per locale, one event loop
+    
+    RUNS: Once; cost stays roughly flat as locales are added
+    """
+    async def homepage_loads(page, locale_config):
+        home_page = AsyncHomePage(page)
+        await home_page.navigate_to_home()
+        assert await home_page.is_home_page_loaded()
+        return await page.evaluate("() => navigator.language")
+    
+    results = fan_out_locales(
+        homepage_loads,
+        browser_name=browser_name,
+        launch_args=browser_type_launch_args,
+        context_args={"viewport": {"width": 1920, "height": 1080}}
+    )
+    
+    raise_for_failures(results)
+    for locale, result in results.items():
+        assert result.value == locale
+        print(f"   ✓ {locale} in {result.seconds:.2f}s")
+    print(f"✅ {len(results)} locales checked concurrently")
+
 # ============ CURRENCY & NUMBER FORMAT TESTS ============
 
-def test_currency_display_format(page, locale_config):
+@pytest.mark.parametrize("locale", ["en-US", "en-GB", "de-DE", "fr-FR"])
+def test_currency_display_format(locale_page, locale, locale_config):
     """
     TEST: Verify currency is displayed in correct format
     
     DEMONSTRATES:
-    - Currency formatting validation
-    - Locale-specific number formats
+    - Currency formatting validation of scraped prices
+      (config/locale_registry.py)
+    
+    NOTE: automationexercise.com always shows whole rupees ("Rs. 500"),
+    whatever the browser locale: every price must parse in the site's
+    format (SITE_FORMAT), none in the visitor's currency
     """
-    print(f"\n💰 Testing currency: {locale_config['currency']}")
-    print(f"   Symbol: {locale_config['currency_symbol']}")
-    print(f"   Decimal separator: {locale_config['decimal_separator']}")
+    print(f"\n💰 Browser currency: {locale_config['currency']} ({locale_config['currency_symbol']})")
     
     # Navigate to products page (has prices)
-    page.goto("https://www.automationexercise.com/products")
+    products_page = ProductsPage(locale_page)
+    products_page.navigate_to_products()
     
-    # Example: Check if prices exist
-    # (Actual validation would check format)
-    prices = page.locator(".productinfo h2")
-    assert prices.count() > 0
+    # Every price in one browser call
+    prices = products_page.snapshot_catalog()["price"]
+    assert len(prices) > 0
+    print(f"   First price shown: {prices[0]}")
     
-    first_price = prices.first.inner_text()
-    print(f"   First price found: {first_price}")
+    report = SITE_FORMAT.validate_prices(prices)
+    assert report.ok, report.invalid[:5]
+    assert all(value > 0 for value in report.values)
     
-    # Verify currency symbol or format
-    # Note: automationexercise.com uses Rs. (Rupees)
-    # In real scenarios, you'd verify against locale_config
-    assert "Rs" in first_price
+    # Not converted or re-formatted for this locale
+    assert get_locale(locale).validate_prices(prices).values == [None] * len(prices)
+    print(f"✅ {len(prices)} prices in the site's format for {locale}")
 
 # ============ DATE FORMAT TESTS ============
 
+# Anything that looks like a numeric date: 31/01/2024, 2024/01/31, 31.1.2024
+DATE_LIKE = re.compile(r"(?<![\d.,])\d{1,4}[./-]\d{1,2}[./-]\d{2,4}(?![\d.,])")
+
 @pytest.mark.parametrize("locale", ["en-US", "en-GB", "de-DE", "ja-JP"])
-def test_date_format_display(page, locale, locale_config):
+def test_date_format_display(locale_page, locale, locale_config):
     """
     TEST: Verify dates display in correct format
     
     DEMONSTRATES:
-    - Date format validation across locales
+    - Date format validation of scraped page text
     
-    FORMATS:
-    - en-US: MM/DD/YYYY
-    - en-GB: DD/MM/YYYY
-    - de-DE: DD.MM.YYYY
-    - ja-JP: YYYY/MM/DD
+    CHECKS: Every date shown on the home and products pages parses
+    in the site's format (SITE_FORMAT.date_format), under this
+    browser locale ({locale_config['date_format']} for its own dates)
     """
-    print(f"\n📅 Testing date format: {locale_config['date_format']}")
+    print(f"\n📅 Browser date format: {locale_config['date_format']}")
     
-    page.goto("https://www.automationexercise.com/")
-    
-    # In real app, you would:
-    # 1. Find date elements
-    # 2. Validate format matches locale_config['date_format']
-    # 3. Verify separators (/, -, .)
-    
-    print(f"   Expected format: {locale_config['date_format']}")
+    home_page = HomePage(locale_page)
+    home_page.navigate_to_home()
+    shown = DATE_LIKE.findall(locale_page.locator("body").inner_text())
+    products_page = ProductsPage(locale_page)
+    products_page.navigate_to_products()
+    shown += DATE_LIKE.findall(locale_page.locator("body").inner_text())
+    
+    print(f"   Dates on the pages: {shown or 'none'}")
+    report = SITE_FORMAT.validate_dates(shown)
+    assert report.ok, report.invalid
     print(f"✅ Date format test passed for {locale}")
 
 # ============ RTL (Right-to-Left) TESTS ============
 
 @pytest.mark.parametrize("locale", ["ar-SA"])
-def test_rtl_layout(page, locale, locale_config, is_rtl):
+def test_rtl_layout(locale_page, locale, is_rtl):
     """
     TEST: Verify RTL layout for Arabic locale
     
     DEMONSTRATES:
     - RTL text direction validation
-    - Layout mirroring verification
+    
+    NOTE: automationexercise.com (and the local stand-in) serve the
+    same English page to every locale, so this checks the layout
+    follows the direction the document declares. Whether the page
+    looks right in ar-SA is checked by its visual baseline:
+    test_rtl_home_page_visual (tests/test_visual.py)
     """
     print(f"\n↔️ Testing RTL: {is_rtl}")
-    
-    if is_rtl:
-        page.goto("https://www.automationexercise.com/")
-        
-        # Verify body direction attribute
-        body = page.locator("body")
-        
-        # In real RTL site, would check:
-        # - dir="rtl" attribute
-        # - CSS text-align: right
-        # - Reversed layout
-        
-        print("✅ RTL layout test executed")
-    else:
+    if not is_rtl:
         pytest.skip("Not an RTL locale")
+    
+    home_page = HomePage(locale_page)
+    home_page.navigate_to_home()
+    assert home_page.is_home_page_loaded()
+    
+    # The browser really asks for Arabic
+    assert locale_page.evaluate("() => navigator.language") == locale
+    
+    # No half-mirrored page: computed direction = declared direction
+    declared = (locale_page.locator("html").get_attribute("dir") or "ltr").lower()
+    computed = locale_page.evaluate("() => getComputedStyle(document.body).direction")
+    print(f"   Declared: {declared}, computed: {computed}")
+    assert computed == declared
+    print("✅ RTL layout test executed")
 
 # ============ TIMEZONE TESTS ============
 
-def test_timezone_handling(page, locale_config):
+@pytest.mark.parametrize("locale", ["en-US", "de-DE", "ja-JP"])
+def test_timezone_handling(locale_page, locale, locale_config):
     """
     TEST: Verify timezone is set correctly
     
     DEMONSTRATES:
     - Timezone verification
-    - Time display validation
+    - Time display validation (UTC offset, incl. daylight saving)
     """
     print(f"\n🕐 Testing timezone: {locale_config['timezone']}")
     
     # Execute JavaScript to get browser timezone
-    browser_timezone = page.evaluate("""
+    browser_timezone = locale_page.evaluate("""
         () => Intl.DateTimeFormat().resolvedOptions().timeZone
     """)
-    
     print(f"   Browser timezone: {browser_timezone}")
     print(f"   Expected: {locale_config['timezone']}")
-    
-    # Note: This requires browser context to be configured with timezone
-    # See browser_context_args_with_locale fixture
+    assert browser_timezone == locale_config["timezone"]
+    
+    # Local time really follows the zone, in winter and in summer
+    zone = ZoneInfo(locale_config["timezone"])
+    instants = [datetime(2024, 1, 15, 12, tzinfo=timezone.utc), datetime(2024, 7, 15, 12, tzinfo=timezone.utc)]
+    offsets = locale_page.evaluate(
+        "(isoTimes) => isoTimes.map(iso => -new Date(iso).getTimezoneOffset())",
+        [instant.isoformat() for instant in instants]
+    )
+    assert offsets == [instant.astimezone(zone).utcoffset() // timedelta(minutes=1) for instant in instants]
+    print(f"✅ Timezone {browser_timezone}, UTC offsets {offsets} min")
 
 # ============ CHARACTER ENCODING TESTS ============
 
 @pytest.mark.parametrize("locale", ["zh-CN", "ja-JP", "ar-SA"])
-def test_character_encoding(page, locale, locale_config):
+def test_character_encoding(locale_page, locale, locale_config, base_url):
     """
     TEST: Verify special characters display correctly
     
@@ -173,10 +240,10 @@ def test_character_encoding(page, locale, locale_config):
     """
     print(f"\n🔤 Testing encoding for: {locale_config['name']}")
     
-    page.goto("https://www.automationexercise.com/")
+    locale_page.goto(f"{base_url}/")
     
     # Check page encoding
-    charset = page.evaluate("""
+    charset = locale_page.evaluate("""
         () => document.characterSet
     """)
     
@@ -186,7 +253,7 @@ def test_character_encoding(page, locale, locale_config):
 
 # ============ LOCALE SWITCHING TEST ============
 
-def test_locale_switching(page):
+def test_locale_switching(page, base_url):
     """
     TEST: Verify user can switch between locales
     
@@ -204,7 +271,7 @@ def test_locale_switching(page):
         print(f"   Switching to: {config['name']}")
         
         # Navigate to home page
-        page.goto("https://www.automationexercise.com/")
+        page.goto(f"{base_url}/")
         
         # In real app:
         # 1. Click locale switcher
@@ -0,0 +1,175 @@
+"""
+Test Impact Tests
+Covers: the page-object index, fixture typing and diff -> selection (no browser needed)
+"""
+import textwrap
+
+from plugins.impact import ImpactIndex
+
+PAGES = {
+    "pages/base_page.py": """
+        class BasePage:
+            def __init__(self, page):
+                self.page = page
+
+            def navigate(self, url):
+                self.page.goto(url)
+    """,
+    "pages/login_page.py": """
+        from pages.base_page import BasePage
+
+        class LoginPage(BasePage):
+            @property
+            def signup_button(self):
+                return self.page.locator("text=Signup")
+
+            @property
+            def login_button(self):
+                return self.page.locator("text=Login")
+
+            def open(self):
+                self.navigate("/login")
+
+            def sign_up(self):
+                self.open()
+                self.signup_button.click()
+    """,
+    "pages/cart_page.py": """
+        from pages.base_page import BasePage
+
+        class CartPage(BasePage):
+            def delete_button(self, product_id):
+                return self.page.locator(product_id)
+    """,
+    "tests/conftest.py": """
+        import pytest
+        from pages.login_page import LoginPage
+
+        @pytest.fixture(autouse=True)
+        def base_url():
+            return "http://localhost"
+
+        @pytest.fixture
+        def login_page(page):
+            return LoginPage(page)
+
+        @pytest.fixture
+        def opened_login(login_page):
+            login_page.open()
+            yield login_page
+    """,
+    "tests/test_login.py": """
+        from pages.cart_page import CartPage
+
+        def test_signup(opened_login):
+            opened_login.sign_up()
+
+        def test_login(login_page):
+            login_page.login_button.click()
+
+        def test_cart(page):
+            cart = CartPage(page)
+            cart.delete_button("1").click()
+    """,
+}
+
+def build(tmp_path):
+    for path, source in PAGES.items():
+        target = tmp_path / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(textwrap.dedent(source), encoding="utf-8")
+    (tmp_path / "utils").mkdir()
+    return ImpactIndex(tmp_path)
+
+def line_of(tmp_path, path, text):
+    lines = (tmp_path / path).read_text(encoding="utf-8").splitlines()
+    return next(number for number, line in enumerate(lines, 1) if text in line)
+
+def test_members_reach_tests_through_fixtures_and_inheritance(tmp_path):
+    """
+    TEST: opened_login yields login_page -> LoginPage; sign_up uses signup_button and BasePage.navigate
+    """
+    index = build(tmp_path)
+    assert index.tests_using("LoginPage.signup_button") == ["tests/test_login.py::test_signup"]
+    assert index.tests_using("LoginPage.navigate") == ["tests/test_login.py::test_signup"]
+    assert index.tests_using("CartPage.delete_button") == ["tests/test_login.py::test_cart"]
+    assert "BasePage.__init__" in index.dependencies["tests/test_login.py::test_login"]
+
+def test_changed_locator_selects_only_its_tests(tmp_path):
+    """
+    TEST: Editing LoginPage.signup_button runs test_signup, not the rest
+    """
+    index = build(tmp_path)
+    line = line_of(tmp_path, "pages/login_page.py", 'locator("text=Signup")')
+    selected, everything = index.impacted(index.changes_from_diff({"pages/login_page.py": [(line, line)]}))
+    assert everything is None
+    assert selected == {"tests/test_login.py::test_signup"}
+
+def test_base_class_and_fixture_changes(tmp_path):
+    """
+    TEST: A BasePage class-level change reaches subclasses; a fixture change reaches its users
+    """
+    index = build(tmp_path)
+    line = line_of(tmp_path, "pages/base_page.py", "class BasePage")
+    selected, _ = index.impacted(index.changes_from_diff({"pages/base_page.py": [(line, line)]}))
+    assert len(selected) == 3
+
+    line = line_of(tmp_path, "tests/conftest.py", "login_page.open()")
+    selected, _ = index.impacted(index.changes_from_diff({"tests/conftest.py": [(line, line)]}))
+    assert selected == {"tests/test_login.py::test_signup"}
+
+def test_unknown_changes_run_everything(tmp_path):
+    """
+    TEST: Anything it can't map (config, autouse fixtures, new conftest) runs the whole suite
+    """
+    index = build(tmp_path)
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "settings.py").write_text("BASE_URL = ''\n", encoding="utf-8")
+    autouse = line_of(tmp_path, "tests/conftest.py", '"http://localhost"')
+    for changed in (
+        {"config/settings.py": [(1, 1)]},
+        {"tests/conftest.py": [(autouse, autouse)]},
+        {"tests/conftest.py": [None]},
+    ):
+        selected, everything = index.impacted(index.changes_from_diff(changed))
+        assert selected is None and everything
+    selected, everything = index.impacted(index.changes_from_diff({"README.md": [(1, 1)]}))
+    assert selected == set() and everything is None
+
+def test_mixin_locator_reaches_helper_users(tmp_path):
+    """
+    TEST: A *Locators mixin member is also its async page's; tests importing helpers that use it run
+    """
+    index = build(tmp_path)
+    (tmp_path / "pages" / "async_login_page.py").write_text(textwrap.dedent("""
+        from pages.login_page import LoginLocators
+
+        class AsyncLoginPage(LoginLocators):
+            async def sign_up(self):
+                await self.page.click("text=Signup")
+    """), encoding="utf-8")
+    (tmp_path / "pages" / "login_page.py").write_text(textwrap.dedent("""
+        from pages.base_page import BasePage
+
+        class LoginLocators:
+            @property
+            def signup_button(self):
+                return self.page.locator("text=Signup")
+
+        class LoginPage(LoginLocators, BasePage):
+            def sign_up(self):
+                self.signup_button.click()
+    """), encoding="utf-8")
+    (tmp_path / "utils" / "journeys.py").write_text(textwrap.dedent("""
+        from pages.async_login_page import AsyncLoginPage
+
+        async def sign_up(page):
+            await AsyncLoginPage(page).sign_up()
+    """), encoding="utf-8")
+    (tmp_path / "tests" / "test_load.py").write_text("import utils.journeys\n\ndef test_load():\n    pass\n", encoding="utf-8")
+    index = ImpactIndex(tmp_path)
+
+    line = line_of(tmp_path, "pages/login_page.py", 'locator("text=Signup")')
+    selected, everything = index.impacted(index.changes_from_diff({"pages/login_page.py": [(line, line)]}))
+    assert everything is None
+    assert selected == {"tests/test_login.py::test_signup", "tests/test_load.py::test_load"}
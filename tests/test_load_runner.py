@@ -0,0 +1,39 @@
+"""
+Load Runner Tests
+Covers: latency histograms and a small load run against the site
+"""
+from utils.journeys import browse_and_buy, login
+from utils.load_runner import LatencyHistogram, generate_load
+
+def test_histogram_buckets_and_percentiles():
+    """
+    TEST: Samples land in the right bucket; errors are counted
+    """
+    histogram = LatencyHistogram()
+    for ms in (10, 40, 120, 20000):
+        histogram.add(ms)
+    histogram.add(600, ok=False)
+    buckets = dict(histogram.buckets())
+    assert buckets["<=50ms"] == 2
+    assert buckets["<=250ms"] == 1
+    assert buckets["<=1000ms"] == 1
+    assert buckets[">10000ms"] == 1
+    stats = histogram.summary()
+    assert (stats["count"], stats["errors"], stats["p50"], stats["max"]) == (5, 1, 120, 20000)
+
+def test_small_load_run(base_url, browser_name, browser_type_launch_args):
+    """
+    TEST: 4 users, 2 at a time, both journeys, every step timed
+    """
+    report = generate_load(
+        [browse_and_buy, login],
+        users=4,
+        concurrency=2,
+        browser_name=browser_name,
+        launch_args=browser_type_launch_args,
+    )
+    print(report.format())
+    assert report.journeys_failed == 0, report.errors
+    assert report.journeys_passed == 4
+    assert report.histograms["remove_product"].summary()["count"] == 2
+    assert report.histograms["perform_login"].summary()["count"] == 2
@@ -0,0 +1,80 @@
+"""
+Local Stand-in Server Tests
+Covers: Pages and flows the page objects rely on (no browser needed)
+"""
+import pytest
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, build_opener
+from utils.local_site import LocalSite
+
+@pytest.fixture(scope="module")
+def site():
+    with LocalSite() as site:
+        yield site
+
+@pytest.fixture
+def browser_like(site):
+    """Cookie-aware HTTP client, like one browser context"""
+    opener = build_opener(HTTPCookieProcessor(CookieJar()))
+
+    def fetch(path, form=None):
+        data = urlencode(form).encode() if form else None
+        with opener.open(f"{site.url}{path}", data=data) as response:
+            return response.read().decode("utf-8")
+
+    return fetch
+
+def test_home_page_served(browser_like):
+    """
+    TEST: Home page has the slider and navigation links
+    """
+    html = browser_like("/")
+    assert "<title>Automation Exercise</title>" in html
+    assert 'id="slider"' in html
+    assert "href='/login'" in html.replace('"', "'")
+
+def test_search_filters_products(browser_like):
+    """
+    TEST: Search only returns matching products
+    """
+    html = browser_like("/products?search=Blue+Top")
+    assert "Searched Products" in html
+    assert html.count('class="productinfo') == 1
+
+def test_cart_add_and_delete(browser_like):
+    """
+    TEST: Cart state follows add/delete calls for the same session
+    """
+    assert "display: block" in browser_like("/view_cart")
+
+    browser_like("/add_to_cart/1")
+    assert 'id="product-1"' in browser_like("/view_cart")
+
+    browser_like("/delete_cart/1")
+    html = browser_like("/view_cart")
+    assert 'id="product-1"' not in html
+    assert "Cart is empty!" in html
+
+def test_login_with_wrong_password(browser_like):
+    """
+    TEST: Wrong credentials show the same error as the real site
+    """
+    html = browser_like("/login", {"email": "testuser@example.com", "password": "nope"})
+    assert "Your email or password is incorrect!" in html
+
+def test_login_with_known_user(browser_like):
+    """
+    TEST: Known user is redirected home and shown as logged in
+    """
+    html = browser_like("/login", {"email": "testuser@example.com", "password": "Test@123"})
+    assert "Logged in as <b>Test User</b>" in html
+
+def test_unknown_path_returns_404(browser_like):
+    """
+    TEST: Unknown pages are not silently served
+    """
+    with pytest.raises(HTTPError) as error:
+        browser_like("/does-not-exist")
+    assert error.value.code == 404
@@ -0,0 +1,35 @@
+"""
+Locale Matrix Tests
+Covers: covering subsets of locale × browser (no browser needed)
+"""
+import pytest
+
+from config.locales import get_all_locales
+from plugins.locale_matrix import combinations_of, covering_cases
+
+BROWSERS = ["chromium", "firefox", "webkit"]
+FULL = [(locale, browser) for locale in get_all_locales() for browser in BROWSERS]
+
+@pytest.mark.parametrize("strength", [1, 2])
+def test_subset_covers_what_the_full_matrix_covers(strength):
+    """
+    TEST: Fewer cases, same attribute values (each) or value pairs (pairwise)
+    """
+    subset = covering_cases(FULL, strength)
+    assert len(subset) < len(FULL)
+    assert combinations_of(subset, strength) == combinations_of(FULL, strength)
+
+def test_each_mode_is_a_fraction_of_the_sessions():
+    """
+    TEST: Every browser and every formatting value, in about a quarter of the runs
+    """
+    subset = covering_cases(FULL, 1)
+    assert {browser for _, browser in subset} == set(BROWSERS)
+    assert "ar-SA" in {locale for locale, _ in subset}   # Only RTL locale
+    assert len(subset) <= len(FULL) // 3
+
+def test_subset_is_deterministic():
+    """
+    TEST: Every xdist worker deselects the same cases
+    """
+    assert covering_cases(FULL, 2) == covering_cases(list(FULL), 2)
@@ -0,0 +1,82 @@
+"""
+Locale Registry Tests
+Covers: compiled formatters/parsers and bulk validation (no browser needed)
+"""
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from config.locale_registry import LOCALE_REGISTRY, SITE_FORMAT, get_locale
+from config.locales import SUPPORTED_LOCALES
+
+@pytest.mark.parametrize("locale", sorted(SUPPORTED_LOCALES))
+def test_formatters_round_trip(locale):
+    """
+    TEST: Whatever a locale formats, it parses back
+    """
+    record = get_locale(locale)
+    amount = Decimal("1234567") if record.currency_decimals == 0 else Decimal("1234567.50")
+    assert record.parse_currency(record.format_currency(amount)) == amount
+    assert record.parse_number(record.format_number(-1234.5)) == Decimal("-1234.50")
+    assert record.parse_date(record.format_date(date(2024, 1, 31))) == date(2024, 1, 31)
+
+@pytest.mark.parametrize("locale, price, expected", [
+    ("en-US", "$1,234.56", Decimal("1234.56")),
+    ("de-DE", "1.234,56 €", Decimal("1234.56")),
+    ("fr-FR", "1 234,56 €", Decimal("1234.56")),   # As browsers print it
+    ("ja-JP", "¥1,235", Decimal("1235")),
+])
+def test_scraped_prices_parse(locale, price, expected):
+    """
+    TEST: Real-world spellings (grouping, NBSP, no decimals for yen)
+    """
+    assert get_locale(locale).parse_currency(price) == expected
+
+@pytest.mark.parametrize("locale, shown, expected", [
+    ("en-US", "1/31/2024", date(2024, 1, 31)),
+    ("de-DE", "31.1.2024", date(2024, 1, 31)),
+    ("ja-JP", "2024/1/5", date(2024, 1, 5)),
+    ("en-GB", "05/12/2024", date(2024, 12, 5)),
+])
+def test_browser_dates_parse(locale, shown, expected):
+    """
+    TEST: Unpadded days/months, as toLocaleDateString() prints them
+    """
+    assert get_locale(locale).parse_date(shown) == expected
+
+def test_bulk_validation_reports_every_bad_string():
+    """
+    TEST: One call checks a whole catalog and points at the offenders
+    """
+    de = get_locale("de-DE")
+    prices = ["1.234,56 €", "$1,234.56", "9,99 €", "1,234.56 €"] * 1000
+    report = de.validate_prices(prices)
+    assert not report.ok
+    assert len(report.invalid) == 2000
+    assert report.invalid[:2] == [(1, "$1,234.56"), (3, "1,234.56 €")]
+    assert report.values[:3] == [Decimal("1234.56"), None, Decimal("9.99")]
+
+    dates = de.validate_dates(["31.01.2024", "31/01/2024", "30.02.2024"])
+    assert [index for index, _ in dates.invalid] == [1, 2]
+
+def test_records_are_immutable_and_match_config():
+    """
+    TEST: Records can't drift from SUPPORTED_LOCALES at runtime
+    """
+    record = LOCALE_REGISTRY["ar-SA"]
+    assert record.rtl and record.currency_position == "suffix"
+    with pytest.raises(AttributeError):
+        record.currency_symbol = "$"
+    with pytest.raises(TypeError):
+        LOCALE_REGISTRY["xx-XX"] = record
+    assert get_locale("xx-XX") is LOCALE_REGISTRY["en-US"]
+
+def test_site_format_reads_catalog_prices():
+    """
+    TEST: The site's own "Rs. 500" prices (whole rupees) parse; other formats don't
+    """
+    report = SITE_FORMAT.validate_prices(["Rs. 500", "Rs. 1,050", "Rs.400", "Rs. 500.00", "$5"])
+    assert report.values[:3] == [Decimal("500"), Decimal("1050"), Decimal("400")]
+    assert report.invalid == [(3, "Rs. 500.00"), (4, "$5")]
+    assert SITE_FORMAT.validate_dates(["31/01/2024"]).ok
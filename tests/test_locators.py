@@ -5,40 +5,43 @@ Website: https://www.automationexercise.com/
 import pytest
 from playwright.sync_api import expect
 
-def test_locator_by_text(page):
+# Read-only checks: safe to reuse a pooled context
+pytestmark = pytest.mark.shared_context
+
+def test_locator_by_text(page, base_url):
     """
     Strategy: Finding elements by visible text
     When to use: Links, buttons with text
     """
-    page.goto("https://www.automationexercise.com/")
+    page.goto(f"{base_url}/")
     
     # Find and click "Products" link by text
     page.get_by_text("Products").first.click()
     
     # Verify navigation
-    expect(page).to_have_url("https://www.automationexercise.com/products")
+    expect(page).to_have_url(f"{base_url}/products")
     print("✅ Text locator worked")
 
-def test_locator_by_role(page):
+def test_locator_by_role(page, base_url):
     """
     Strategy: Finding by ARIA role (BEST PRACTICE)
     When to use: Buttons, links, inputs with clear roles
     """
-    page.goto("https://www.automationexercise.com/")
+    page.goto(f"{base_url}/")
     
     # Find link by role and name
     page.get_by_role("link", name="Products").click()
     
     # Verify
-    expect(page).to_have_url("https://www.automationexercise.com/products")
+    expect(page).to_have_url(f"{base_url}/products")
     print("✅ Role locator worked")
 
-def test_locator_by_placeholder(page):
+def test_locator_by_placeholder(page, base_url):
     """
     Strategy: Finding input by placeholder text
     When to use: Search boxes, input fields
     """
-    page.goto("https://www.automationexercise.com/products")
+    page.goto(f"{base_url}/products")
     
     # Find search box by placeholder
     search_box = page.get_by_placeholder("Search Product")
@@ -49,16 +52,16 @@ def test_locator_by_placeholder(page):
     
     print("✅ Placeholder locator worked")
 
-def test_locator_by_css(page):
+def test_locator_by_css(page, base_url):
     """
     Strategy: CSS selector
     When to use: When no better option available
     """
-    page.goto("https://www.automationexercise.com/")
+    page.goto(f"{base_url}/")
     
     # CSS selector for signup/login link
     page.locator("a[href='/login']").click()
     
     # Verify navigation
-    expect(page).to_have_url("https://www.automationexercise.com/login")
+    expect(page).to_have_url(f"{base_url}/login")
     print("✅ CSS locator worked")
\ No newline at end of file
@@ -15,6 +15,7 @@ def login_page(page):
 def home_page(page):
     return HomePage(page)
 
+@pytest.mark.browserless
 def test_navigate_to_login(home_page, login_page):
     """
     TEST 6: Navigate to login page
@@ -23,6 +24,7 @@ def test_navigate_to_login(home_page, login_page):
     home_page.click_login()
     login_page.verify_login_page_loaded()
 
+@pytest.mark.browserless
 def test_login_with_invalid_email(login_page):
     """
     TEST 7: Login with invalid credentials
@@ -34,6 +36,7 @@ def test_login_with_invalid_email(login_page):
     error = login_page.page.locator("text=Your email or password is incorrect")
     assert error.is_visible()
 
+@pytest.mark.browserless
 def test_signup_page_accessible(home_page, login_page):
     """
     TEST 8: Verify signup form is accessible
@@ -43,4 +46,15 @@ def test_signup_page_accessible(home_page, login_page):
     
     # Verify signup form visible
     assert login_page.signup_button.is_visible()
-    print("✅ Signup form accessible")
\ No newline at end of file
+    print("✅ Signup form accessible")
+
+def test_cached_login_session(logged_in_page):
+    """
+    TEST 11: Reuse a cached login instead of the login form
+    """
+    home_page = HomePage(logged_in_page)
+    home_page.navigate_to_home()
+    
+    # Logged in without touching the login form
+    assert LoginPage(logged_in_page).logged_in_as.is_visible()
+    print("✅ Cached login reused")
@@ -0,0 +1,91 @@
+"""
+Network Record/Replay Tests
+Covers: HAR archives replayed against a stand-in on another port
+"""
+import json
+from pathlib import Path
+
+from config.settings import get_base_url, set_base_url
+from utils.local_site import LocalSite
+from utils.network import RECORD, REPLAY, HarRouter, rewrite_origin
+
+def test_rewrite_origin_moves_urls_and_headers():
+    """
+    TEST: URLs and Host headers follow the new port; other hosts are untouched
+    """
+    har = json.dumps({"log": {"entries": [{
+        "request": {
+            "url": "http://127.0.0.1:51234/products",
+            "headers": [{"name": "Host", "value": "127.0.0.1:51234"}],
+        },
+        "response": {"redirectURL": "http://127.0.0.1:51234/login"},
+    }, {
+        "request": {"url": "https://cdn.example.com/app.js", "headers": []},
+        "response": {"redirectURL": ""},
+    }]}})
+    entries = json.loads(rewrite_origin(har, "http://127.0.0.1:51234", "http://127.0.0.1:40111"))["log"]["entries"]
+    assert entries[0]["request"]["url"] == "http://127.0.0.1:40111/products"
+    assert entries[0]["request"]["headers"][0]["value"] == "127.0.0.1:40111"
+    assert entries[0]["response"]["redirectURL"] == "http://127.0.0.1:40111/login"
+    assert entries[1]["request"]["url"] == "https://cdn.example.com/app.js"
+    assert rewrite_origin(har, "http://127.0.0.1:51234", "http://127.0.0.1:51234") == har
+
+class FakePage:
+    def __init__(self):
+        self.calls = []
+
+    def route(self, url, handler):
+        self.calls.append(("route", url))
+
+    def route_from_har(self, har, **options):
+        self.calls.append(("route_from_har", Path(har).name, options.get("update", False)))
+
+def test_page_objects_on_one_page_share_its_archive(tmp_path):
+    """
+    TEST: A second page object records nothing of its own (no overlapping HARs)
+    """
+    recorder = HarRouter(RECORD, tmp_path)
+    recorder.start_test("test_login_flow")
+    page, popup = FakePage(), FakePage()
+    recorder.install(page)   # HomePage.navigate
+    recorder.install(page)   # LoginPage.navigate, same page
+    recorder.install(popup)
+    assert page.calls == [("route_from_har", "page-1.har", True)]
+    assert popup.calls == [("route_from_har", "page-2.har", True)]
+
+    recorder.start_test("test_logout")
+    recorder.install(FakePage())
+    assert (tmp_path / "test_logout" / "page-1.origin").exists()
+
+def test_replay_on_another_port(browser, tmp_path):
+    """
+    TEST: Recorded against one LocalSite, replayed against a second one on a new port
+    """
+    original = get_base_url()
+    try:
+        with LocalSite() as site:
+            set_base_url(site.url)
+            recorder = HarRouter(RECORD, tmp_path)
+            recorder.start_test("test_replay_on_another_port")
+            context = browser.new_context()
+            page = context.new_page()
+            recorder.install(page)
+            page.goto(f"{site.url}/products")
+            context.close()  # Archive is written when the context closes
+            recorded_url = site.url
+
+        with LocalSite() as site:
+            assert site.url != recorded_url
+            set_base_url(site.url)
+            replayer = HarRouter(REPLAY, tmp_path)
+            replayer.start_test("test_replay_on_another_port")
+            context = browser.new_context()
+            page = context.new_page()
+            replayer.install(page)
+            page.goto(f"{site.url}/products")
+            assert "All Products" in page.content()
+            context.close()
+            replayer.raise_for_misses()
+            replayer.close()
+    finally:
+        set_base_url(original)
@@ -10,6 +10,7 @@ from pages.home_page import HomePage
 def products_page(page):
     return ProductsPage(page)
 
+@pytest.mark.browserless
 def test_view_all_products(home_page, products_page):
     """
     TEST 1: View all products
@@ -24,6 +25,7 @@ def test_view_all_products(home_page, products_page):
     # Verify products are visible
     assert products_page.get_product_count() > 0
 
+@pytest.mark.browserless
 def test_search_product(products_page):
     """
     TEST 2: Search for specific product
@@ -46,4 +48,22 @@ def test_add_product_to_cart(products_page):
     products_page.add_first_product_to_cart()
     
     # Verify (we stayed on products page)
-    products_page.verify_products_page_loaded()
\ No newline at end of file
+    products_page.verify_products_page_loaded()
+
+def test_catalog_snapshot(products_page):
+    """
+    TEST 12: Validate the whole catalog from one snapshot
+    """
+    products_page.navigate_to_products()
+    catalog = products_page.snapshot_catalog()
+    
+    # Same cards the locator-based count sees
+    assert len(catalog) == products_page.get_product_count()
+    
+    # Every card has a name, a price and an add-to-cart target
+    incomplete = catalog.where(name="")["id"] + catalog.where(add_to_cart=None)["id"]
+    assert not incomplete, f"Incomplete product cards: {incomplete}"
+    assert all(price.startswith("Rs.") for price in catalog["price"])
+    
+    # Filter in process, no more browser calls
+    assert "Blue Top" in catalog.where(id="1")["name"]
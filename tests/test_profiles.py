@@ -0,0 +1,45 @@
+"""
+Execution Profile Tests
+Covers: profile definitions and explicit-flag detection (no browser needed)
+"""
+import pytest
+
+from config.profiles import PROFILES, get_profile
+from plugins.profiles import PROFILE_OPTIONS, explicit_dests
+
+def test_every_profile_sets_every_option():
+    """
+    TEST: No profile silently inherits another run's settings
+    """
+    for name, profile in PROFILES.items():
+        missing = set(PROFILE_OPTIONS) - set(profile)
+        assert not missing, f"{name} is missing {missing}"
+
+def test_perf_profile_is_artifact_free():
+    """
+    TEST: Benchmarks never pay for video, traces or screenshots
+    """
+    perf = get_profile("perf")
+    assert (perf["video"], perf["tracing"], perf["screenshot"]) == ("off", "off", "off")
+    assert not perf["headed"] and perf["slowmo"] == 0
+
+def test_debug_profile_matches_old_addopts():
+    """
+    TEST: The default profile behaves like the pytest.ini addopts it replaced (no tracing)
+    """
+    debug = get_profile("debug")
+    assert (debug["headed"], debug["slowmo"]) == (True, 500)
+    assert (debug["screenshot"], debug["video"], debug["tracing"]) == ("only-on-failure", "retain-on-failure", "off")
+
+@pytest.mark.parametrize("args, expected", [
+    (["--headed", "tests/test_login.py"], {"headed"}),
+    (["--video=off", "--slowmo", "100"], {"video", "slowmo"}),
+    (["-n4"], {"numprocesses"}),
+    (["-n", "auto", "-k", "login"], {"numprocesses"}),
+    (["tests/"], set()),
+])
+def test_explicit_flags_are_detected(args, expected):
+    """
+    TEST: Flags on the command line win over the profile
+    """
+    assert explicit_dests(args) == expected
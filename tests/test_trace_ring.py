@@ -0,0 +1,123 @@
+"""
+Trace Ring Tests
+Covers: which trace chunks survive until a failure (no browser needed)
+"""
+from pathlib import Path
+from types import SimpleNamespace
+
+from plugins.trace_ring import BETWEEN_ACTIONS, TraceRing, TraceRingPlugin, TraceRingRecorder
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_ring_keeps_last_actions_and_the_code_around_them():
+    """
+    TEST: 2 actions kept = 2 action chunks + 3 test-code chunks, newest last
+    """
+    ring = TraceRing(max_actions=2, max_seconds=60, clock=FakeClock())
+    for index in range(6):
+        ring.add(f"CartPage.action{index}", b"zip")
+        ring.add(BETWEEN_ACTIONS, b"zip")
+
+    labels = [label for label, _, _ in ring.chunks()]
+    assert labels == [BETWEEN_ACTIONS, "CartPage.action4", BETWEEN_ACTIONS, "CartPage.action5", BETWEEN_ACTIONS]
+
+def test_ring_drops_chunks_older_than_max_seconds(tmp_path):
+    """
+    TEST: Only the last seconds before the failure are written, in order
+    """
+    clock = FakeClock()
+    ring = TraceRing(max_actions=10, max_seconds=5, clock=clock)
+    ring.add("LoginPage.navigate", b"old")
+    clock.now = 10.0
+    ring.add("LoginPage.perform_login", b"recent")
+    ring.add(BETWEEN_ACTIONS, b"assertion")
+
+    paths = ring.dump(tmp_path)
+    assert [path.name for path in paths] == ["01-LoginPage.perform_login.zip", "02-test-code.zip"]
+    assert paths[1].read_bytes() == b"assertion"
+
+class FakeTracing:
+    """Records tracing calls; stop_chunk writes the chunk's title as its bytes"""
+
+    def __init__(self, calls):
+        self.calls = calls
+        self.title = None
+
+    def start(self, **options):
+        self.calls.append("start")
+
+    def start_chunk(self, title=None):
+        self.calls.append(f"start_chunk:{title}")
+        self.title = title
+
+    def stop_chunk(self, path=None):
+        self.calls.append(f"stop_chunk:{self.title}")
+        Path(path).write_bytes(self.title.encode())
+
+    def stop(self):
+        self.calls.append("stop")
+
+class FakeContext:
+    def __init__(self, calls):
+        self.tracing = FakeTracing(calls)
+
+class FakePage:
+    def __init__(self):
+        self.calls = []
+        self.context = FakeContext(self.calls)
+
+def run_test(recorder, page, failed, output):
+    """One test: a nested action, then the makereport hook for its call phase"""
+    page_object = SimpleNamespace(page=page)
+    outer = recorder.before(page_object, "CartPage.seed")
+    inner = recorder.before(page_object, "CartPage.navigate")  # Nested: same chunk
+    recorder.after(inner, None)
+    recorder.after(outer, None)
+
+    config = SimpleNamespace(getoption=lambda name: str(output))
+    plugin = TraceRingPlugin(config, recorder)
+    report = SimpleNamespace(when="call", passed=not failed, failed=failed, sections=[])
+    hook = plugin.pytest_runtest_makereport(SimpleNamespace(nodeid="tests/test_cart.py::test_x"), None)
+    next(hook)
+    try:
+        hook.send(SimpleNamespace(get_result=lambda: report))
+    except StopIteration:
+        pass
+    return report
+
+def test_recorder_cuts_one_chunk_per_outermost_action(tmp_path):
+    """
+    TEST: start/stop_chunk order around a nested action; the failing test gets both chunks
+    """
+    page = FakePage()
+    recorder = TraceRingRecorder(TraceRing(max_actions=10), page_type=FakePage)
+    report = run_test(recorder, page, failed=True, output=tmp_path)
+
+    assert page.calls == [
+        "start", "start_chunk:CartPage.seed",
+        "stop_chunk:CartPage.seed", f"start_chunk:{BETWEEN_ACTIONS}",
+        f"stop_chunk:{BETWEEN_ACTIONS}", "stop",
+    ]
+    written = sorted(path.name for path in tmp_path.rglob("*.zip"))
+    assert written == ["01-CartPage.seed.zip", f"02-{BETWEEN_ACTIONS}.zip"]
+    [(title, content)] = report.sections
+    assert title == "trace ring" and "2 trace chunk(s)" in content
+    assert recorder.ring.chunks() == []
+
+def test_passing_test_keeps_nothing(tmp_path):
+    """
+    TEST: Green test: last chunk not even stopped, ring emptied, no files, no report section
+    """
+    page = FakePage()
+    recorder = TraceRingRecorder(TraceRing(max_actions=10), page_type=FakePage)
+    report = run_test(recorder, page, failed=False, output=tmp_path)
+
+    assert page.calls[-1] == "stop" and page.calls[-2] == f"start_chunk:{BETWEEN_ACTIONS}"
+    assert list(tmp_path.rglob("*")) == []
+    assert report.sections == []
+    assert recorder.ring.chunks() == []
@@ -0,0 +1,67 @@
+"""
+Visual Diff Tests
+Covers: pixel/perceptual diffing, masks and the baseline store (no browser needed)
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+from utils.visual import BaselineStore, SnapshotMismatch, assert_snapshot, decode, diff_pixels, encode
+
+def screenshot(width=1920, height=1080, colour=(255, 255, 255)):
+    pixels = np.empty((height, width, 3), dtype=np.uint8)
+    pixels[:] = colour
+    return pixels
+
+def test_identical_images_match():
+    """
+    TEST: Same pixels, nothing differs (RGB or decoded RGBA)
+    """
+    image = screenshot()
+    assert diff_pixels(image, image.copy()).different == 0
+    rgba = decode(encode(image))
+    assert diff_pixels(rgba, rgba.copy()).matches(tolerance=0)
+
+def test_changed_region_counted_and_masked():
+    """
+    TEST: A changed 100x50 block is found, and ignored under a mask
+    """
+    expected, actual = screenshot(), screenshot()
+    actual[200:250, 300:400] = (0, 0, 0)
+    result = diff_pixels(actual, expected)
+    assert result.different == 100 * 50
+    assert not result.matches(tolerance=0.001)
+    assert diff_pixels(actual, expected, masks=[(300, 200, 100, 50)]).different == 0
+
+def test_perceptual_mode_ignores_invisible_changes():
+    """
+    TEST: A 2-level colour shift is noise perceptually, not in strict pixel mode
+    """
+    expected, actual = screenshot(colour=(200, 200, 200)), screenshot(colour=(202, 200, 200))
+    assert diff_pixels(actual, expected, mode="perceptual", threshold=0.1).different == 0
+    assert diff_pixels(actual, expected, mode="pixel", threshold=0).ratio == 1.0
+
+def test_size_change_never_matches():
+    """
+    TEST: A taller page is a regression, whatever the tolerance
+    """
+    assert not diff_pixels(screenshot(height=1200), screenshot()).matches(tolerance=1.0)
+
+def test_baselines_are_content_addressed(tmp_path):
+    """
+    TEST: Identical screenshots are stored once; a new baseline fails once
+    """
+    store = BaselineStore(tmp_path)
+    png = encode(screenshot(200, 100))
+    with pytest.raises(SnapshotMismatch, match="No baseline"):
+        assert_snapshot(store, "home-chromium", png, tmp_path / "out")
+    assert_snapshot(store, "home-chromium", png, tmp_path / "out")
+    store.put("cart-chromium", png)
+    assert len(list((tmp_path / "objects").glob("*/*.png"))) == 1
+
+    changed = screenshot(200, 100)
+    changed[:50] = (0, 0, 0)
+    with pytest.raises(SnapshotMismatch, match="50.000% of pixels differ"):
+        assert_snapshot(store, "home-chromium", encode(changed), tmp_path / "out")
+    assert (tmp_path / "out" / "home-chromium-diff.png").exists()
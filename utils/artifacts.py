@@ -0,0 +1,154 @@
+"""
+Background Artifact Pipeline
+Moves test artifacts off the test's critical path
+
+WHY THIS EXISTS:
+- With --video=retain-on-failure, pytest-playwright copies every video
+  (video.save_as) and then keeps or deletes it during teardown
+- That file I/O happens before the worker can start the next test,
+  even for passing tests whose video is thrown away
+
+HOW:
+- Videos are recorded straight into a recording folder; the test
+  only remembers their paths
+- After teardown, a job goes on a BOUNDED queue (backpressure: a
+  worker blocks only when max_pending jobs are already waiting)
+- Background threads delete passing tests' videos, or move failing
+  tests' videos next to their screenshots/traces and index them
+- manifest.json in the output folder lists every failed test's artifacts
+
+NOTE: webm/png/zip are already compressed, so files are moved as-is
+"""
+import json
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from playwright.sync_api import Error as PlaywrightError
+
+ARTIFACT_KINDS = {".webm": "video", ".png": "screenshot", ".zip": "trace"}
+
+_active = None
+
+def get_active_pipeline():
+    """Pipeline of this run, or None when --artifact-pipeline is off"""
+    return _active
+
+def set_active_pipeline(pipeline):
+    """Called by plugins/artifacts.py"""
+    global _active
+    _active = pipeline
+
+
+class ArtifactPipeline:
+    """
+    USAGE:
+    pipeline = ArtifactPipeline(recording_dir, keep_videos="retain-on-failure")
+    pipeline.track(nodeid, page, output_path)       # page fixture
+    pipeline.finish_test(nodeid, failed=False)      # after teardown
+    manifest = pipeline.close()                     # end of session
+    """
+
+    def __init__(self, recording_dir, keep_videos="retain-on-failure", workers=2, max_pending=16):
+        self.recording_dir = Path(recording_dir)
+        self.recording_dir.mkdir(parents=True, exist_ok=True)
+        self.keep_videos = keep_videos
+        self.manifest = []
+        self.stats = {"kept": 0, "discarded": 0, "bytes_kept": 0, "blocked_seconds": 0.0, "errors": 0}
+        self._tests = {}
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._threads = [
+            threading.Thread(target=self._work, name=f"artifacts-{index}", daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ============ CALLED FROM THE TEST'S THREAD ============
+
+    def track(self, nodeid, page, output_path):
+        """Remember where this test's page records its video"""
+        entry = self._tests.setdefault(nodeid, {"videos": [], "output_path": output_path})
+        if not page.video:
+            return
+        try:
+            entry["videos"].append(page.video.path())
+        except PlaywrightError:
+            pass  # Connected to a remote browser: its videos never reach this disk
+
+    def finish_test(self, nodeid, failed):
+        """Hand the test's artifacts to the background threads"""
+        entry = self._tests.pop(nodeid, None)
+        if entry is None:
+            return
+        keep = self.keep_videos == "on" or (failed and self.keep_videos == "retain-on-failure")
+        job = (self._keep if keep else self._discard, nodeid, failed, entry)
+        start = time.perf_counter()
+        self._queue.put(job)  # Blocks only when the queue is full
+        self.stats["blocked_seconds"] += time.perf_counter() - start
+
+    def close(self):
+        """Drain the queue, stop the threads, return the manifest"""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        shutil.rmtree(self.recording_dir, ignore_errors=True)
+        return self.manifest
+
+    # ============ BACKGROUND THREADS ============
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            handler, nodeid, failed, entry = job
+            try:
+                handler(nodeid, failed, entry)
+            except OSError:
+                with self._lock:
+                    self.stats["errors"] += 1
+
+    def _discard(self, nodeid, failed, entry):
+        for video in entry["videos"]:
+            Path(video).unlink(missing_ok=True)
+        with self._lock:
+            self.stats["discarded"] += len(entry["videos"])
+        if failed:
+            # Videos off, but screenshots/traces still get indexed
+            self._index(nodeid, entry["output_path"])
+
+    def _keep(self, nodeid, failed, entry):
+        folder = Path(entry["output_path"])
+        folder.mkdir(parents=True, exist_ok=True)
+        videos = entry["videos"]
+        for index, video in enumerate(videos):
+            name = "video.webm" if len(videos) == 1 else f"video-{index + 1}.webm"
+            # Same filesystem as the recording folder: a rename, not a copy
+            shutil.move(video, folder / name)
+        with self._lock:
+            self.stats["kept"] += len(videos)
+        if failed:
+            self._index(nodeid, folder)
+
+    def _index(self, nodeid, folder):
+        folder = Path(folder)
+        artifacts = [
+            {"kind": ARTIFACT_KINDS.get(path.suffix, "other"), "path": str(path), "bytes": path.stat().st_size}
+            for path in sorted(folder.iterdir())
+            if path.is_file()
+        ] if folder.exists() else []
+        with self._lock:
+            self.stats["bytes_kept"] += sum(artifact["bytes"] for artifact in artifacts)
+            self.manifest.append({"test": nodeid, "outcome": "failed", "artifacts": artifacts})
+
+
+def write_manifest(path, entries):
+    """Write a manifest sorted by test id"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(sorted(entries, key=lambda entry: entry["test"]), indent=2), encoding="utf-8")
@@ -0,0 +1,69 @@
+"""
+Cached Login State
+Saves a logged-in browser storage_state to disk and reuses it until it expires
+"""
+import json
+import re
+import time
+from pathlib import Path
+
+
+class StorageStateCache:
+    """
+    WHY THIS EXISTS:
+    - Driving the login form for every test is slow
+    - Logging in over and over can get us rate limited
+
+    EXPIRES WHEN:
+    - The file is older than ttl seconds, or
+    - It was saved before valid_since (e.g. the local stand-in
+      restarted and forgot its sessions), or
+    - Any saved cookie has passed its own expiry
+
+    USAGE:
+    cache = StorageStateCache(".auth/gw0", ttl=1800)
+    path = cache.get("user@example.com", login)  # login(path) saves state
+    context = browser.new_context(storage_state=path)
+    """
+
+    def __init__(self, folder, ttl=1800, valid_since=None):
+        self.folder = Path(folder)
+        self.ttl = ttl
+        self.valid_since = valid_since
+
+    def path_for(self, key):
+        """One JSON file per user"""
+        name = re.sub(r"[^\w.@-]+", "_", key)
+        return self.folder / f"{name}.json"
+
+    def is_fresh(self, path, now=None):
+        """True if the saved state can still be used"""
+        now = time.time() if now is None else now
+        path = Path(path)
+        if not path.exists() or now - path.stat().st_mtime > self.ttl:
+            return False
+        if self.valid_since is not None and path.stat().st_mtime < self.valid_since:
+            return False
+        try:
+            cookies = json.loads(path.read_text(encoding="utf-8")).get("cookies", [])
+        except ValueError:
+            return False
+        # expires == -1 means a session cookie
+        return all(cookie.get("expires", -1) < 0 or cookie["expires"] > now for cookie in cookies)
+
+    def get(self, key, login):
+        """
+        Return a fresh storage_state path, logging in only when needed
+
+        PARAMETERS:
+        - key: Cache key, usually the user's email
+        - login: Callable that saves storage_state to the given path
+        """
+        path = self.path_for(key)
+        if self.is_fresh(path):
+            print(f"♻️ Reusing login state: {path}")
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        login(path)
+        print(f"💾 Saved login state: {path}")
+        return path
@@ -0,0 +1,302 @@
+"""
+Persistent Browser Server
+Keeps one browser running between pytest sessions; tests connect instead of launching
+
+USAGE:
+pytest --reuse-browser-server          # start on first use, reuse afterwards
+python -m utils.browser_server status
+python -m utils.browser_server stop --browser chromium
+
+HOW:
+- Playwright's BrowserType.launchServer, run by the Node driver that
+  ships with the playwright package (the Python API has no launch_server)
+- Endpoint, pid and pins are kept in .browser-server/<browser>.json
+- Every session health-checks the endpoint and restarts the server if it
+  is gone, or was started by another playwright version or launch options
+- stop() only signals the recorded pid while it is still our server
+  (own process group, SERVER_MARKER on its command line): after a crash
+  or reboot that pid may belong to any other process
+
+PRIVATE API: Reaching the Node driver needs playwright._impl._driver,
+so it is imported only for playwright versions in DRIVER_API_VERSIONS
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from importlib.metadata import version
+from pathlib import Path
+from urllib.parse import urlsplit
+
+STATE_DIR = Path(__file__).resolve().parent.parent / ".browser-server"
+BROWSERS = ("chromium", "firefox", "webkit")
+START_TIMEOUT = 60
+# Options applied when the browser process starts; the rest are per connection
+SERVER_LAUNCH_OPTIONS = ("headless", "channel", "args", "executable_path", "chromium_sandbox")
+# playwright versions whose _impl._driver API (compute_driver_executable
+# -> (node, cli.js), get_driver_env) this module was checked against:
+# from the first to (not including) the second
+DRIVER_API_VERSIONS = ((1, 64), (2, 0))
+# Extra argument on the server's command line; tells our node process
+# apart from whatever reuses its pid later
+SERVER_MARKER = "automation-exercise-browser-server"
+
+# Runs in Node. Prints the endpoint once, then serves until SIGTERM
+LAUNCH_SERVER_JS = """
+const playwright = require(process.env.PW_PACKAGE);
+(async () => {
+    const options = JSON.parse(process.env.PW_LAUNCH_OPTIONS);
+    const server = await playwright[process.env.PW_BROWSER].launchServer(options);
+    console.log(JSON.stringify({wsEndpoint: server.wsEndpoint()}));
+    const stop = async () => { await server.close(); process.exit(0); };
+    process.on("SIGTERM", stop);
+    process.on("SIGINT", stop);
+})().catch((error) => {
+    console.error(error.stack || String(error));
+    process.exit(1);
+});
+"""
+
+
+class BrowserServerError(Exception):
+    """The browser server could not be started"""
+
+
+def split_launch_args(launch_args):
+    """
+    (server options, connect options) from browser_type_launch_args
+
+    slow_mo and timeout work per connection; headless, channel,
+    args... need a server started with them
+    """
+    server = {key: value for key, value in launch_args.items() if key in SERVER_LAUNCH_OPTIONS}
+    connect = {key: launch_args[key] for key in ("slow_mo", "timeout") if key in launch_args}
+    return server, connect
+
+
+def pins(browser_name, server_options):
+    """What a running server must match to be reused"""
+    return {
+        "browser": browser_name,
+        "playwright": version("playwright"),
+        "launch_options": server_options,
+    }
+
+
+def _state_path(browser_name):
+    return STATE_DIR / f"{browser_name}.json"
+
+
+def read_state(browser_name):
+    path = _state_path(browser_name)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+
+
+def is_healthy(state, timeout=1.0):
+    """The recorded endpoint still accepts connections"""
+    if not state or not state.get("ws_endpoint"):
+        return False
+    endpoint = urlsplit(state["ws_endpoint"])
+    try:
+        with socket.create_connection((endpoint.hostname, endpoint.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _node_driver():
+    """
+    (node, cli.js, env) of the Node driver bundled with playwright
+
+    RAISES: BrowserServerError for playwright versions outside
+    DRIVER_API_VERSIONS, instead of failing somewhere inside the private API
+    """
+    installed = version("playwright")
+    numbers = tuple(int(part) for part in installed.split(".")[:2] if part.isdigit())
+    first, below = DRIVER_API_VERSIONS
+    if not first <= numbers < below:
+        raise BrowserServerError(
+            f"--reuse-browser-server supports playwright {first[0]}.{first[1]} up to "
+            f"{below[0]}.{below[1]} (installed: {installed}); check playwright._impl._driver "
+            "and widen DRIVER_API_VERSIONS in utils/browser_server.py"
+        )
+    try:
+        from playwright._impl._driver import compute_driver_executable, get_driver_env
+    except ImportError as error:
+        raise BrowserServerError(f"playwright {installed} moved its Node driver API: {error}") from error
+    node, cli = compute_driver_executable()
+    return node, cli, get_driver_env()
+
+
+def is_our_server(state):
+    """
+    The recorded pid is still the node process start() launched
+
+    POSIX: it leads its own process group (start_new_session) and has
+    SERVER_MARKER on its command line. Windows has no cheap command
+    line lookup, so only a server whose endpoint still answers counts
+    """
+    pid = state.get("pid") if state else None
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    if sys.platform == "win32":
+        return is_healthy(state)
+    try:
+        output = subprocess.run(
+            ["ps", "-ww", "-o", "pgid=,command=", "-p", str(pid)],
+            capture_output=True, text=True, check=False,
+        ).stdout.strip()
+    except OSError:
+        return False
+    pgid, _, command = output.partition(" ")
+    return pgid.isdigit() and int(pgid) == pid and SERVER_MARKER in command
+
+
+def _to_js_options(server_options):
+    """snake_case Python launch options -> camelCase for Node"""
+    def camel(name):
+        first, *rest = name.split("_")
+        return first + "".join(part.title() for part in rest)
+    return {camel(key): value for key, value in server_options.items()}
+
+
+def start(browser_name, server_options):
+    """Launch a detached server and record its state"""
+    node, cli, driver_env = _node_driver()
+    STATE_DIR.mkdir(exist_ok=True)
+    log_path = STATE_DIR / f"{browser_name}.log"
+    env = {
+        **driver_env,
+        "PW_PACKAGE": str(Path(cli).parent),
+        "PW_BROWSER": browser_name,
+        "PW_LAUNCH_OPTIONS": json.dumps(_to_js_options(server_options)),
+    }
+    detach = (
+        {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS}
+        if sys.platform == "win32" else {"start_new_session": True}
+    )
+    with open(log_path, "w", encoding="utf-8") as log:
+        process = subprocess.Popen(
+            [node, "-e", LAUNCH_SERVER_JS, SERVER_MARKER],
+            env=env, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, **detach
+        )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        for line in log_path.read_text(encoding="utf-8").splitlines():
+            if line.startswith('{"wsEndpoint"'):
+                state = {
+                    **pins(browser_name, server_options),
+                    "ws_endpoint": json.loads(line)["wsEndpoint"],
+                    "pid": process.pid,
+                    "started": time.time(),
+                }
+                _state_path(browser_name).write_text(json.dumps(state, indent=2), encoding="utf-8")
+                print(f"🖥️ {browser_name} server started: {state['ws_endpoint']}")
+                return state
+        if process.poll() is not None:
+            break
+        time.sleep(0.1)
+
+    process.kill()
+    raise BrowserServerError(
+        f"{browser_name} server did not start; see {log_path}:\n"
+        + log_path.read_text(encoding="utf-8")[-2000:]
+    )
+
+
+def stop(browser_name):
+    """Stop the recorded server (if it is still ours) and forget it"""
+    state = read_state(browser_name)
+    if state:
+        if is_our_server(state):
+            try:
+                os.kill(state["pid"], signal.SIGTERM)
+                print(f"🛑 {browser_name} server stopped (pid {state['pid']})")
+            except OSError:
+                pass  # Exited in the meantime
+        else:
+            print(f"🧹 {browser_name} server (pid {state.get('pid')}) is gone; forgetting it")
+        _state_path(browser_name).unlink(missing_ok=True)
+
+
+def ensure_server(browser_name, server_options):
+    """
+    Endpoint of a healthy server matching the pins, (re)starting it if needed
+
+    SAFE WITH XDIST: Workers take turns through a lock file, so only
+    one of them starts the server
+    """
+    with _StartLock(browser_name):
+        state = read_state(browser_name)
+        expected = pins(browser_name, server_options)
+        if state and all(state.get(key) == value for key, value in expected.items()):
+            if is_healthy(state):
+                return state["ws_endpoint"]
+            print(f"♻️ {browser_name} server not responding, restarting")
+        elif state:
+            print(f"♻️ {browser_name} server started with other pins, restarting")
+        stop(browser_name)
+        return start(browser_name, server_options)["ws_endpoint"]
+
+
+class _StartLock:
+    """Cross-platform lock file (O_EXCL); stale locks expire"""
+
+    def __init__(self, browser_name, stale_after=START_TIMEOUT * 2):
+        self.path = STATE_DIR / f"{browser_name}.lock"
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        STATE_DIR.mkdir(exist_ok=True)
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - self.path.stat().st_mtime > self.stale_after:
+                        self.path.unlink(missing_ok=True)
+                except FileNotFoundError:
+                    pass
+                time.sleep(0.1)
+
+    def __exit__(self, *exc_info):
+        self.path.unlink(missing_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage persistent Playwright browser servers")
+    parser.add_argument("command", choices=("start", "stop", "status"))
+    parser.add_argument("--browser", choices=BROWSERS, default=None,
+                        help="Default: chromium for start, every browser for stop/status")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        ensure_server(args.browser or "chromium", {"headless": not args.headed})
+        return
+    for browser_name in [args.browser] if args.browser else BROWSERS:
+        if args.command == "stop":
+            stop(browser_name)
+            continue
+        state = read_state(browser_name)
+        if state:
+            health = "healthy" if is_healthy(state) else "NOT RESPONDING"
+            print(f"{browser_name}: {health} {state['ws_endpoint']} "
+                  f"(pid {state['pid']}, playwright {state['playwright']})")
+        else:
+            print(f"{browser_name}: not running")
+
+
+if __name__ == "__main__":
+    main()
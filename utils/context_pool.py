@@ -0,0 +1,115 @@
+"""
+Browser Context Pool
+Reuses warm browser contexts between tests instead of building new ones
+"""
+import json
+from collections import defaultdict
+
+# Per-test artifacts are what we are avoiding, so pooled contexts skip them
+UNPOOLED_ARGS = ("record_video_dir", "record_video_size", "record_har_path")
+
+CLEAR_STORAGE_JS = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        for (const db of await indexedDB.databases()) {
+            indexedDB.deleteDatabase(db.name);
+        }
+    }
+}
+"""
+
+
+def reset_context(context):
+    """
+    Put a used context back into a fresh state
+
+    CLEARS:
+    - Routes, cookies, permissions, extra headers, offline mode
+    - All pages (and their sessionStorage)
+    - localStorage/IndexedDB of every origin the test touched
+    """
+    context.unroute_all(behavior="ignoreErrors")
+    for page in context.pages:
+        page.close()
+    context.clear_cookies()
+    context.clear_permissions()
+    context.set_extra_http_headers({})
+    context.set_offline(False)
+
+    origins = [origin["origin"] for origin in context.storage_state()["origins"]]
+    if origins:
+        # Storage can only be cleared from its own origin; a stub
+        # response gets us there without hitting the server
+        page = context.new_page()
+        page.route("**/*", lambda route: route.fulfill(body="", content_type="text/html"))
+        for origin in origins:
+            page.goto(origin)
+            page.evaluate(CLEAR_STORAGE_JS)
+        page.close()
+
+
+class ContextPool:
+    """
+    WHY THIS EXISTS:
+    - Creating a context (and recording its video) is a fixed
+      cost we pay for every test
+    - Tests that don't depend on a brand new context can borrow
+      a warm one instead
+
+    KEYED BY: The context args (viewport, locale, timezone...), so
+    tests only get a context built with the args they asked for
+
+    USAGE:
+    context = pool.acquire(browser_context_args)
+    ...
+    pool.release(context)
+    """
+
+    def __init__(self, browser, max_idle_per_key=2):
+        self.browser = browser
+        self.max_idle_per_key = max_idle_per_key
+        self._idle = defaultdict(list)
+        self._keys = {}
+
+    @staticmethod
+    def pooled_args(context_args):
+        """Context args without per-test artifact recording"""
+        return {key: value for key, value in context_args.items() if key not in UNPOOLED_ARGS}
+
+    @staticmethod
+    def key(context_args):
+        return json.dumps(context_args, sort_keys=True, default=str)
+
+    def acquire(self, context_args):
+        """Borrow an idle context with these args, or build one"""
+        args = self.pooled_args(context_args)
+        key = self.key(args)
+        if self._idle[key]:
+            context = self._idle[key].pop()
+        else:
+            context = self.browser.new_context(**args)
+        self._keys[context] = key
+        return context
+
+    def release(self, context):
+        """Reset a borrowed context and keep it for the next test"""
+        key = self._keys.pop(context)
+        try:
+            reset_context(context)
+        except Exception:
+            # A context we cannot clean is not safe to share
+            context.close()
+            raise
+        if len(self._idle[key]) < self.max_idle_per_key:
+            self._idle[key].append(context)
+        else:
+            context.close()
+
+    def close(self):
+        """Close every idle context (end of session)"""
+        for contexts in self._idle.values():
+            for context in contexts:
+                context.close()
+        self._idle.clear()
@@ -0,0 +1,53 @@
+"""
+User Journeys
+Page-object flows replayed by the load runner (utils/load_runner.py)
+
+A JOURNEY is an async function taking a VirtualUser:
+- user.page: This user's own page (own browser context)
+- await user.step(name, coroutine): Times one step, then thinks
+
+Selectors come from the page objects, so load tests and
+functional tests can never drift apart
+"""
+from pages.async_pages.cart_page import AsyncCartPage
+from pages.async_pages.home_page import AsyncHomePage
+from pages.async_pages.login_page import AsyncLoginPage
+from pages.async_pages.products_page import AsyncProductsPage
+
+# Product 1 on both the live site and the local stand-in
+CART_PRODUCT_ID = 1
+# Same account as the test_user fixture (conftest.py)
+LOGIN_EMAIL = "testuser@example.com"
+LOGIN_PASSWORD = "Test@123"
+
+
+async def browse_and_buy(user):
+    """home -> products -> add_product_and_view_cart -> remove_product"""
+    home_page = AsyncHomePage(user.page)
+    products_page = AsyncProductsPage(user.page)
+    cart_page = AsyncCartPage(user.page)
+
+    await user.step("navigate_to_home", home_page.navigate_to_home())
+    await user.step("navigate_to_products", products_page.navigate_to_products())
+    await user.step(
+        "add_product_and_view_cart", products_page.add_product_and_view_cart(CART_PRODUCT_ID)
+    )
+    await user.step("remove_product", cart_page.remove_product(CART_PRODUCT_ID))
+
+
+async def login(user):
+    """navigate_to_login -> perform_login -> verify_logged_in"""
+    login_page = AsyncLoginPage(user.page)
+
+    await user.step("navigate_to_login", login_page.navigate_to_login())
+    await user.step(
+        "perform_login",
+        login_page.perform_login(LOGIN_EMAIL, LOGIN_PASSWORD)
+    )
+    await user.step("verify_logged_in", login_page.verify_logged_in())
+
+
+JOURNEYS = {
+    "browse_and_buy": browse_and_buy,
+    "login": login,
+}
@@ -0,0 +1,257 @@
+"""
+Load Runner
+Replays page-object journeys (utils/journeys.py) as many concurrent virtual users
+
+USAGE (CLI, starts the local stand-in unless --base-url is given):
+python -m utils.load_runner --users 200 --concurrency 50 --ramp-up 20 --think-time 0.5 2
+
+USAGE (code):
+report = generate_load([browse_and_buy, login], users=50, concurrency=20)
+print(report.format())
+
+HOW:
+- 1 browser, 1 lightweight context per virtual user (no video/trace)
+- User N starts at ramp_up * N / users seconds
+- At most `concurrency` contexts are open at once
+- Every user.step() lands in a per-step latency histogram
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from playwright.async_api import async_playwright
+
+from config.settings import get_base_url, set_base_url
+from utils.journeys import JOURNEYS
+from utils.local_site import LocalSite
+from utils.stats import percentile
+
+# Upper bounds (ms) of the histogram buckets; the last one is open-ended
+BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# Errors kept verbatim in the report; the rest are only counted
+MAX_ERRORS_KEPT = 20
+
+
+class LatencyHistogram:
+    """Latencies of one step across every user and iteration"""
+
+    def __init__(self):
+        self.samples = []
+        self.errors = 0
+
+    def add(self, ms, ok=True):
+        self.samples.append(ms)
+        if not ok:
+            self.errors += 1
+
+    def buckets(self):
+        """[("<=50ms", count), ..., (">10000ms", count)]"""
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for ms in self.samples:
+            index = next((i for i, bound in enumerate(BUCKETS_MS) if ms <= bound), len(BUCKETS_MS))
+            counts[index] += 1
+        labels = [f"<={bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return list(zip(labels, counts))
+
+    def summary(self):
+        """count, errors and p50/p95/p99/max in ms"""
+        stats = {"count": len(self.samples), "errors": self.errors}
+        if self.samples:
+            stats.update({f"p{pct}": percentile(self.samples, pct) for pct in (50, 95, 99)})
+            stats["max"] = max(self.samples)
+        return stats
+
+
+class VirtualUser:
+    """
+    One simulated user, handed to each journey
+
+    ATTRIBUTES:
+    - number: 0..users-1
+    - page: Page in this user's own context
+    """
+
+    def __init__(self, number, page, histograms, think_time, rng):
+        self.number = number
+        self.page = page
+        self._histograms = histograms
+        self._think_time = think_time
+        self._rng = rng
+
+    async def step(self, name, coroutine):
+        """Run one journey step, record its latency, then think"""
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = await coroutine
+            ok = True
+            return result
+        finally:
+            self._histograms[name].add(round((time.perf_counter() - start) * 1000, 1), ok)
+            if ok:
+                await asyncio.sleep(self._rng.uniform(*self._think_time))
+
+
+class LoadReport:
+    """What a load run produced"""
+
+    def __init__(self, histograms, passed, failed, errors, seconds):
+        self.histograms = histograms
+        self.journeys_passed = passed
+        self.journeys_failed = failed
+        self.errors = errors
+        self.seconds = seconds
+
+    def format(self):
+        """Per-step percentiles and histograms as plain text"""
+        total = self.journeys_passed + self.journeys_failed
+        lines = [
+            f"{total} journeys in {self.seconds:.1f}s: "
+            f"{self.journeys_passed} passed, {self.journeys_failed} failed"
+        ]
+        for name, histogram in self.histograms.items():
+            stats = histogram.summary()
+            lines.append(f"\n{name}: {stats['count']} runs, {stats['errors']} errors")
+            if not histogram.samples:
+                continue
+            lines.append(
+                "  " + "  ".join(f"{key}={stats[key]:.0f}ms" for key in ("p50", "p95", "p99", "max"))
+            )
+            widest = max(count for _, count in histogram.buckets())
+            for label, count in histogram.buckets():
+                if count:
+                    bar = "#" * max(1, round(40 * count / widest))
+                    lines.append(f"  {label:>10} {count:>6} {bar}")
+        if self.errors:
+            lines.append("\nFirst errors:")
+            lines.extend(f"  - {error}" for error in self.errors)
+        return "\n".join(lines)
+
+
+async def run_load(
+    journeys,
+    users=10,
+    iterations=1,
+    ramp_up=0.0,
+    think_time=(0.0, 0.0),
+    concurrency=None,
+    browser_name="chromium",
+    launch_args=None,
+    context_args=None,
+    seed=None,
+):
+    """
+    Run every virtual user to completion
+
+    PARAMETERS:
+    - journeys: Journey functions; user N runs journeys[N % len(journeys)]
+    - iterations: Journeys each user runs back to back
+    - ramp_up: Seconds over which user start times are spread
+    - think_time: (min, max) seconds slept after each step
+    - concurrency: Max contexts open at once (default: all users)
+    - seed: Makes think times reproducible
+
+    RETURNS: LoadReport
+    """
+    histograms = defaultdict(LatencyHistogram)
+    outcome = {"passed": 0, "failed": 0}
+    errors = []
+    rng = random.Random(seed)
+    semaphore = asyncio.Semaphore(concurrency or users)
+    start = time.perf_counter()
+
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch(**(launch_args or {}))
+
+        async def run_user(number):
+            await asyncio.sleep(ramp_up * number / users)
+            journey = journeys[number % len(journeys)]
+            async with semaphore:
+                context = await browser.new_context(**(context_args or {}))
+                try:
+                    user = VirtualUser(number, await context.new_page(), histograms, think_time, rng)
+                    for _ in range(iterations):
+                        try:
+                            await journey(user)
+                            outcome["passed"] += 1
+                        except Exception as error:
+                            outcome["failed"] += 1
+                            if len(errors) < MAX_ERRORS_KEPT:
+                                errors.append(f"user {number} {journey.__name__}: {error!r}"[:300])
+                finally:
+                    await context.close()
+
+        try:
+            await asyncio.gather(*(run_user(number) for number in range(users)))
+        finally:
+            await browser.close()
+
+    return LoadReport(
+        dict(histograms), outcome["passed"], outcome["failed"], errors, time.perf_counter() - start
+    )
+
+
+def generate_load(journeys, **kwargs):
+    """
+    Blocking wrapper around run_load
+
+    NOTE: Own thread + event loop, like fan_out_locales, so it
+    also runs inside pytest sessions using the sync Playwright API
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_load(journeys, **kwargs)).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay page-object journeys as concurrent users")
+    parser.add_argument("--journey", action="append", choices=sorted(JOURNEYS),
+                        help="Journey to run (repeatable, default: all)")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds to start all users")
+    parser.add_argument("--think-time", type=float, nargs=2, default=(0.0, 0.0), metavar=("MIN", "MAX"))
+    parser.add_argument("--base-url", default=None, help="Default: start the local stand-in")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--verbose", action="store_true", help="Keep page-object print output")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    site = None
+    if args.base_url:
+        set_base_url(args.base_url)
+    else:
+        site = LocalSite().start()
+        set_base_url(site.url)
+    print(f"🚀 {args.users} users against {get_base_url()}")
+
+    try:
+        # Hundreds of users x emoji prints would bury the report
+        with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+            if not args.verbose:
+                stack.enter_context(contextlib.redirect_stdout(devnull))
+            report = generate_load(
+                [JOURNEYS[name] for name in (args.journey or sorted(JOURNEYS))],
+                users=args.users,
+                iterations=args.iterations,
+                ramp_up=args.ramp_up,
+                think_time=tuple(args.think_time),
+                concurrency=args.concurrency,
+                browser_name=args.browser,
+                launch_args={"headless": not args.headed},
+                seed=args.seed,
+            )
+    finally:
+        if site:
+            site.stop()
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,489 @@
+"""
+Local Stand-in for automationexercise.com
+Serves the pages and flows our page objects depend on, without internet
+
+RUN STANDALONE:
+python -m utils.local_site --port 8000
+"""
+import argparse
+import html
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Same credentials as the test_user fixture in tests/conftest.py
+DEFAULT_USERS = {
+    "testuser@example.com": {"name": "Test User", "password": "Test@123"},
+}
+
+PRODUCTS = [
+    {"id": 1, "name": "Blue Top", "price": 500, "category": "Women > Tops"},
+    {"id": 2, "name": "Men Tshirt", "price": 400, "category": "Men > Tshirts"},
+    {"id": 3, "name": "Sleeveless Dress", "price": 1000, "category": "Women > Dress"},
+    {"id": 4, "name": "Stylish Dress", "price": 1500, "category": "Women > Dress"},
+    {"id": 5, "name": "Winter Top", "price": 600, "category": "Women > Tops"},
+    {"id": 6, "name": "Summer White Top", "price": 400, "category": "Women > Tops"},
+    {"id": 7, "name": "Madame Top For Women", "price": 1000, "category": "Women > Tops"},
+    {"id": 8, "name": "Fancy Green Top", "price": 700, "category": "Women > Tops"},
+    {"id": 9, "name": "Sleeves Top and Short - Blue & Pink", "price": 478, "category": "Women > Tops"},
+    {"id": 10, "name": "Little Girls Mr. Panda Shirt", "price": 543, "category": "Kids > Tops & Shirts"},
+    {"id": 11, "name": "Sleeveless Unicorn Patch Gown - Pink", "price": 1050, "category": "Kids > Dress"},
+    {"id": 12, "name": "Pure Cotton Neon Green Tshirt", "price": 850, "category": "Men > Tshirts"},
+]
+PRODUCTS_BY_ID = {product["id"]: product for product in PRODUCTS}
+
+SESSION_COOKIE = "sessionid"
+
+# ============ HTML TEMPLATES ============
+
+LAYOUT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 0; }}
+header, section, footer {{ padding: 16px 32px; }}
+.shop-menu a {{ margin-right: 16px; }}
+.productinfo {{ display: inline-block; width: 200px; margin: 8px; }}
+#cartModal {{ position: fixed; top: 30%; left: 40%; background: #fff; border: 1px solid #ccc; padding: 16px; }}
+</style>
+</head>
+<body>
+<header id="header">
+<div class="logo"><a href="/">Automation Exercise</a></div>
+<div class="shop-menu"><ul class="nav navbar-nav">
+<li><a href="/">Home</a></li>
+<li><a href="/products"> Products</a></li>
+<li><a href="/view_cart"> Cart</a></li>
+{account_links}
+</ul></div>
+</header>
+{content}
+<footer id="footer"><p>Copyright &copy; Automation Exercise (local stand-in)</p></footer>
+<script>
+document.addEventListener("click", function (event) {{
+  var add = event.target.closest(".add-to-cart");
+  if (add) {{
+    event.preventDefault();
+    fetch("/add_to_cart/" + add.dataset.productId).then(function () {{
+      document.getElementById("cartModal").hidden = false;
+    }});
+    return;
+  }}
+  if (event.target.closest(".close-modal")) {{
+    document.getElementById("cartModal").hidden = true;
+    return;
+  }}
+  var remove = event.target.closest(".cart_quantity_delete");
+  if (remove) {{
+    event.preventDefault();
+    fetch("/delete_cart/" + remove.dataset.productId).then(function () {{
+      document.getElementById("product-" + remove.dataset.productId).remove();
+      if (!document.querySelector("#cart_info tbody tr")) {{
+        document.getElementById("empty_cart").style.display = "block";
+      }}
+    }});
+  }}
+}});
+</script>
+</body>
+</html>
+"""
+
+PRODUCT_CARD = """<div class="col-sm-4"><div class="product-image-wrapper" data-category="{category}">
+<div class="single-products"><div class="productinfo text-center">
+<h2>Rs. {price}</h2>
+<p>{name}</p>
+<a href="#" data-product-id="{id}" class="btn btn-default add-to-cart">Add to cart</a>
+</div></div>
+<div class="choose"><a href="/product_details/{id}">View Product</a></div>
+</div></div>
+"""
+
+CART_MODAL = """<div class="modal" id="cartModal" hidden>
+<h4 class="modal-title">Added!</h4>
+<p>Your product has been added to cart.</p>
+<p><a href="/view_cart"><u>View Cart</u></a></p>
+<button class="btn btn-success close-modal btn-block">Continue Shopping</button>
+</div>
+"""
+
+HOME_CONTENT = """<section id="slider">
+<h1>Full-Fledged practice website for Automation Engineers</h1>
+<p>All QA engineers can use this website for automation practice and API testing.</p>
+</section>
+<section><h2 class="title text-center">Features Items</h2>
+{cards}</section>
+{modal}"""
+
+PRODUCTS_CONTENT = """<section id="advertisement"><h2>Special Offer</h2></section>
+<section>
+<form action="/products" method="get">
+<input type="text" id="search_product" name="search" placeholder="Search Product" value="{search}">
+<button type="submit" id="submit_search" class="btn btn-default btn-lg">Search</button>
+</form>
+<h2 class="title text-center">{heading}</h2>
+{cards}</section>
+{modal}"""
+
+PRODUCT_DETAILS_CONTENT = """<section class="product-information">
+<h2>{name}</h2>
+<p>Category: {category}</p>
+<span><span>Rs. {price}</span></span>
+</section>"""
+
+CART_ROW = """<tr id="product-{id}">
+<td class="cart_description"><h4><a href="/product_details/{id}">{name}</a></h4><p>{category}</p></td>
+<td class="cart_price"><p>Rs. {price}</p></td>
+<td class="cart_quantity"><button class="disabled">{quantity}</button></td>
+<td class="cart_total"><p class="cart_total_price">Rs. {total}</p></td>
+<td class="cart_delete"><a class="cart_quantity_delete" data-product-id="{id}">x</a></td>
+</tr>
+"""
+
+CART_CONTENT = """<section id="cart_items">
+<div class="table-responsive cart_info" id="cart_info">
+<table class="table table-condensed" id="cart_info_table">
+<thead><tr><td>Item</td><td>Price</td><td>Quantity</td><td>Total</td><td></td></tr></thead>
+<tbody>
+{rows}</tbody>
+</table>
+</div>
+<span id="empty_cart" style="display: {empty_display}"><p class="text-center"><b>Cart is empty!</b> Click <a href="/products"><u>here</u></a> to buy products.</p></span>
+<a class="btn btn-default check_out">Proceed To Checkout</a>
+</section>"""
+
+LOGIN_CONTENT = """<section id="form">
+<div class="login-form">
+<h2>Login to your account</h2>
+<form action="/login" method="POST">
+<input type="email" data-qa="login-email" name="email" placeholder="Email Address" required>
+<input type="password" data-qa="login-password" name="password" placeholder="Password" required>
+{login_error}<button type="submit" data-qa="login-button" class="btn btn-default">Login</button>
+</form>
+</div>
+<div class="signup-form">
+<h2>New User Signup!</h2>
+<form action="/signup" method="POST">
+<input type="text" data-qa="signup-name" name="name" placeholder="Name" required>
+<input type="email" data-qa="signup-email" name="email" placeholder="Email Address" required>
+{signup_error}<button type="submit" data-qa="signup-button" class="btn btn-default">Signup</button>
+</form>
+</div>
+</section>"""
+
+SIGNUP_CONTENT = """<section id="form"><div class="login-form">
+<h2 class="title text-center"><b>Enter Account Information</b></h2>
+<p>Name: {name}</p>
+<p>Email: {email}</p>
+</div></section>"""
+
+ERROR_LINE = '<p style="color: red;">{message}</p>\n'
+
+
+class _SiteState:
+    """
+    Server-side data shared by all request threads
+
+    STORES:
+    - sessions: sessionid -> {"cart": {product_id: quantity}, "user": email}
+    - users: email -> {"name", "password"}
+    """
+
+    def __init__(self, users):
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.users = {email: dict(user) for email, user in users.items()}
+
+    def new_session(self):
+        session_id = secrets.token_hex(16)
+        self.sessions[session_id] = {"cart": {}, "user": None}
+        return session_id
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes each request to the page the real site would return"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalAutomationExercise/1.0"
+
+    def log_message(self, format, *args):
+        # Keep pytest output clean
+        pass
+
+    # ============ ROUTING ============
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        self.query = parse_qs(url.query)
+        self.form = self._read_form() if method == "POST" else {}
+        self._load_session()
+
+        path = url.path.rstrip("/") or "/"
+        routes = {
+            ("GET", "/"): self._home,
+            ("GET", "/products"): self._products,
+            ("GET", "/view_cart"): self._view_cart,
+            ("GET", "/login"): self._login_form,
+            ("POST", "/login"): self._login,
+            ("POST", "/signup"): self._signup,
+            ("GET", "/logout"): self._logout,
+        }
+        handler = routes.get((method, path))
+        if handler:
+            return handler()
+
+        prefix, _, product_id = path.rpartition("/")
+        product = PRODUCTS_BY_ID.get(int(product_id)) if product_id.isdigit() else None
+        if method == "GET" and product:
+            if prefix == "/add_to_cart":
+                return self._add_to_cart(product)
+            if prefix == "/delete_cart":
+                return self._delete_cart(product)
+            if prefix == "/product_details":
+                return self._product_details(product)
+        self._send(404, "text/plain; charset=utf-8", b"Not Found")
+
+    # ============ PAGES ============
+
+    def _home(self):
+        cards = "".join(self._card(product) for product in PRODUCTS[:6])
+        self._render(
+            "Automation Exercise",
+            HOME_CONTENT.format(cards=cards, modal=CART_MODAL),
+        )
+
+    def _products(self):
+        search = self.query.get("search", [""])[0].strip()
+        products = PRODUCTS
+        heading = "All Products"
+        if search:
+            products = [p for p in PRODUCTS if search.lower() in p["name"].lower()]
+            heading = "Searched Products"
+        self._render(
+            "Automation Exercise - All Products",
+            PRODUCTS_CONTENT.format(
+                search=html.escape(search),
+                heading=heading,
+                cards="".join(self._card(product) for product in products),
+                modal=CART_MODAL,
+            ),
+        )
+
+    def _product_details(self, product):
+        self._render(
+            "Automation Exercise - Product Details",
+            PRODUCT_DETAILS_CONTENT.format(**self._escaped(product)),
+        )
+
+    def _view_cart(self):
+        with self.state.lock:
+            cart = dict(self.session["cart"])
+        rows = "".join(
+            CART_ROW.format(
+                quantity=quantity,
+                total=PRODUCTS_BY_ID[product_id]["price"] * quantity,
+                **self._escaped(PRODUCTS_BY_ID[product_id]),
+            )
+            for product_id, quantity in cart.items()
+        )
+        self._render(
+            "Automation Exercise - Checkout",
+            CART_CONTENT.format(rows=rows, empty_display="none" if cart else "block"),
+        )
+
+    def _login_form(self, login_error="", signup_error=""):
+        self._render(
+            "Automation Exercise - Signup / Login",
+            LOGIN_CONTENT.format(
+                login_error=ERROR_LINE.format(message=login_error) if login_error else "",
+                signup_error=ERROR_LINE.format(message=signup_error) if signup_error else "",
+            ),
+        )
+
+    # ============ FORM POSTS & AJAX ============
+
+    def _login(self):
+        email = self.form.get("email", "")
+        user = self.state.users.get(email)
+        if not user or user["password"] != self.form.get("password"):
+            return self._login_form(login_error="Your email or password is incorrect!")
+        with self.state.lock:
+            self.session["user"] = email
+        self._redirect("/")
+
+    def _signup(self):
+        email = self.form.get("email", "")
+        if email in self.state.users:
+            return self._login_form(signup_error="Email Address already exist!")
+        self._render(
+            "Automation Exercise - Signup",
+            SIGNUP_CONTENT.format(
+                name=html.escape(self.form.get("name", "")),
+                email=html.escape(email),
+            ),
+        )
+
+    def _logout(self):
+        with self.state.lock:
+            self.session["user"] = None
+        self._redirect("/login")
+
+    def _add_to_cart(self, product):
+        with self.state.lock:
+            cart = self.session["cart"]
+            cart[product["id"]] = cart.get(product["id"], 0) + 1
+        self._send(200, "text/plain; charset=utf-8", b"Added")
+
+    def _delete_cart(self, product):
+        with self.state.lock:
+            self.session["cart"].pop(product["id"], None)
+        self._send(200, "text/plain; charset=utf-8", b"Deleted")
+
+    # ============ HELPERS ============
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def _read_form(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+        return {key: values[0] for key, values in parse_qs(body).items()}
+
+    def _load_session(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        session_id = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        self.new_session_id = None
+        with self.state.lock:
+            if session_id not in self.state.sessions:
+                session_id = self.new_session_id = self.state.new_session()
+            self.session = self.state.sessions[session_id]
+
+    def _card(self, product):
+        return PRODUCT_CARD.format(**self._escaped(product))
+
+    @staticmethod
+    def _escaped(product):
+        return {key: html.escape(str(value)) for key, value in product.items()}
+
+    def _render(self, title, content):
+        user = self.state.users.get(self.session["user"]) if self.session["user"] else None
+        if user:
+            account_links = (
+                '<li><a href="/logout"> Logout</a></li>\n'
+                f'<li><a> Logged in as <b>{html.escape(user["name"])}</b></a></li>'
+            )
+        else:
+            account_links = '<li><a href="/login"> Signup / Login</a></li>'
+        page = LAYOUT.format(title=title, account_links=account_links, content=content)
+        self._send(200, "text/html; charset=utf-8", page.encode("utf-8"))
+
+    def _redirect(self, location):
+        self._send(302, "text/plain; charset=utf-8", b"", {"Location": location})
+
+    def _send(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.new_session_id:
+            self.send_header(
+                "Set-Cookie",
+                f"{SESSION_COOKIE}={self.new_session_id}; Path=/; HttpOnly; SameSite=Lax",
+            )
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalSite:
+    """
+    WHY THIS EXISTS:
+    - Tests don't pay internet round-trips
+    - No flakiness inherited from the real site
+    - Repeatable timings for benchmarks
+
+    USAGE:
+    with LocalSite() as site:
+        page.goto(site.url)
+
+    PORTS: port=0 picks a free port (handy in unit tests). The pytest
+    fixture uses a fixed one per xdist worker (--local-port), so the
+    base URL - and what is cached for it - is the same every run
+
+    SESSIONS: Kept in memory, so they end with the server; started_at
+    tells callers which saved login state predates this server
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, users=None):
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.state = _SiteState(users or DEFAULT_USERS)
+        self._thread = None
+        self.started_at = None
+
+    @property
+    def url(self):
+        """Base URL of the running server (no trailing slash)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve requests on a background thread"""
+        self.started_at = time.time()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-site", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down and release the port"""
+        if self._thread:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self):
+        """Serve requests on the current thread (standalone mode)"""
+        self.started_at = time.time()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the local automationexercise.com stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    site = LocalSite(args.host, args.port)
+    print(f"🏠 Local site running at {site.url} (Ctrl+C to stop)")
+    try:
+        site.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Concurrent Locale Fan-out
+Runs one async scenario in every locale at once: 1 browser, N contexts, 1 event loop
+
+USAGE:
+async def scenario(page, locale_config):
+    home_page = AsyncHomePage(page)
+    await home_page.navigate_to_home()
+    return await home_page.is_home_page_loaded()
+
+results = fan_out_locales(scenario)
+raise_for_failures(results)
+"""
+import asyncio
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from playwright.async_api import async_playwright
+
+from config.locales import get_all_locales, get_context_args, get_locale_config
+
+LocaleResult = namedtuple("LocaleResult", "locale passed value error seconds")
+
+
+async def run_across_locales(
+    scenario,
+    locales=None,
+    browser_name="chromium",
+    launch_args=None,
+    context_args=None,
+    concurrency=None,
+):
+    """
+    Run scenario(page, locale_config) for every locale concurrently
+
+    PARAMETERS:
+    - locales: Locale codes (default: get_all_locales())
+    - launch_args: Passed to browser_type.launch (headless, slow_mo...)
+    - context_args: Shared context args; locale/timezone added per locale
+    - concurrency: Max contexts open at once (default: all)
+
+    RETURNS: {locale: LocaleResult}, one entry per locale, even on failure
+    """
+    locales = list(locales or get_all_locales())
+    semaphore = asyncio.Semaphore(concurrency or len(locales))
+
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch(**(launch_args or {}))
+
+        async def run_one(locale):
+            async with semaphore:
+                start = time.perf_counter()
+                context = await browser.new_context(
+                    **{**(context_args or {}), **get_context_args(locale)}
+                )
+                try:
+                    page = await context.new_page()
+                    value = await scenario(page, get_locale_config(locale))
+                    return LocaleResult(locale, True, value, None, time.perf_counter() - start)
+                except Exception as error:
+                    return LocaleResult(locale, False, None, error, time.perf_counter() - start)
+                finally:
+                    await context.close()
+
+        try:
+            results = await asyncio.gather(*(run_one(locale) for locale in locales))
+        finally:
+            await browser.close()
+
+    return {result.locale: result for result in results}
+
+
+def fan_out_locales(scenario, **kwargs):
+    """
+    Blocking wrapper around run_across_locales
+
+    NOTE: Runs the event loop on its own thread, so it also works
+    inside pytest sessions that already use the sync Playwright API
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_across_locales(scenario, **kwargs)).result()
+
+
+def raise_for_failures(results):
+    """Fail once, listing every locale that failed"""
+    failures = [result for result in results.values() if not result.passed]
+    if failures:
+        raise AssertionError(
+            f"{len(failures)}/{len(results)} locale(s) failed:\n"
+            + "\n".join(f"  - {result.locale}: {result.error!r}" for result in failures)
+        )
@@ -0,0 +1,164 @@
+"""
+Network Record/Replay
+Captures page-object traffic into HAR archives and serves it back from disk
+
+MODES (pytest --network=...):
+- live: real network, nothing recorded (default)
+- record: every request from the first BasePage.navigate on a page
+  to the end of the test is saved to hars/<test id>/page-<n>.har
+- replay: requests are answered from those archives; anything that
+  was never recorded fails the test with UnrecordedRequestError
+
+ORIGINS: Each archive notes the base URL it was recorded against
+(page-<n>.origin). Replay against another origin - another xdist
+worker's stand-in port, a new --local-port - rewrites the archive's
+URLs to the current base URL first, since HAR entries match by URL.
+"""
+import re
+import tempfile
+import weakref
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from config.settings import get_base_url
+
+LIVE = "live"
+RECORD = "record"
+REPLAY = "replay"
+NETWORK_MODES = (LIVE, RECORD, REPLAY)
+
+_active_router = None
+
+def get_active_router():
+    """Router BasePage.navigate should use, or None in live mode"""
+    return _active_router
+
+def set_active_router(router):
+    """Called by the har_router fixture (conftest.py)"""
+    global _active_router
+    _active_router = router
+
+
+class UnrecordedRequestError(Exception):
+    """Replay hit a request that is not in any recorded archive"""
+
+
+def rewrite_origin(har_text, recorded_origin, current_origin):
+    """
+    Point a HAR archive's URLs at another origin
+
+    Replaces the host:port everywhere (request URLs, redirects,
+    Host/Origin/Referer headers), and the scheme where it is part
+    of a URL
+
+    EXAMPLE: rewrite_origin(text, "http://127.0.0.1:51234", "http://127.0.0.1:40111")
+    """
+    recorded, current = urlsplit(recorded_origin), urlsplit(current_origin)
+    if (recorded.scheme, recorded.netloc) == (current.scheme, current.netloc):
+        return har_text
+    har_text = har_text.replace(f"{recorded.scheme}://{recorded.netloc}", f"{current.scheme}://{current.netloc}")
+    return har_text.replace(recorded.netloc, current.netloc)
+
+
+class HarRouter:
+    """
+    WHY THIS EXISTS:
+    - Replay removes network variance from test timings
+    - Stale archives are caught instead of silently hitting the network
+
+    HOW:
+    - One archive per page, per test: page objects sharing a page
+      share its archive. Playwright records a HAR until the context
+      closes and cannot stop earlier, so per-class archives would
+      each hold all later traffic and overlap
+    - Pages are numbered in the order the test first navigates them
+      (page-1, page-2...), the same order on record and replay
+    - Replay tries the page's archive first (not_found="fallback"),
+      then a catch-all that records the miss
+    """
+
+    def __init__(self, mode, har_dir):
+        self.mode = mode
+        self.har_dir = Path(har_dir)
+        self.test_id = "session"
+        self.misses = []
+        self._installed = weakref.WeakKeyDictionary()  # page -> archive path
+        self._pages = 0  # Pages routed in the current test
+        self._rewritten = None  # Temporary folder for archives replayed on another origin
+
+    def start_test(self, test_id):
+        """Archives are stored per test, so each test records its own traffic"""
+        self.test_id = test_id
+        self.misses = []
+        self._pages = 0
+
+    def archive_path(self, name):
+        """EXAMPLE: hars/tests_test_cart.py_test_remove_from_cart_chromium_/page-1.har"""
+        folder = re.sub(r"[^\w.-]+", "_", self.test_id)
+        return self.har_dir / folder / f"{name}.har"
+
+    def install(self, page):
+        """
+        Route a page through its archive for the rest of the test
+
+        Safe to call on every navigate: each page is only
+        installed once
+        """
+        if page in self._installed:
+            return
+        self._pages += 1
+        name = f"page-{self._pages}"
+        path = self.archive_path(name)
+        if self.mode == RECORD:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            page.route_from_har(path, update=True, update_content="embed")
+            path.with_suffix(".origin").write_text(get_base_url() + "\n", encoding="utf-8")
+            print(f"📼 Recording {name} traffic to: {path}")
+        else:
+            if not path.exists():
+                raise UnrecordedRequestError(
+                    f"No HAR archive for {name} in {self.test_id}: {path}\n"
+                    "Re-record with: pytest --network=record"
+                )
+            page.route("**/*", self._unrecorded)
+            page.route_from_har(self._replayable(path), not_found="fallback")
+        self._installed[page] = path
+
+    def _replayable(self, path):
+        """The archive itself, or a copy rewritten to the current base URL"""
+        origin_file = path.with_suffix(".origin")
+        if not origin_file.exists():
+            return path
+        recorded = origin_file.read_text(encoding="utf-8").strip()
+        if recorded == get_base_url():
+            return path
+        rewritten = rewrite_origin(path.read_text(encoding="utf-8"), recorded, get_base_url())
+        if self._rewritten is None:
+            self._rewritten = tempfile.TemporaryDirectory(prefix="har-replay-")
+        copy = Path(self._rewritten.name) / path.parent.name / path.name
+        copy.parent.mkdir(parents=True, exist_ok=True)
+        copy.write_text(rewritten, encoding="utf-8")
+        return copy
+
+    def close(self):
+        """Remove rewritten archive copies"""
+        if self._rewritten is not None:
+            self._rewritten.cleanup()
+            self._rewritten = None
+
+    def _unrecorded(self, route):
+        """Last route in the chain: nothing recorded this request"""
+        request = route.request
+        self.misses.append(f"{request.method} {request.url}")
+        route.abort("blockedbyclient")
+
+    def raise_for_misses(self):
+        """Fail with every request replay could not serve"""
+        if not self.misses:
+            return
+        misses, self.misses = self.misses, []
+        raise UnrecordedRequestError(
+            f"{len(misses)} request(s) not found in HAR archives for {self.test_id}:\n"
+            + "\n".join(f"  - {miss}" for miss in misses)
+            + "\nRe-record with: pytest --network=record"
+        )
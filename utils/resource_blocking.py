@@ -0,0 +1,81 @@
+"""
+Resource Blocking
+Aborts requests a page object declared it doesn't need (ads, trackers, fonts, images)
+
+DECLARED ON PAGE OBJECTS:
+class ProductsPage(BasePage):
+    BLOCKED_RESOURCE_TYPES = ("media", "image", "font")
+    BLOCKED_HOSTS = BasePage.BLOCKED_HOSTS
+
+TURN OFF: pytest --resource-blocking=off
+"""
+import weakref
+from urllib.parse import urlsplit
+
+AD_HOSTS = (
+    "googlesyndication.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "adservice.google.com",
+    "fundingchoicesmessages.google.com",
+    "amazon-adsystem.com",
+)
+
+ANALYTICS_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "facebook.net",
+    "hotjar.com",
+)
+
+_enabled = True
+# page -> (resource types, hosts) of the page object that navigated last
+_profiles = weakref.WeakKeyDictionary()
+
+def set_enabled(enabled):
+    """Called from conftest.py for --resource-blocking"""
+    global _enabled
+    _enabled = enabled
+
+def is_blocked(resource_type, url, resource_types, hosts):
+    """True if a request matches a blocking profile"""
+    if resource_type in resource_types:
+        return True
+    host = urlsplit(url).hostname or ""
+    return any(host == blocked or host.endswith(f".{blocked}") for blocked in hosts)
+
+def apply_profile(page, resource_types, hosts):
+    """
+    Block what the current page object doesn't need
+
+    One route per page: later page objects swap the profile
+    instead of stacking more handlers on top
+    """
+    if not _enabled:
+        return
+    if page not in _profiles:
+        def handle(route):
+            request = route.request
+            if is_blocked(request.resource_type, request.url, *_profiles[page]):
+                route.abort("blockedbyclient")
+            else:
+                route.fallback()
+
+        page.route("**/*", handle)
+    _profiles[page] = (frozenset(resource_types), tuple(hosts))
+
+async def apply_profile_async(page, resource_types, hosts):
+    """apply_profile for playwright.async_api pages"""
+    if not _enabled:
+        return
+    if page not in _profiles:
+        async def handle(route):
+            request = route.request
+            if is_blocked(request.resource_type, request.url, *_profiles[page]):
+                await route.abort("blockedbyclient")
+            else:
+                await route.fallback()
+
+        await page.route("**/*", handle)
+    _profiles[page] = (frozenset(resource_types), tuple(hosts))
@@ -0,0 +1,17 @@
+"""
+Stats
+Small statistics helpers shared by plugins/action_timing.py (per-action spans)
+and utils/load_runner.py (per-step latencies)
+"""
+import math
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a non-empty list
+
+    EXAMPLE: percentile(list(range(1, 101)), 95) -> 95
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
@@ -0,0 +1,283 @@
+"""
+Visual Snapshots
+Screenshot baselines with vectorized (NumPy) pixel and perceptual diffing
+
+WHY THIS EXISTS:
+- Layout regressions (a mirrored RTL header, a collapsed product grid)
+  pass every locator check
+- Diffing must keep up with full-HD screenshots at hundreds per minute
+
+USAGE (see the visual_snapshot fixture in tests/conftest.py):
+def test_home_looks_right(page, visual_snapshot):
+    HomePage(page).navigate_to_home()
+    visual_snapshot(page, "home", mask=[page.locator(".ad")])
+
+HOW:
+- Identical PNG bytes -> identical image: compared by hash, no decoding
+- Otherwise both PNGs are decoded once to uint8 arrays and compared
+  in a few whole-array operations (no per-pixel Python loop)
+- mode="pixel": a pixel differs when any channel differs by more
+  than `threshold` (0-255)
+- mode="perceptual": YIQ colour distance (as in pixelmatch), so
+  anti-aliasing noise and invisible shifts in hue count less
+- Masks (x, y, width, height) are ignored; tolerance = share of the
+  remaining pixels allowed to differ
+
+BASELINES (content-addressed):
+tests/snapshots/
+    refs/home-local-chromium-linux   "3fa4..." (hash of the baseline)
+    objects/3f/3fa4....png           one file per distinct image
+Ten snapshots that look the same are stored once; one small ref
+file per name, so xdist workers never rewrite a shared index.
+
+NEEDS: pip install numpy pillow (imported on first use)
+"""
+import hashlib
+import io
+import os
+from pathlib import Path
+
+# pixelmatch's YIQ weights; max squared distance between two colours
+YIQ_WEIGHTS = (0.5053, 0.299, 0.1957)
+MAX_YIQ_DELTA = 35215.0
+
+DIFF_COLOUR = (255, 0, 80)
+
+
+def _imaging():
+    try:
+        import numpy
+        from PIL import Image
+    except ImportError as error:
+        raise ImportError(
+            "Visual snapshots need numpy and Pillow: pip install numpy pillow"
+        ) from error
+    return numpy, Image
+
+
+def content_hash(png_bytes):
+    """Address of an image in the baseline store"""
+    return hashlib.sha256(png_bytes).hexdigest()
+
+
+def decode(png_bytes):
+    """
+    PNG -> (height, width, 4) uint8 RGBA array
+
+    4 channels, so a pixel is one uint32 and "which pixels changed"
+    is a single 32-bit comparison instead of three
+    """
+    np, Image = _imaging()
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        return np.ascontiguousarray(image.convert("RGBA"))
+
+
+def encode(pixels):
+    """(height, width, 3 or 4) uint8 array -> PNG bytes"""
+    _, Image = _imaging()
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+class DiffResult:
+    """Outcome of comparing two images"""
+
+    __slots__ = ("different", "total", "size_mismatch", "diff_mask")
+
+    def __init__(self, different, total, size_mismatch=False, diff_mask=None):
+        self.different = different          # Differing pixels outside the masks
+        self.total = total                  # Pixels compared
+        self.size_mismatch = size_mismatch  # Images of different sizes never match
+        self.diff_mask = diff_mask          # (height, width) bool array, or None
+
+    @property
+    def ratio(self):
+        return self.different / self.total if self.total else 0.0
+
+    def matches(self, tolerance):
+        return not self.size_mismatch and self.ratio <= tolerance
+
+    def __repr__(self):
+        if self.size_mismatch:
+            return "DiffResult(size mismatch)"
+        return f"DiffResult({self.different}/{self.total} pixels differ, {self.ratio:.4%})"
+
+
+def _yiq(r, g, b):
+    """RGB planes -> Y, I, Q planes"""
+    y = 0.29889531 * r + 0.58662247 * g + 0.11448223 * b
+    i = 0.59597799 * r - 0.27417610 * g - 0.32180189 * b
+    q = 0.21147017 * r - 0.52261711 * g + 0.31114694 * b
+    return y, i, q
+
+
+def diff_pixels(actual, expected, mode="perceptual", threshold=0.1, masks=()):
+    """
+    Compare two decoded images
+
+    PARAMETERS:
+    - actual, expected: (height, width, 3 or 4) uint8 arrays (see decode);
+      alpha is ignored
+    - mode: "perceptual" (threshold 0-1, YIQ distance) or
+      "pixel" (threshold 0-255, largest channel difference)
+    - masks: [(x, y, width, height)] regions to ignore
+
+    RETURNS: DiffResult
+    """
+    np, _ = _imaging()
+    if actual.shape != expected.shape:
+        return DiffResult(0, 0, size_mismatch=True)
+
+    # YIQ is linear, so the YIQ distance is computed on the RGB difference,
+    # and only for pixels that changed at all (usually a small share)
+    if actual.shape[2] == 4 and actual.flags.c_contiguous and expected.flags.c_contiguous:
+        changed = actual.view(np.uint32)[..., 0] != expected.view(np.uint32)[..., 0]
+    else:
+        changed = (actual != expected).any(axis=2)
+    # int16 so differences don't wrap around
+    delta_rgb = actual[changed][:, :3].astype(np.int16) - expected[changed][:, :3]
+    different = np.zeros(changed.shape, dtype=bool)
+    if mode == "pixel":
+        different[changed] = np.abs(delta_rgb).max(axis=1) > threshold
+    elif mode == "perceptual":
+        r, g, b = delta_rgb.astype(np.float32).T
+        y, i, q = _yiq(r, g, b)
+        wy, wi, wq = YIQ_WEIGHTS
+        different[changed] = wy * y * y + wi * i * i + wq * q * q > MAX_YIQ_DELTA * threshold * threshold
+    else:
+        raise ValueError(f"mode must be 'pixel' or 'perceptual', got {mode!r}")
+
+    compared = np.ones(different.shape, dtype=bool)
+    height, width = different.shape
+    for x, y, w, h in masks:
+        x0, y0 = max(int(x), 0), max(int(y), 0)
+        x1, y1 = min(int(x + w), width), min(int(y + h), height)
+        if x1 > x0 and y1 > y0:
+            compared[y0:y1, x0:x1] = False
+    different &= compared
+    return DiffResult(int(different.sum()), int(compared.sum()), diff_mask=different)
+
+
+def compare_png(actual_png, expected_png, **options):
+    """diff_pixels for PNG bytes; identical bytes skip decoding entirely"""
+    if content_hash(actual_png) == content_hash(expected_png):
+        return DiffResult(0, 1)
+    return diff_pixels(decode(actual_png), decode(expected_png), **options)
+
+
+def render_diff(actual_png, diff_mask):
+    """PNG of the actual image, faded, with differing pixels highlighted"""
+    np, _ = _imaging()
+    pixels = decode(actual_png)
+    faded = (pixels // 3 + 170).astype(np.uint8)
+    faded[diff_mask] = DIFF_COLOUR + (255,)
+    return encode(faded)
+
+
+class BaselineStore:
+    """
+    Content-addressed baseline images
+
+    USAGE:
+    store = BaselineStore("tests/snapshots")
+    store.put("home-chromium-linux", png_bytes)
+    store.get("home-chromium-linux")      # png bytes, or None
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def _ref_path(self, name):
+        return self.root / "refs" / name
+
+    def _object_path(self, digest):
+        return self.root / "objects" / digest[:2] / f"{digest}.png"
+
+    def digest(self, name):
+        """Hash of a baseline, or None"""
+        ref = self._ref_path(name)
+        return ref.read_text(encoding="utf-8").strip() if ref.exists() else None
+
+    def get(self, name):
+        digest = self.digest(name)
+        if digest is None:
+            return None
+        path = self._object_path(digest)
+        return path.read_bytes() if path.exists() else None
+
+    def put(self, name, png_bytes):
+        """Store (or re-point) a baseline; returns its hash"""
+        digest = content_hash(png_bytes)
+        path = self._object_path(digest)
+        if not path.exists():  # Same image already stored: nothing to write
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_bytes(png_bytes)
+            os.replace(temporary, path)
+        ref = self._ref_path(name)
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        ref.write_text(digest + "\n", encoding="utf-8")
+        return digest
+
+    def prune(self):
+        """Delete objects no baseline points to; returns how many"""
+        used = {ref.read_text(encoding="utf-8").strip() for ref in (self.root / "refs").glob("*")}
+        removed = 0
+        for path in (self.root / "objects").glob("*/*.png"):
+            if path.stem not in used:
+                path.unlink()
+                removed += 1
+        return removed
+
+
+class SnapshotMismatch(AssertionError):
+    """A screenshot differs from its baseline (or has none yet)"""
+
+
+def mask_regions(masks):
+    """Locators (anything with bounding_box()) or (x, y, w, h) tuples -> tuples"""
+    regions = []
+    for mask in masks:
+        if hasattr(mask, "bounding_box"):
+            box = mask.bounding_box()
+            if box:  # Hidden elements have no box and need no mask
+                regions.append((box["x"], box["y"], box["width"], box["height"]))
+        else:
+            regions.append(tuple(mask))
+    return regions
+
+
+def assert_snapshot(store, name, png_bytes, output_dir, update=False,
+                    tolerance=0.001, mode="perceptual", threshold=0.1, masks=()):
+    """
+    Compare a screenshot with its baseline
+
+    - No baseline (or update=True): the screenshot becomes the baseline;
+      a missing one also fails the test, so new baselines get reviewed
+    - Too different: <name>-actual.png and <name>-diff.png are written
+      to output_dir and SnapshotMismatch is raised
+
+    RETURNS: DiffResult
+    """
+    expected = store.get(name)
+    if expected is None or update:
+        store.put(name, png_bytes)
+        if expected is None and not update:
+            raise SnapshotMismatch(f"No baseline for {name!r}; saved this screenshot as the baseline")
+        return DiffResult(0, 1)
+
+    result = compare_png(png_bytes, expected, mode=mode, threshold=threshold, masks=masks)
+    if result.matches(tolerance):
+        return result
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / f"{name}-actual.png").write_bytes(png_bytes)
+    (output_dir / f"{name}-expected.png").write_bytes(expected)
+    if result.size_mismatch:
+        raise SnapshotMismatch(f"{name}: screenshot size differs from the baseline (see {output_dir})")
+    (output_dir / f"{name}-diff.png").write_bytes(render_diff(png_bytes, result.diff_mask))
+    raise SnapshotMismatch(
+        f"{name}: {result.ratio:.3%} of pixels differ (tolerance {tolerance:.3%}); see {output_dir}"
+    )